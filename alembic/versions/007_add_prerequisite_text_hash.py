@@ -0,0 +1,28 @@
+"""Add prerequisite text hash to bulletin courses.
+
+Revision ID: 007_prereq_hash
+Revises: 006_seat_alerts
+Create Date: 2026-10-18
+
+Stores a hash of each course's combined prerequisite/corequisite/equivalent
+text (plus parser version) so prerequisite extraction can skip courses whose
+text has not changed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '007_prereq_hash'
+down_revision: Union[str, None] = '006_seat_alerts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bulletin_courses', sa.Column('prerequisites_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('bulletin_courses', 'prerequisites_hash')
@@ -0,0 +1,46 @@
+"""Add source states table.
+
+Revision ID: 008_source_states
+Revises: 007_prereq_hash
+Create Date: 2026-10-18
+
+Stores the ETag, Last-Modified and content hash last seen for each polled
+registrar file so downloads can be made conditional.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '008_source_states'
+down_revision: Union[str, None] = '007_prereq_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'source_states',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('url', sa.String(500), nullable=False),
+        sa.Column('name', sa.String(100), nullable=True),
+
+        # Validators from the last 200 response
+        sa.Column('etag', sa.String(200), nullable=True),
+        sa.Column('last_modified', sa.String(100), nullable=True),
+        sa.Column('content_hash', sa.String(64), nullable=True),
+        sa.Column('content_length', sa.Integer(), nullable=True),
+
+        # Tracking
+        sa.Column('last_checked', sa.DateTime(), nullable=True),
+        sa.Column('last_changed', sa.DateTime(), nullable=True),
+        sa.Column('check_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('change_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_source_states_url', 'source_states', ['url'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_source_states_url', table_name='source_states')
+    op.drop_table('source_states')
@@ -0,0 +1,31 @@
+"""Add adaptive polling state to source states.
+
+Revision ID: 009_adaptive_polling
+Revises: 008_source_states
+Create Date: 2026-10-18
+
+Stores the smoothed change rate, current polling interval and next due
+time per polled source for the adaptive seat refresh scheduler.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '009_adaptive_polling'
+down_revision: Union[str, None] = '008_source_states'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('source_states', sa.Column('change_rate', sa.Float(), nullable=True))
+    op.add_column('source_states', sa.Column('poll_interval', sa.Integer(), nullable=True))
+    op.add_column('source_states', sa.Column('next_poll_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('source_states', 'next_poll_at')
+    op.drop_column('source_states', 'poll_interval')
+    op.drop_column('source_states', 'change_rate')
@@ -0,0 +1,91 @@
+"""Add normalized meeting time columns to sections.
+
+Revision ID: 010_section_minutes
+Revises: 009_adaptive_polling
+Create Date: 2026-10-18
+
+Adds start/end minutes since midnight and a day bitmask to sections so
+time-window filters and overlap checks are integer comparisons, backfills
+them from the existing text columns, and indexes them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.models.meeting_time import day_mask, meeting_minutes
+
+
+revision: str = '010_section_minutes'
+down_revision: Union[str, None] = '009_adaptive_polling'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.add_column('sections', sa.Column('start_minutes', sa.Integer(), nullable=True))
+    op.add_column('sections', sa.Column('end_minutes', sa.Integer(), nullable=True))
+    op.add_column(
+        'sections', sa.Column('day_mask', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # Backfill from the text columns. Rows are grouped by their distinct
+    # (days, start, end) values, which are far fewer than sections.
+    bind = op.get_bind()
+    sections = sa.table(
+        'sections',
+        sa.column('days', sa.String),
+        sa.column('start_time', sa.String),
+        sa.column('end_time', sa.String),
+        sa.column('start_minutes', sa.Integer),
+        sa.column('end_minutes', sa.Integer),
+        sa.column('day_mask', sa.Integer),
+    )
+    patterns = bind.execute(
+        sa.select(sections.c.days, sections.c.start_time, sections.c.end_time).distinct()
+    ).all()
+
+    update = (
+        sections.update()
+        .where(
+            sections.c.days.is_not_distinct_from(sa.bindparam('b_days')),
+            sections.c.start_time.is_not_distinct_from(sa.bindparam('b_start')),
+            sections.c.end_time.is_not_distinct_from(sa.bindparam('b_end')),
+        )
+        .values(
+            start_minutes=sa.bindparam('b_start_minutes'),
+            end_minutes=sa.bindparam('b_end_minutes'),
+            day_mask=sa.bindparam('b_day_mask'),
+        )
+    )
+    params = []
+    for days, start_time, end_time in patterns:
+        start, end = meeting_minutes(start_time, end_time)
+        mask = day_mask(days)
+        if start is None and not mask:
+            continue
+        params.append({
+            'b_days': days,
+            'b_start': start_time,
+            'b_end': end_time,
+            'b_start_minutes': start,
+            'b_end_minutes': end,
+            'b_day_mask': mask,
+        })
+    for i in range(0, len(params), BATCH_SIZE):
+        bind.execute(update, params[i:i + BATCH_SIZE])
+
+    op.create_index('ix_sections_times', 'sections', ['start_minutes', 'end_minutes'])
+    op.create_index(
+        'ix_sections_days_times', 'sections', ['day_mask', 'start_minutes', 'end_minutes']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sections_days_times', table_name='sections')
+    op.drop_index('ix_sections_times', table_name='sections')
+    op.drop_column('sections', 'day_mask')
+    op.drop_column('sections', 'end_minutes')
+    op.drop_column('sections', 'start_minutes')
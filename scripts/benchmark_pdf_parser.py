@@ -0,0 +1,122 @@
+"""Micro-benchmark for UGAPDFParser line classification.
+
+Extracts page text from the bundled schedule PDFs once, then times only
+the line classification/parsing step and reports lines per second.
+
+Usage:
+    python scripts/benchmark_pdf_parser.py
+    python scripts/benchmark_pdf_parser.py --save-baseline bench_baseline.json
+    python scripts/benchmark_pdf_parser.py --baseline bench_baseline.json --tolerance 0.2
+
+Files that pdfplumber cannot open are logged and skipped. With --baseline,
+exits non-zero if any PDF is slower than its baseline by more than the
+tolerance.
+"""
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import pdfplumber
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parsers.uga_pdf_parser import UGAPDFParser
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def extract_pages(pdf_path: Path, max_pages: int | None = None) -> list[list[str]]:
+    """Extract the text lines of each page (not timed)."""
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[:max_pages]:
+            text = page.extract_text() or ""
+            pages.append(text.split('\n'))
+    return pages
+
+
+def time_classification(pages: list[list[str]], repeat: int) -> float:
+    """Best-of-N wall time to classify every page."""
+    parser = UGAPDFParser()
+    best = float("inf")
+    for _ in range(repeat):
+        parser.warnings = []
+        start = time.perf_counter()
+        for page_num, lines in enumerate(pages, 1):
+            parser._classify_page_lines(lines, page_num)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(pdf_paths: list[Path], repeat: int, max_pages: int | None) -> dict[str, float]:
+    """Benchmark each PDF and return lines/second by file name."""
+    results = {}
+    for pdf_path in pdf_paths:
+        logger.info(f"Extracting text from {pdf_path.name}...")
+        try:
+            pages = extract_pages(pdf_path, max_pages)
+        except Exception as e:
+            # e.g. an HTML error page saved with a .pdf name
+            logger.warning(f"Skipping {pdf_path.name}: not a readable PDF ({e})")
+            continue
+        line_count = sum(len(lines) for lines in pages)
+
+        elapsed = time_classification(pages, repeat)
+        rate = line_count / elapsed if elapsed else float("inf")
+        results[pdf_path.name] = rate
+
+        print(
+            f"{pdf_path.name}: {len(pages)} pages, {line_count} lines, "
+            f"{elapsed * 1000:.1f} ms, {rate:,.0f} lines/sec"
+        )
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark UGA PDF line classification')
+    parser.add_argument('pdfs', nargs='*', help='PDF files (default: data/*.pdf)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs per PDF (best is kept)')
+    parser.add_argument('--max-pages', type=int, help='Only benchmark the first N pages')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='Write results as a baseline JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed slowdown vs baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    pdf_paths = [Path(p) for p in args.pdfs] or sorted(DATA_DIR.glob("*.pdf"))
+    if not pdf_paths:
+        print(f"No PDFs found in {DATA_DIR}")
+        sys.exit(1)
+
+    results = run(pdf_paths, args.repeat, args.max_pages)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = []
+        for name, rate in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            change = rate / expected - 1
+            print(f"{name}: {change:+.1%} vs baseline ({expected:,.0f} lines/sec)")
+            if change < -args.tolerance:
+                regressions.append(name)
+
+        if regressions:
+            print(f"Regression beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
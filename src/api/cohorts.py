@@ -22,9 +22,11 @@ from src.api.schemas import (
     CohortUpdateRequest,
     CohortJoinRequest,
     CohortMemberResponse,
+    CohortScheduleOverlap,
+    CohortScheduleOverlapResponse,
 )
 from src.models.database import (
-    User, Cohort, CohortMember,
+    User, Cohort, CohortMember, PlannedSection,
     get_session_factory,
 )
 
@@ -282,6 +284,97 @@ async def get_cohort_members(
         return result
 
 
+@router.get("/{cohort_id}/schedule-overlap", response_model=CohortScheduleOverlapResponse)
+async def get_cohort_schedule_overlap(
+    cohort_id: int,
+    semester: Optional[str] = Query(
+        None, description="Semester of the plans (e.g., Spring 2026; defaults to the current term)"
+    ),
+    user: User = Depends(get_current_user),
+):
+    """
+    Find which members are in class at the same time. Must be a member.
+
+    Compares planned sections of members who share their current schedule
+    (plus your own) for one semester, most time together first.
+    """
+    from src.models.meeting_time import day_mask, meeting_minutes
+    from src.models.schedule_conflicts import ConflictIndex
+    from src.services.course_service import create_service
+
+    require_verified(user)
+
+    if not semester:
+        # Plans for different semesters never meet, so compare one only
+        schedule = create_service().get_current_schedule()
+        if not schedule:
+            raise HTTPException(status_code=422, detail="semester is required: no current term")
+        semester = schedule.term
+
+    session_factory = get_session_factory()
+
+    with session_factory() as session:
+        cohort = session.get(Cohort, cohort_id)
+        if not cohort:
+            raise HTTPException(status_code=404, detail="Cohort not found")
+
+        membership = session.execute(
+            select(CohortMember).where(
+                CohortMember.cohort_id == cohort_id,
+                CohortMember.user_id == user.id
+            )
+        ).scalar_one_or_none()
+
+        if not membership:
+            raise HTTPException(status_code=403, detail="You must be a member to compare schedules")
+
+        usernames = {
+            member.user_id: member.user.username
+            for member in cohort.members
+            if member.user and (
+                member.user_id == user.id
+                or member.user.get_visibility_settings().get("show_current_schedule")
+            )
+        }
+
+        planned = session.execute(
+            select(PlannedSection).where(
+                PlannedSection.user_id.in_(usernames),
+                PlannedSection.semester == semester,
+            )
+        ).scalars().all()
+
+    # One shared index of every planned section, keyed by CRN
+    index = ConflictIndex()
+    schedules: dict[int, set[str]] = {}
+    for section in planned:
+        if section.crn not in index:
+            start, end = meeting_minutes(section.start_time, section.end_time)
+            if start is not None:
+                index.add_meeting(section.crn, day_mask(section.days), start, end, section.building)
+        schedules.setdefault(section.user_id, set()).add(section.crn)
+
+    overlaps = [
+        CohortScheduleOverlap(
+            user_id=a,
+            username=usernames.get(a),
+            other_user_id=b,
+            other_username=usernames.get(b),
+            minutes_per_week=minutes,
+            shared_crns=sorted(schedules[a] & schedules[b]),
+        )
+        for (a, b), minutes in index.overlaps_between(schedules).items()
+    ]
+    overlaps.sort(key=lambda o: -o.minutes_per_week)
+
+    return CohortScheduleOverlapResponse(
+        cohort_id=cohort_id,
+        semester=semester,
+        members_compared=len(schedules),
+        overlaps=overlaps,
+    )
+
+
 @router.put("/{cohort_id}", response_model=CohortResponse)
 async def update_cohort(
     cohort_id: int,
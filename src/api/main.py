@@ -24,6 +24,8 @@ from src.api.schemas import (
     CourseResponse,
     CourseListResponse,
     SectionResponse,
+    SectionSearchResponse,
+    SectionSearchResult,
     InstructorResponse,
     ScheduleResponse,
     StatsResponse,
@@ -33,8 +35,12 @@ from src.api.schemas import (
     PossibilitiesResponse,
     CoursePossibilityResponse,
     PossibilitySectionResponse,
+    PrerequisiteChainResponse,
+    PollStatusResponse,
+    PollTermStatus,
 )
 from src.services.course_service import CourseService, create_service
+from src.models.meeting_time import day_mask, parse_clock
 from src.models.database import Course, Section, Schedule, Instructor
 from src.api.users import router as users_router
 from src.api.instructors import router as instructors_router
@@ -46,6 +52,8 @@ from src.api.study_groups import router as study_groups_router
 from src.api.cohorts import router as cohorts_router
 from src.api.social import router as social_router
 from src.api.alerts import router as alerts_router
+from src.api.schedule_builder import router as schedule_builder_router
+from src.api.rooms import router as rooms_router
 from src.api.rate_limit import limiter, rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
@@ -117,6 +125,8 @@ app.include_router(study_groups_router)
 app.include_router(cohorts_router)
 app.include_router(social_router)
 app.include_router(alerts_router)
+app.include_router(schedule_builder_router)
+app.include_router(rooms_router)
 
 
 # =============================================================================
@@ -181,6 +191,31 @@ async def get_schedule_stats(service: CourseService = Depends(get_service)):
     return StatsResponse(**stats)
 
 
+@app.get("/schedules/polling", response_model=PollStatusResponse, tags=["Schedules"])
+async def get_polling_status(service: CourseService = Depends(get_service)):
+    """
+    Get the adaptive seat polling state for each active term.
+
+    Shows the observed change rates, the polling interval chosen from
+    them, and when each term is next due.
+    """
+    from src.scanners.schedule_scanner import UGAScheduleScanner
+    from src.services.poll_scheduler import SeatPollScheduler
+
+    scheduler = SeatPollScheduler(service.session_factory)
+    sources = {
+        term: UGAScheduleScanner.CSV_URLS[term]
+        for term in service.get_active_terms()
+        if term in UGAScheduleScanner.CSV_URLS
+    }
+    return PollStatusResponse(
+        min_interval_seconds=scheduler.min_interval,
+        max_interval_seconds=scheduler.max_interval,
+        history_hours=scheduler.history_hours,
+        terms=[PollTermStatus(**d.to_dict()) for d in scheduler.plan(sources)],
+    )
+
+
 @app.post("/schedules/import", response_model=ImportResponse, tags=["Schedules"])
 async def import_schedule(
     request: ImportRequest,
@@ -341,6 +376,41 @@ async def get_course(
     )
 
 
+@app.get(
+    "/courses/{course_code}/prerequisite-chain",
+    response_model=PrerequisiteChainResponse,
+    tags=["Courses"],
+)
+async def get_prerequisite_chain(
+    course_code: str,
+    max_depth: int = Query(10, ge=1, le=20, description="Maximum prerequisite depth"),
+    include_tree: bool = Query(False, description="Also return the nested tree rendering"),
+    service: CourseService = Depends(get_service),
+):
+    """
+    Get the full prerequisite chain for a course.
+
+    Returns each course once as a node and each prerequisite relationship
+    once as an edge; edges in the same group with logic "OR" are alternatives.
+    Corequisites and recommended courses are not included.
+    """
+    from src.services.course_linker import CourseLinker
+
+    code = course_code.upper().replace("-", " ")
+    if " " not in code:
+        import re
+        code = re.sub(r"([A-Z]+)(\d+)", r"\1 \2", code)
+
+    linker = CourseLinker(service.session_factory)
+    dag = linker.get_prerequisite_dag(code, max_depth=max_depth)
+
+    tree = None
+    if include_tree:
+        tree = linker.get_prerequisite_chain(code, max_depth=max_depth)
+
+    return PrerequisiteChainResponse(**dag, tree=tree)
+
+
 @app.get("/subjects", response_model=SubjectListResponse, tags=["Courses"])
 async def list_subjects(service: CourseService = Depends(get_service)):
     """Get list of all subject codes in the current schedule."""
@@ -352,6 +422,106 @@ async def list_subjects(service: CourseService = Depends(get_service)):
 # Section Endpoints
 # =============================================================================
 
+def _query_minutes(value: Optional[str], name: str) -> Optional[int]:
+    """Parse a time query parameter ("11:00 am", "14:30") to minutes."""
+    if not value:
+        return None
+    minutes = parse_clock(value)
+    if minutes is None:
+        raise HTTPException(status_code=422, detail=f"Invalid time for {name}: {value}")
+    return minutes
+
+
+@app.get("/sections/search", response_model=SectionSearchResponse, tags=["Sections"])
+async def search_sections(
+    subject: Optional[str] = Query(None, description="Filter by subject code (e.g., CSCI)"),
+    days: Optional[str] = Query(None, description="Meeting days (e.g., TR, MWF)"),
+    days_match: str = Query(
+        "within",
+        pattern="^(within|exact|includes)$",
+        description=(
+            "within: only on these days; exact: exactly these days; "
+            "includes: at least these days"
+        ),
+    ),
+    start_after: Optional[str] = Query(None, description="Earliest start time (e.g., 11:00 am)"),
+    start_before: Optional[str] = Query(None, description="Latest start time"),
+    end_before: Optional[str] = Query(None, description="Latest end time (e.g., 5:00 pm)"),
+    campus: Optional[str] = Query(None, description="Filter by campus (e.g., Athens)"),
+    building: Optional[str] = Query(None, description="Filter by building (partial match)"),
+    credit_hours_min: Optional[int] = Query(None, ge=0),
+    credit_hours_max: Optional[int] = Query(None, ge=0),
+    has_availability: bool = Query(False, description="Only sections with open seats"),
+    part_of_term: Optional[str] = Query(None, description="Filter by part of term"),
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    service: CourseService = Depends(get_service),
+):
+    """
+    Search sections in the current schedule by meeting pattern and time window.
+
+    Example: CSCI sections on TR starting after 11am with open seats:
+    /sections/search?subject=CSCI&days=TR&start_after=11:00%20am&has_availability=true
+    """
+    day_bits = day_mask(days)
+    if days and not day_bits:
+        raise HTTPException(status_code=422, detail=f"Invalid days: {days}")
+
+    # Fetch one extra row to know whether there is another page
+    sections = service.search_sections(
+        subject=subject,
+        days=day_bits,
+        days_match=days_match,
+        start_after=_query_minutes(start_after, "start_after"),
+        start_before=_query_minutes(start_before, "start_before"),
+        end_before=_query_minutes(end_before, "end_before"),
+        campus=campus,
+        building=building,
+        credit_hours_min=credit_hours_min,
+        credit_hours_max=credit_hours_max,
+        open_only=has_availability,
+        part_of_term=part_of_term,
+        limit=limit + 1,
+        offset=offset,
+    )
+    has_more = len(sections) > limit
+    sections = sections[:limit]
+
+    return SectionSearchResponse(
+        sections=[
+            SectionSearchResult(
+                id=s.id,
+                crn=s.crn,
+                section_code=s.section_code,
+                status=s.status,
+                credit_hours=s.credit_hours,
+                instructor=s.instructor,
+                part_of_term=s.part_of_term,
+                class_size=s.class_size,
+                seats_available=s.seats_available,
+                waitlist_count=s.waitlist_count,
+                is_available=s.is_available,
+                is_active=s.is_active,
+                days=s.days,
+                start_time=s.start_time,
+                end_time=s.end_time,
+                building=s.building,
+                room=s.room,
+                campus=s.campus,
+                course_code=s.course.course_code,
+                title=s.course.title,
+                start_minutes=s.start_minutes,
+                end_minutes=s.end_minutes,
+            )
+            for s in sections
+        ],
+        count=len(sections),
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+    )
+
+
 @app.get("/sections/{crn}", response_model=SectionResponse, tags=["Sections"])
 async def get_section(
     crn: str,
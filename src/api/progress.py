@@ -23,6 +23,8 @@ from src.api.schemas import (
     PlannedSectionCreate,
     PlannedSectionResponse,
     PlannedSectionsResponse,
+    WalkingSectionChoice,
+    WalkingOptimizationResponse,
     # Transcript
     TranscriptSummaryResponse,
     # Enrollments
@@ -43,13 +45,16 @@ from src.api.schemas import (
     WhatIfScenariosRequest,
     WhatIfScenariosResponse,
     WhatIfScenarioResult,
+    GraduationPathCompareRequest,
+    GraduationPathCompareResponse,
 )
 from src.api.auth import get_current_user
 from src.services.progress_service import ProgressService, create_progress_service
 from src.services.audit_service import AuditService, create_audit_service
 from src.services.rules_engine import SatisfactionStatus
 from src.services.graduation_optimizer import (
-    GraduationOptimizer, OptimizationMode, create_graduation_optimizer
+    GraduationOptimizer, GraduationPath, OptimizationMode, PlanVariant, SemesterPlan,
+    create_graduation_optimizer,
 )
 
 router = APIRouter(prefix="/progress", tags=["Progress"])
@@ -597,10 +602,167 @@ async def remove_planned_section(
         return {"status": "removed"}
 
 
+@router.post("/planned/optimize-walking", response_model=WalkingOptimizationResponse)
+async def optimize_planned_walking(
+    semester: Optional[str] = Query(
+        None, description="Semester of the plan (e.g., Spring 2026; defaults to the current term)"
+    ),
+    tight_penalty: float = Query(
+        30.0, ge=0, description="Penalty per transition shorter than the walk, in walking minutes"
+    ),
+    user: User = Depends(get_current_user),
+):
+    """
+    Suggest sections of the planned courses that minimize weekly walking.
+
+    Only one semester's plan is optimized, the current term's unless
+    semester is given. Every non-cancelled section of each planned course
+    in that semester's schedule is a candidate. Returns the suggested
+    sections along with walking minutes and tight transitions before and
+    after.
+    """
+    import asyncio
+    from src.models.campus_graph import StudentScheduleLocation
+    from src.services.campus_graph_store import get_campus_graph
+    from src.services.course_service import create_service
+    from src.services.schedule_builder import optimize_walking
+
+    service = create_service()
+    if semester:
+        schedule = await asyncio.to_thread(service.get_current_schedule, semester)
+    else:
+        # Sections from different semesters never share a week
+        schedule = await asyncio.to_thread(service.get_current_schedule)
+        if not schedule:
+            raise HTTPException(status_code=422, detail="semester is required: no current term")
+        semester = schedule.term
+
+    session_factory = get_session_factory()
+    with session_factory() as session:
+        planned = session.query(PlannedSection).filter(
+            PlannedSection.user_id == user.id,
+            PlannedSection.semester == semester,
+        ).all()
+
+        def location(row) -> StudentScheduleLocation:
+            return StudentScheduleLocation(
+                course_code=row.course_code,
+                crn=row.crn,
+                building=row.building or "",
+                room=row.room or "",
+                campus=getattr(row, "campus", None) or "Athens",
+                days=row.days or "",
+                start_time=row.start_time or "",
+                end_time=row.end_time or "",
+            )
+
+        current = [location(p) for p in planned]
+
+    if not current:
+        raise HTTPException(status_code=404, detail=f"No planned sections for {semester}")
+
+    planned_crns = {loc.course_code: loc.crn for loc in current}
+
+    def load_candidates() -> list[StudentScheduleLocation]:
+        candidates = []
+        for code in planned_crns:
+            # Without a schedule for the semester, the plan's own sections are the only choice
+            course = service.get_course_by_code(code, schedule_id=schedule.id) if schedule else None
+            sections = [s for s in course.sections if s.status != "X"] if course else []
+            if sections:
+                candidates.extend(location(s) for s in sections)
+            else:
+                candidates.extend(c for c in current if c.course_code == code)
+        return candidates
+
+    candidates = await asyncio.to_thread(load_candidates)
+    graph = get_campus_graph()
+    optimized = await asyncio.to_thread(optimize_walking, graph, candidates, tight_penalty)
+    if optimized is candidates:
+        # No time-compatible combination; keep the plan as it is
+        optimized = current
+
+    current_walk, current_tight = graph.weekly_walking(current)
+    optimized_walk, optimized_tight = graph.weekly_walking(optimized)
+
+    seen = set()
+    choices = []
+    for loc in optimized:
+        if loc.crn in seen:
+            continue
+        seen.add(loc.crn)
+        choices.append(WalkingSectionChoice(
+            crn=loc.crn,
+            course_code=loc.course_code,
+            days=loc.days or None,
+            start_time=loc.start_time or None,
+            end_time=loc.end_time or None,
+            building=loc.building or None,
+            room=loc.room or None,
+            planned_crn=planned_crns.get(loc.course_code),
+        ))
+
+    return WalkingOptimizationResponse(
+        semester=semester,
+        sections=choices,
+        changed=sum(1 for c in choices if c.planned_crn and c.crn != c.planned_crn),
+        current_walking_minutes=current_walk,
+        optimized_walking_minutes=optimized_walk,
+        current_tight_transitions=current_tight,
+        optimized_tight_transitions=optimized_tight,
+    )
+
+
 # =============================================================================
 # Graduation Path Optimizer Endpoints
 # =============================================================================
 
+def _semester_plan_response(plan: SemesterPlan) -> SemesterPlanResponse:
+    """Convert a SemesterPlan to its API response."""
+    return SemesterPlanResponse(
+        semester=plan.semester,
+        courses=[
+            CourseOptionResponse(
+                course_code=c.course_code,
+                title=c.title,
+                credit_hours=c.credit_hours,
+                requirement_name=c.requirement_name,
+                requirement_category=c.requirement_category,
+                sections_available=c.sections_available,
+                seats_available=c.seats_available,
+                avg_instructor_rating=c.avg_instructor_rating,
+                avg_difficulty=c.avg_difficulty,
+                easiest_section_instructor=c.easiest_section_instructor,
+                easiest_section_crn=c.easiest_section_crn,
+                prerequisites=c.prerequisites,
+                prereqs_satisfied=c.prereqs_satisfied,
+                priority_score=c.priority_score,
+            )
+            for c in plan.courses
+        ],
+        total_hours=plan.total_hours,
+        avg_difficulty=plan.avg_difficulty,
+        total_walking_minutes=plan.total_walking_minutes,
+        notes=plan.notes,
+    )
+
+
+def _graduation_path_response(path: GraduationPath) -> GraduationPathResponse:
+    """Convert a GraduationPath to its API response."""
+    return GraduationPathResponse(
+        program_name=path.program_name,
+        degree_type=path.degree_type,
+        optimization_mode=path.optimization_mode.value,
+        current_hours=path.current_hours,
+        hours_remaining=path.hours_remaining,
+        semesters=[_semester_plan_response(sem) for sem in path.semesters],
+        estimated_graduation=path.estimated_graduation,
+        total_semesters_remaining=path.total_semesters_remaining,
+        warnings=path.warnings,
+        generated_at=path.generated_at,
+    )
+
+
 @router.post("/graduation-path", response_model=GraduationPathResponse)
 async def generate_graduation_path(
     request: GraduationPathRequest,
@@ -628,45 +790,41 @@ async def generate_graduation_path(
             interests=request.interests,
         )
 
-        return GraduationPathResponse(
-            program_name=path.program_name,
-            degree_type=path.degree_type,
-            optimization_mode=path.optimization_mode.value,
-            current_hours=path.current_hours,
-            hours_remaining=path.hours_remaining,
-            semesters=[
-                SemesterPlanResponse(
-                    semester=sem.semester,
-                    courses=[
-                        CourseOptionResponse(
-                            course_code=c.course_code,
-                            title=c.title,
-                            credit_hours=c.credit_hours,
-                            requirement_name=c.requirement_name,
-                            requirement_category=c.requirement_category,
-                            sections_available=c.sections_available,
-                            seats_available=c.seats_available,
-                            avg_instructor_rating=c.avg_instructor_rating,
-                            avg_difficulty=c.avg_difficulty,
-                            easiest_section_instructor=c.easiest_section_instructor,
-                            easiest_section_crn=c.easiest_section_crn,
-                            prerequisites=c.prerequisites,
-                            prereqs_satisfied=c.prereqs_satisfied,
-                            priority_score=c.priority_score,
-                        )
-                        for c in sem.courses
-                    ],
-                    total_hours=sem.total_hours,
-                    avg_difficulty=sem.avg_difficulty,
-                    total_walking_minutes=sem.total_walking_minutes,
-                    notes=sem.notes,
-                )
-                for sem in path.semesters
-            ],
-            estimated_graduation=path.estimated_graduation,
-            total_semesters_remaining=path.total_semesters_remaining,
-            warnings=path.warnings,
-            generated_at=path.generated_at,
+        return _graduation_path_response(path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/graduation-path/compare", response_model=GraduationPathCompareResponse)
+async def compare_graduation_paths(
+    request: GraduationPathCompareRequest,
+    user: User = Depends(get_current_user),
+    optimizer: GraduationOptimizer = Depends(get_graduation_optimizer),
+):
+    """
+    Plan several graduation path variants side by side.
+
+    The degree audit and course options are loaded once and every
+    mode / hours-per-semester variant is planned from that shared context.
+    """
+    try:
+        variants = [
+            PlanVariant(
+                mode=OptimizationMode(v.mode),
+                hours_per_semester=v.hours_per_semester,
+            )
+            for v in request.variants
+        ]
+
+        paths = optimizer.generate_paths(
+            user.id,
+            variants,
+            start_semester=request.start_semester,
+            interests=request.interests,
+        )
+
+        return GraduationPathCompareResponse(
+            paths=[_graduation_path_response(p) for p in paths]
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -733,31 +891,6 @@ async def get_party_mode_schedule(
             target_hours=target_hours,
         )
 
-        return SemesterPlanResponse(
-            semester=plan.semester,
-            courses=[
-                CourseOptionResponse(
-                    course_code=c.course_code,
-                    title=c.title,
-                    credit_hours=c.credit_hours,
-                    requirement_name=c.requirement_name,
-                    requirement_category=c.requirement_category,
-                    sections_available=c.sections_available,
-                    seats_available=c.seats_available,
-                    avg_instructor_rating=c.avg_instructor_rating,
-                    avg_difficulty=c.avg_difficulty,
-                    easiest_section_instructor=c.easiest_section_instructor,
-                    easiest_section_crn=c.easiest_section_crn,
-                    prerequisites=c.prerequisites,
-                    prereqs_satisfied=c.prereqs_satisfied,
-                    priority_score=c.priority_score,
-                )
-                for c in plan.courses
-            ],
-            total_hours=plan.total_hours,
-            avg_difficulty=plan.avg_difficulty,
-            total_walking_minutes=plan.total_walking_minutes,
-            notes=plan.notes,
-        )
+        return _semester_plan_response(plan)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,168 @@
+"""
+Room occupancy API endpoints.
+
+Allows users to:
+- Find free rooms in or near a building for a time window (study spaces)
+- See building utilization and peak hours
+- Get hourly campus heat-map data
+
+All answers come from the in-memory occupancy index of the current
+schedule, built when the schedule was imported.
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from src.models.meeting_time import DAY_LETTERS, day_indexes, day_mask, parse_clock
+
+router = APIRouter(prefix="/rooms", tags=["Rooms"])
+
+
+# =============================================================================
+# Schemas
+# =============================================================================
+
+class FreeRoomResponse(BaseModel):
+    """A room with no class during the requested window."""
+    building: str
+    room: str
+    free_from: str = Field(..., description="Free since (previous class end, or midnight)")
+    free_until: str = Field(..., description="Free until (next class start, or midnight)")
+    distance_meters: int = 0
+    walk_minutes: int = 0
+    max_class_size: int = Field(0, description="Largest class scheduled in the room")
+
+
+class FreeRoomsResponse(BaseModel):
+    """Free rooms in or near a building."""
+    building: str
+    day: str
+    start_time: str
+    end_time: str
+    rooms: list[FreeRoomResponse]
+    count: int
+
+
+class BuildingOccupancyResponse(BaseModel):
+    """Precomputed activity metrics for a building."""
+    building: str
+    rooms: int
+    total_sections: int
+    total_courses: int
+    utilization: float = Field(..., description="Share of weekday 8am-10pm room time in use")
+    peak_hours: list[str]
+
+
+class HeatMapPoint(BaseModel):
+    """Rooms in use in a building during one hour."""
+    building: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    day: str
+    hour: int
+    rooms_in_use: float
+    utilization: float
+
+
+def _minutes(value: str, field_name: str) -> int:
+    minutes = parse_clock(value)
+    if minutes is None:
+        raise HTTPException(status_code=422, detail=f"Invalid time for {field_name}: {value}")
+    return minutes
+
+
+def _day(value: str) -> int:
+    days = day_indexes(day_mask(value))
+    if len(days) != 1:
+        raise HTTPException(
+            status_code=422, detail=f"Expected a single day (M, T, W, R, F, S, U): {value}"
+        )
+    return days[0]
+
+
+async def _occupancy(term: Optional[str]):
+    """Occupancy index of the current schedule, plus the campus graph."""
+    from src.services.campus_graph_store import get_campus_graph
+    from src.services.course_service import create_service
+    from src.services.room_occupancy import get_room_occupancy
+
+    service = create_service()
+    schedule = await asyncio.to_thread(service.get_current_schedule, term)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="No current schedule")
+
+    graph = get_campus_graph()
+    # Building metrics on the shared graph follow the default term
+    occupancy = await asyncio.to_thread(
+        get_room_occupancy, service.session_factory, schedule.id, graph if term is None else None
+    )
+    return occupancy, graph
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+@router.get("/free", response_model=FreeRoomsResponse)
+async def find_free_rooms(
+    building: str = Query(..., description="Building name or code (e.g., MLC, Boyd GSRC)"),
+    day: str = Query(..., description="Day (M, T, W, R, F, S, U)"),
+    start: str = Query(..., description="Window start (e.g., 2:00 pm)"),
+    end: str = Query(..., description="Window end (e.g., 4:00 pm)"),
+    radius: float = Query(
+        0, ge=0, le=2000, description="Also search buildings within this many meters"
+    ),
+    min_capacity: int = Query(
+        0, ge=0, description="Only rooms that have held classes at least this large"
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    term: Optional[str] = Query(None, description="Term (defaults to current)"),
+):
+    """
+    Find rooms with no class scheduled during a window.
+
+    Example: free rooms in or near the MLC from 2-4pm on Wednesday:
+    /rooms/free?building=MLC&day=W&start=2:00%20pm&end=4:00%20pm&radius=300
+    """
+    day_index = _day(day)
+    start_minutes = _minutes(start, "start")
+    end_minutes = _minutes(end, "end")
+    if end_minutes <= start_minutes:
+        raise HTTPException(status_code=422, detail="end must be after start")
+
+    occupancy, graph = await _occupancy(term)
+    rooms = occupancy.free_rooms(
+        graph, building, day_index, start_minutes, end_minutes,
+        radius_meters=radius, min_capacity=min_capacity, limit=limit,
+    )
+    return FreeRoomsResponse(
+        building=building,
+        day=DAY_LETTERS[day_index],
+        start_time=start,
+        end_time=end,
+        rooms=[FreeRoomResponse(**r.to_dict()) for r in rooms],
+        count=len(rooms),
+    )
+
+
+@router.get("/buildings", response_model=list[BuildingOccupancyResponse])
+async def get_building_occupancy(
+    term: Optional[str] = Query(None, description="Term (defaults to current)"),
+):
+    """Room counts, utilization and peak hours for every building, busiest first."""
+    occupancy, _ = await _occupancy(term)
+    stats = sorted(occupancy.buildings.values(), key=lambda b: -b.utilization)
+    return [BuildingOccupancyResponse(**b.to_dict()) for b in stats]
+
+
+@router.get("/heatmap", response_model=list[HeatMapPoint])
+async def get_occupancy_heat_map(
+    day: Optional[str] = Query(None, description="Single day (defaults to the whole week)"),
+    term: Optional[str] = Query(None, description="Term (defaults to current)"),
+):
+    """Hourly rooms in use per building, with coordinates where known."""
+    day_index = _day(day) if day else None
+    occupancy, graph = await _occupancy(term)
+    return [HeatMapPoint(**p) for p in occupancy.heat_map(graph, day_index)]
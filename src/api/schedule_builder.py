@@ -0,0 +1,133 @@
+"""
+Schedule builder API endpoints.
+
+Allows users to:
+- Generate ranked conflict-free schedules for a list of courses
+- Set hard constraints (open sections only, days off, earliest/latest times)
+- Weight preferences (no early mornings, compact days, minimal walking)
+
+Results stream as newline-delimited JSON: one line per schedule as the
+search finds it, followed by a summary line with the final ranking. The
+search has a node budget, and the summary says whether it finished.
+"""
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from src.models.meeting_time import day_mask, parse_clock
+
+router = APIRouter(prefix="/builder", tags=["Schedule Builder"])
+
+
+# =============================================================================
+# Schemas
+# =============================================================================
+
+class BuildScheduleRequest(BaseModel):
+    """Request to generate schedules."""
+    course_codes: list[str] = Field(
+        ..., min_length=1, max_length=12, description="Courses to schedule (e.g., CSCI 1302)"
+    )
+    term: Optional[str] = Field(None, description="Term (defaults to current)")
+    top_k: int = Field(10, ge=1, le=50, description="Number of schedules to return")
+
+    # Hard constraints
+    open_only: bool = Field(False, description="Only sections with open seats")
+    exclude_crns: list[str] = Field(default_factory=list, description="CRNs to leave out")
+    days_off: Optional[str] = Field(None, description="Days with no classes (e.g., F)")
+    not_before: Optional[str] = Field(None, description="No class starting before (e.g., 8:00 am)")
+    not_after: Optional[str] = Field(None, description="No class ending after (e.g., 5:00 pm)")
+    allow_tight_transitions: bool = Field(False, description="Allow gaps shorter than the walk")
+
+    # Preferences
+    preferred_start: Optional[str] = Field("9:00 am", description="Penalize class time before this")
+    preferred_end: Optional[str] = Field(None, description="Penalize class time after this")
+    time_weight: float = Field(1.0, ge=0, description="Weight per minute outside preferred hours")
+    day_weight: float = Field(60.0, ge=0, description="Weight per day on campus")
+    span_weight: float = Field(0.25, ge=0, description="Weight per minute of daily span")
+    walk_weight: float = Field(1.0, ge=0, description="Weight per minute walking")
+    tight_weight: float = Field(0.0, ge=0, description="Weight per tight transition (when allowed)")
+
+
+def _minutes(value: Optional[str], field_name: str) -> Optional[int]:
+    if not value:
+        return None
+    minutes = parse_clock(value)
+    if minutes is None:
+        raise HTTPException(status_code=422, detail=f"Invalid time for {field_name}: {value}")
+    return minutes
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+@router.post("/schedules")
+async def build_schedules(request: BuildScheduleRequest):
+    """
+    Generate the top-K conflict-free schedules for a set of courses.
+
+    Streams application/x-ndjson. A "type": "schedule" line is sent each
+    time the search finds a schedule that enters the current top-K; its
+    "rank" is among the schedules found so far, and later lines may push
+    it out. The last line has "type": "summary": "ranking" lists the ids of
+    the final top-K, best first, with search statistics.
+
+    When the summary's "complete" is false the search ran out of its node
+    budget, and the ranking is the best found so far rather than
+    guaranteed to be the overall best.
+    """
+    from src.services.course_service import create_service
+    from src.services.schedule_builder import (
+        BuilderPreferences, get_schedule_builder, load_course_options
+    )
+
+    preferences = BuilderPreferences(
+        open_only=request.open_only,
+        exclude_crns=frozenset(request.exclude_crns),
+        days_off=day_mask(request.days_off),
+        not_before=_minutes(request.not_before, "not_before"),
+        not_after=_minutes(request.not_after, "not_after"),
+        allow_tight_transitions=request.allow_tight_transitions,
+        preferred_start=_minutes(request.preferred_start, "preferred_start"),
+        preferred_end=_minutes(request.preferred_end, "preferred_end"),
+        time_weight=request.time_weight,
+        day_weight=request.day_weight,
+        span_weight=request.span_weight,
+        walk_weight=request.walk_weight,
+        tight_weight=request.tight_weight,
+    )
+
+    service = create_service()
+    options_by_course, missing = await asyncio.to_thread(
+        load_course_options, service, request.course_codes, request.term
+    )
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Courses not found: {', '.join(missing)}")
+
+    search = get_schedule_builder().iter_build(options_by_course, preferences, request.top_k)
+
+    def lines():
+        # A sync iterator is stepped in a worker thread, so each schedule is
+        # sent as soon as the search finds it
+        while True:
+            try:
+                schedule = next(search)
+            except StopIteration as done:
+                result = done.value
+                break
+            yield json.dumps({"type": "schedule", **schedule.to_dict()}) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "ranking": [s.id for s in result.schedules],
+            "count": len(result.schedules),
+            "nodes_explored": result.nodes_explored,
+            "complete": result.complete,
+            "unschedulable": result.unschedulable,
+        }) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
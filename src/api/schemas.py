@@ -66,6 +66,46 @@ class CourseListResponse(BaseModel):
     has_availability: bool
 
 
+class SectionSearchResult(SectionResponse):
+    """A section matched by structured section search, with its course."""
+    course_code: str
+    title: str
+    start_minutes: Optional[int] = None  # Minutes since midnight
+    end_minutes: Optional[int] = None
+
+
+class SectionSearchResponse(BaseModel):
+    """API response for structured section search."""
+    sections: list[SectionSearchResult]
+    count: int
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class PrerequisiteChainNode(BaseModel):
+    """A course in a prerequisite chain."""
+    code: str
+    depth: int
+
+
+class PrerequisiteChainEdge(BaseModel):
+    """A prerequisite relationship in a chain."""
+    course: str
+    prerequisite: str
+    group_id: int
+    logic: str  # "SINGLE" or "OR" (alternatives within the same group)
+
+
+class PrerequisiteChainResponse(BaseModel):
+    """Prerequisite chain for a course as a DAG, optionally with the nested tree."""
+    course: str
+    nodes: list[PrerequisiteChainNode]
+    edges: list[PrerequisiteChainEdge]
+    version: int
+    tree: Optional[dict] = None
+
+
 class InstructorResponse(BaseModel):
     """API response for an instructor."""
     model_config = ConfigDict(from_attributes=True)
@@ -104,6 +144,30 @@ class StatsResponse(BaseModel):
     parse_date: str
 
 
+class PollTermStatus(BaseModel):
+    """Adaptive polling state for one term."""
+    term: str
+    url: str
+    interval_seconds: int
+    next_poll_at: Optional[datetime] = None
+    due: bool
+    change_rate: float  # changes/hour used for the interval
+    scan_rate: float  # smoothed changes/hour seen by scans
+    history_rate: float  # seat changes/hour in SeatHistory
+    last_checked: Optional[datetime] = None
+    last_changed: Optional[datetime] = None
+    check_count: int = 0
+    change_count: int = 0
+
+
+class PollStatusResponse(BaseModel):
+    """API response for the adaptive seat polling scheduler."""
+    min_interval_seconds: int
+    max_interval_seconds: int
+    history_hours: int
+    terms: list[PollTermStatus]
+
+
 class SearchFilters(BaseModel):
     """Query parameters for course search."""
     subject: Optional[str] = Field(None, description="Filter by subject code (e.g., CSCI)")
@@ -769,6 +833,31 @@ class PlannedSectionsResponse(BaseModel):
     total: int
 
 
+class WalkingSectionChoice(BaseModel):
+    """A section chosen by the walking optimizer."""
+    crn: str
+    course_code: str
+    days: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    building: Optional[str] = None
+    room: Optional[str] = None
+    planned_crn: Optional[str] = Field(
+        None, description="CRN currently in the plan for this course"
+    )
+
+
+class WalkingOptimizationResponse(BaseModel):
+    """Planned sections re-chosen to minimize walking."""
+    semester: Optional[str] = None
+    sections: list[WalkingSectionChoice]
+    changed: int = Field(..., description="Courses whose suggested section differs from the plan")
+    current_walking_minutes: int
+    optimized_walking_minutes: int
+    current_tight_transitions: int
+    optimized_tight_transitions: int
+
+
 class TranscriptSummaryResponse(BaseModel):
     """Transcript summary with GPA and hours."""
     model_config = ConfigDict(from_attributes=True)
@@ -955,6 +1044,24 @@ class CohortMemberResponse(BaseModel):
     joined_at: datetime
 
 
+class CohortScheduleOverlap(BaseModel):
+    """Two cohort members who are in class at the same time."""
+    user_id: int
+    username: Optional[str] = None
+    other_user_id: int
+    other_username: Optional[str] = None
+    minutes_per_week: int = Field(..., description="Weekly minutes both are in class")
+    shared_crns: list[str] = Field(default_factory=list, description="Sections both have planned")
+
+
+class CohortScheduleOverlapResponse(BaseModel):
+    """Who overlaps with whom across a cohort's planned schedules."""
+    cohort_id: int
+    semester: str
+    members_compared: int = Field(..., description="Members sharing their schedule")
+    overlaps: list[CohortScheduleOverlap]
+
+
 class CohortResponse(BaseModel):
     """Cohort details."""
     model_config = ConfigDict(from_attributes=True)
@@ -1106,3 +1213,29 @@ class WhatIfScenarioResult(BaseModel):
 class WhatIfScenariosResponse(BaseModel):
     """Response with multiple what-if scenario results."""
     scenarios: list[WhatIfScenarioResult]
+
+
+class GraduationPathVariant(BaseModel):
+    """One mode / load combination to compare."""
+    mode: str = Field(
+        "balanced",
+        pattern="^(graduate_asap|party_mode|balanced|interest_based)$",
+        description="Optimization mode"
+    )
+    hours_per_semester: int = Field(
+        15, ge=12, le=21, description="Target credit hours per semester"
+    )
+
+
+class GraduationPathCompareRequest(BaseModel):
+    """Request to plan several graduation path variants from one audit."""
+    variants: list[GraduationPathVariant] = Field(..., min_length=1, max_length=12)
+    start_semester: Optional[str] = Field(None, description="Starting semester (e.g., Fall 2026)")
+    interests: Optional[list[str]] = Field(
+        None, description="Student interests for elective selection"
+    )
+
+
+class GraduationPathCompareResponse(BaseModel):
+    """Graduation paths for each requested variant, in request order."""
+    paths: list[GraduationPathResponse]
@@ -19,7 +19,7 @@ celery_app = Celery(
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
     include=[
-        # "src.tasks.scanner_tasks",  # TODO: Re-enable when schedule_scanner is implemented
+        "src.tasks.scanner_tasks",
         "src.tasks.embedding_tasks",
     ],
 )
@@ -43,11 +43,14 @@ celery_app.conf.update(
 
     # Beat scheduler (for periodic tasks)
     beat_schedule={
-        # TODO: Re-enable when schedule_scanner is implemented
-        # "update-seat-availability": {
-        #     "task": "src.tasks.scanner_tasks.update_all_seat_availability",
-        #     "schedule": 900.0,  # Every 15 minutes
-        # },
+        # Ticks at the minimum polling interval; the adaptive poll scheduler
+        # picks which terms are actually due on each tick.
+        "update-seat-availability": {
+            "task": "src.tasks.scanner_tasks.update_all_seat_availability",
+            "schedule": float(settings.seat_poll_min_interval),
+            # Drop ticks that queue behind a slow run instead of piling them up
+            "options": {"expires": float(settings.seat_poll_min_interval)},
+        },
         # Check seat alerts - every 5 minutes for timely notifications
         "check-seat-alerts": {
             "task": "src.tasks.embedding_tasks.check_seat_alerts_task",
@@ -5,6 +5,7 @@ Commands:
 - import: Import a PDF schedule
 - serve: Start the API server
 - stats: Show schedule statistics
+- campus-graph: Write the campus graph snapshot (run during deploy builds)
 """
 import argparse
 import os
@@ -25,7 +26,12 @@ def import_pdf(args):
         sys.exit(1)
 
     print(f"Importing {pdf_path}...")
-    schedule, result = service.import_pdf(pdf_path, args.url or "")
+    schedule, result = service.import_pdf(
+        pdf_path,
+        args.url or "",
+        parallel=not args.no_parallel,
+        workers=args.workers,
+    )
 
     print(f"\n=== Import Complete ===")
     print(f"Schedule ID: {schedule.id}")
@@ -312,12 +318,19 @@ def parse_prerequisites(args):
 
     print("Parsing prerequisites from bulletin courses...")
     parser = PrerequisiteParser()
-    stats = parser.process_all_bulletin_courses()
+    stats = parser.process_all_bulletin_courses(
+        incremental=args.incremental,
+        workers=args.workers,
+    )
 
     print(f"\n=== Parse Complete ===")
     print(f"Courses processed: {stats['courses_processed']}")
+    print(f"Courses unchanged: {stats['courses_skipped']}")
+    print(f"Distinct texts parsed: {stats['unique_texts']}")
     print(f"Prerequisites created: {stats['prerequisites_created']}")
     print(f"Equivalents created: {stats['equivalents_created']}")
+    if stats["needs_review"]:
+        print(f"Needs review (stricter rule stored): {', '.join(stats['needs_review'])}")
     print(f"Errors: {stats['errors']}")
 
 
@@ -390,6 +403,18 @@ def scrape_all_programs(args):
     asyncio.run(_scrape())
 
 
+def campus_graph_snapshot(args):
+    """Build the campus graph and write its snapshot."""
+    from src.services.campus_graph_store import write_campus_graph_snapshot
+
+    try:
+        path = write_campus_graph_snapshot(snapshot_path=args.output)
+    except OSError as e:
+        print(f"Error: could not write campus graph snapshot: {e}")
+        sys.exit(1)
+    print(f"Wrote campus graph snapshot to {path}")
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -403,6 +428,12 @@ def main():
     import_parser.add_argument("pdf", help="Path to PDF file")
     import_parser.add_argument("--url", help="Source URL for the PDF")
     import_parser.add_argument("-v", "--verbose", action="store_true", help="Show warnings")
+    import_parser.add_argument(
+        "--no-parallel", action="store_true", help="Parse pages in a single process"
+    )
+    import_parser.add_argument(
+        "-w", "--workers", type=int, help="Worker processes for page extraction"
+    )
     import_parser.set_defaults(func=import_pdf)
 
     # Serve command
@@ -456,6 +487,10 @@ def main():
 
     # Parse prerequisites command
     parse_parser = subparsers.add_parser("parse-prereqs", help="Parse prerequisites from bulletin courses")
+    parse_parser.add_argument("--incremental", action="store_true",
+                              help="Only re-parse courses whose prerequisite text changed")
+    parse_parser.add_argument("-w", "--workers", type=int,
+                              help="Parser processes (default: CPU count)")
     parse_parser.set_defaults(func=parse_prerequisites)
 
     # Scrape all programs command
@@ -465,6 +500,13 @@ def main():
     scrape_all_parser.add_argument("--save", action="store_true", help="Save to database")
     scrape_all_parser.set_defaults(func=scrape_all_programs)
 
+    # Campus graph snapshot
+    graph_parser = subparsers.add_parser(
+        "campus-graph", help="Write the campus graph snapshot (run during deploy builds)"
+    )
+    graph_parser.add_argument("-o", "--output", help="Snapshot path (default: from settings)")
+    graph_parser.set_defaults(func=campus_graph_snapshot)
+
     args = parser.parse_args()
 
     if args.command is None:
@@ -55,6 +55,23 @@ class Settings(BaseSettings):
     # Monitoring
     schedule_check_interval: int = 3600  # seconds
 
+    # Adaptive seat polling bounds (seconds)
+    seat_poll_min_interval: int = 120
+    seat_poll_max_interval: int = 21600
+    seat_poll_history_hours: int = 24  # SeatHistory window for change rates
+
+    # Parse cache (parsed schedules keyed by source hash + parser version)
+    parse_cache_enabled: bool = True
+    parse_cache_dir: str = "data/parse_cache"
+
+    # Compiled campus graph, regenerated when data/campus_buildings.json changes
+    # (written at deploy time by `python -m src.cli campus-graph`; relative to
+    # the project root, falling back to the temp directory if not writable)
+    campus_graph_snapshot: str = "data/campus_graph.snapshot"
+
+    # Room occupancy index per imported schedule
+    room_occupancy_dir: str = "data/occupancy"
+
     # Firecrawl (for bulletin scraping)
     firecrawl_api_key: Optional[str] = None
 
@@ -8,11 +8,65 @@ Models the physical layout of UGA campuses to enable:
 - Campus zone clustering for better scheduling
 
 Schema follows JSON-LD patterns for semantic interoperability.
+
+Walking times and distances between all buildings are precomputed into a
+dense matrix (NumPy when available) so lookups are array indexing.
 """
+import difflib
+import math
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from enum import Enum
 
+from src.models import meeting_time
+from src.models.schedule_conflicts import ConflictIndex, ScheduleConflict, find_conflicts
+
+if TYPE_CHECKING:
+    from src.models.transit import Itinerary
+
+EARTH_RADIUS_METERS = 6371000
+WALK_SPEED_MPS = 1.4  # ~3 mph, average walking pace
+PATH_FACTOR = 1.2  # Non-straight paths, crosswalks, etc.
+
+# Fuzzy building-name matches remembered per graph
+FUZZY_MEMO_SIZE = 1024
+FUZZY_CUTOFF = 0.85
+
+# Registrar abbreviations, expanded word by word when normalizing names
+NAME_ABBREVIATIONS = {
+    "acad": "academic",
+    "bldg": "building",
+    "cntr": "center",
+    "ctr": "center",
+    "eng": "engineering",
+    "inst": "instructional",
+    "phar": "pharmacy",
+    "sci": "science",
+    "stu": "student",
+}
+
+# Common building codes and nicknames
+BUILDING_CODES = {
+    "mlc": "Zell B Miller Learning Center",
+    "miller learning center": "Zell B Miller Learning Center",
+    "slc": "Science Learning Center",
+    "gsrc": "Boyd Graduate Research Center",
+    "boyd gsrc": "Boyd Graduate Research Center",
+    "tate": "Tate Student Center",
+    "tate center": "Tate Student Center",
+}
+
+_NAME_PUNCTUATION = re.compile(r"[.,/\\()'_\-]+")
+
+
+def normalize_building_name(name: str) -> str:
+    """Case-, punctuation- and abbreviation-folded form of a building name."""
+    name = _NAME_PUNCTUATION.sub(" ", name.lower().replace("&", " and "))
+    return " ".join(NAME_ABBREVIATIONS.get(word, word) for word in name.split())
+
 
 class CampusZone(Enum):
     """Major zones within Athens campus for clustering."""
@@ -32,8 +86,7 @@ class GeoLocation:
 
     def distance_to(self, other: "GeoLocation") -> float:
         """Calculate distance in meters using Haversine formula."""
-        import math
-        R = 6371000  # Earth's radius in meters
+        R = EARTH_RADIUS_METERS
 
         lat1, lat2 = math.radians(self.latitude), math.radians(other.latitude)
         dlat = math.radians(other.latitude - self.latitude)
@@ -185,14 +238,137 @@ class StudentScheduleLocation:
     start_time: str
     end_time: str
 
+    @property
+    def start_minutes(self) -> Optional[int]:
+        """Start time in minutes since midnight (None for TBA)."""
+        return meeting_time.meeting_minutes(self.start_time, self.end_time)[0]
+
+    @property
+    def end_minutes(self) -> Optional[int]:
+        """End time in minutes since midnight (None for TBA)."""
+        return meeting_time.meeting_minutes(self.start_time, self.end_time)[1]
+
+    @property
+    def day_mask(self) -> int:
+        """Meeting days as a bitmask (M=1 ... U=64)."""
+        return meeting_time.day_mask(self.days)
+
     def conflicts_with(self, other: "StudentScheduleLocation", min_travel_minutes: int = 10) -> bool:
-        """Check if this conflicts with another location (not enough travel time)."""
-        if self.days != other.days:
-            # TODO: Check for overlapping days
+        """
+        Check if this conflicts with another location.
+
+        Classes conflict if they share a day and either overlap in time or
+        are in different buildings with less than min_travel_minutes between
+        them.
+        """
+        if not self.day_mask & other.day_mask:
+            return False
+        start, end = self.start_minutes, self.end_minutes
+        other_start, other_end = other.start_minutes, other.end_minutes
+        if start is None or other_start is None:
+            return False
+
+        if start < other_end and other_start < end:
+            return True
+        if self.building == other.building:
             return False
+        gap = other_start - end if start <= other_start else start - other_end
+        return gap < min_travel_minutes
 
-        # TODO: Parse times and check for conflicts
-        return False
+
+class SpatialIndex:
+    """
+    Uniform grid over projected coordinates for nearest/radius queries.
+
+    Points are projected to meters around the campus latitude
+    (equirectangular, accurate to well under 1% at campus scale) and bucketed
+    into square cells. Queries visit only nearby cells; reported distances
+    are exact haversine meters.
+    """
+
+    def __init__(self, items: list[tuple[str, GeoLocation]], cell_meters: float = 250.0):
+        self.cell_meters = cell_meters
+        self.keys = [key for key, _ in items]
+        self.locations = [loc for _, loc in items]
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self._ref_lat = (
+            sum(loc.latitude for loc in self.locations) / len(self.locations)
+            if self.locations else 0.0
+        )
+        self._meters_per_lat = math.radians(1) * EARTH_RADIUS_METERS
+        self._meters_per_lon = self._meters_per_lat * math.cos(math.radians(self._ref_lat))
+        for i, loc in enumerate(self.locations):
+            self.cells.setdefault(self._cell(loc), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _cell(self, loc: GeoLocation) -> tuple[int, int]:
+        return (
+            int(math.floor(loc.longitude * self._meters_per_lon / self.cell_meters)),
+            int(math.floor(loc.latitude * self._meters_per_lat / self.cell_meters)),
+        )
+
+    def _ring(self, center: tuple[int, int], r: int):
+        """Cells at Chebyshev distance exactly r from center."""
+        cx, cy = center
+        if r == 0:
+            yield center
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cy - r)
+            yield (cx + dx, cy + r)
+        for dy in range(-r + 1, r):
+            yield (cx - r, cy + dy)
+            yield (cx + r, cy + dy)
+
+    def within(self, location: GeoLocation, radius_meters: float) -> list[tuple[str, float]]:
+        """(key, meters) for every point within the radius, nearest first."""
+        center = self._cell(location)
+        reach = int(math.ceil(radius_meters / self.cell_meters)) + 1
+        results = []
+        for r in range(reach + 1):
+            for cell in self._ring(center, r):
+                for i in self.cells.get(cell, ()):
+                    dist = location.distance_to(self.locations[i])
+                    if dist <= radius_meters:
+                        results.append((self.keys[i], dist))
+        results.sort(key=lambda x: x[1])
+        return results
+
+    def nearest(
+        self,
+        location: GeoLocation,
+        k: int = 1,
+        predicate=None,
+    ) -> list[tuple[str, float]]:
+        """
+        The k nearest points (key, meters), nearest first.
+
+        Rings of cells are searched outward until the k-th best is closer
+        than any unvisited cell can be. predicate(key) filters points.
+        """
+        if not self.keys or k <= 0:
+            return []
+        center = self._cell(location)
+        best: list[tuple[float, str]] = []
+        seen = 0
+        r = 0
+        while seen < len(self.keys):
+            for cell in self._ring(center, r):
+                for i in self.cells.get(cell, ()):
+                    seen += 1
+                    key = self.keys[i]
+                    if predicate is not None and not predicate(key):
+                        continue
+                    best.append((location.distance_to(self.locations[i]), key))
+            best.sort()
+            del best[k:]
+            # Everything unvisited is at least r cells away (less projection slack)
+            if len(best) == k and best[-1][0] <= r * self.cell_meters * 0.99:
+                break
+            r += 1
+        return [(key, dist) for dist, key in best]
 
 
 class CampusGraph:
@@ -216,78 +392,220 @@ class CampusGraph:
         self.bus_stops: dict[str, BusStop] = {}
         self.bus_routes: dict[str, BusRoute] = {}
 
+        # Normalized name/alias -> building id, plus remembered fuzzy matches
+        self._aliases: dict[str, str] = {}
+        self._fuzzy_memo: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._fuzzy_lock = threading.Lock()  # lookups run in worker threads
+
+        # Spatial indexes ("buildings", "parking", "stops") and the routes
+        # serving each stop. Built lazily.
+        self._spatial: Optional[dict[str, SpatialIndex]] = None
+        self._stop_routes: dict[str, set[str]] = {}
+        self._router = None  # TransitRouter, built on first trip
+
+        # Walking matrix: building id/name -> row, and rows of minutes and
+        # meters (None where a building has no location). Built lazily.
+        self._matrix_index: dict[str, int] = {}
+        self._walk_minutes: Optional[list[list[Optional[int]]]] = None
+        self._walk_meters: Optional[list[list[Optional[float]]]] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_fuzzy_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._fuzzy_lock = threading.Lock()
+
     def add_building(self, building: Building):
         """Add a building to the graph."""
         self.buildings[building.id] = building
+        self._index_building(building)
+        with self._fuzzy_lock:
+            self._fuzzy_memo.clear()
+        self._walk_minutes = None
+        self._spatial = None
+        self._router = None
+
+    def _index_building(self, building: Building):
+        """
+        Register a building's aliases.
+
+        Its own id, name and short name always win. Codes and other names
+        for the same coordinates in ATHENS_BUILDING_COORDS are added only
+        where no other building already claims them.
+        """
+        for name in (building.id, building.name, building.short_name):
+            if name:
+                self._aliases[normalize_building_name(name)] = building.id
+
+        names = {normalize_building_name(building.name)}
+        if building.location:
+            coords = (building.location.latitude, building.location.longitude)
+            names.update(normalize_building_name(n) for n in _coordinate_names().get(coords, ()))
+        for name in names:
+            self._aliases.setdefault(name, building.id)
+        for code, target in BUILDING_CODES.items():
+            if normalize_building_name(target) in names:
+                self._aliases.setdefault(code, building.id)
+
+    def add_walking_path(self, path: WalkingPath):
+        """Add a measured walking path; it overrides the estimate for that pair."""
+        self.walking_paths.append(path)
+        self._walk_minutes = None
+
+    def build_walking_matrix(self):
+        """
+        Precompute walking minutes and distances between all buildings.
+
+        Estimates use the haversine distance with the same path factor and
+        walk speed as Building.walking_time_to; explicit WalkingPaths
+        override their pair in both directions.
+        """
+        buildings = list(self.buildings.values())
+        index: dict[str, int] = {}
+        for row, building in enumerate(buildings):
+            index[building.id] = row
+            index.setdefault(building.name, row)
+
+        meters = _distance_matrix([b.location for b in buildings])
+        minutes = [
+            [None if d is None else int(d * PATH_FACTOR / WALK_SPEED_MPS / 60) + 1 for d in row]
+            for row in meters
+        ]
+
+        for path in self.walking_paths:
+            from_bldg = self.get_building(path.from_building)
+            to_bldg = self.get_building(path.to_building)
+            if not from_bldg or not to_bldg:
+                continue
+            i, j = index[from_bldg.id], index[to_bldg.id]
+            minutes[i][j] = minutes[j][i] = path.estimated_minutes
+            meters[i][j] = meters[j][i] = path.distance_meters
+
+        self._matrix_index = index
+        self._walk_meters = meters
+        self._walk_minutes = minutes
+
+    def _matrix_rows(self, from_building: str, to_building: str) -> Optional[tuple[int, int]]:
+        """Matrix rows for two buildings, or None if either is unknown."""
+        if self._walk_minutes is None:
+            self.build_walking_matrix()
+        index = self._matrix_index
+        i, j = index.get(from_building), index.get(to_building)
+        if i is None:
+            bldg = self.get_building(from_building)
+            i = index.get(bldg.id) if bldg else None
+        if j is None:
+            bldg = self.get_building(to_building)
+            j = index.get(bldg.id) if bldg else None
+        if i is None or j is None:
+            return None
+        return i, j
 
     def get_building(self, name: str) -> Optional[Building]:
-        """Get building by name or ID."""
-        # Try exact match
-        if name in self.buildings:
-            return self.buildings[name]
-
-        # Try case-insensitive search
-        name_lower = name.lower()
-        for bldg_id, bldg in self.buildings.items():
-            if bldg.name.lower() == name_lower or bldg_id.lower() == name_lower:
-                return bldg
-            if bldg.short_name and bldg.short_name.lower() == name_lower:
-                return bldg
+        """Get building by ID, name, short name, code or close registrar spelling."""
+        if not name:
+            return None
+
+        # Exact ID
+        building = self.buildings.get(name)
+        if building is not None:
+            return building
+
+        # Normalized name or alias
+        key = normalize_building_name(name)
+        bldg_id = self._aliases.get(key)
+        if bldg_id is not None:
+            return self.buildings.get(bldg_id)
+
+        # Fuzzy match, remembered (including misses). The match itself runs
+        # outside the lock; two threads may both compute the same key.
+        with self._fuzzy_lock:
+            found = key in self._fuzzy_memo
+            if found:
+                self._fuzzy_memo.move_to_end(key)
+                bldg_id = self._fuzzy_memo[key]
+        if not found:
+            bldg_id = self._fuzzy_match(key)
+            with self._fuzzy_lock:
+                self._fuzzy_memo[key] = bldg_id
+                if len(self._fuzzy_memo) > FUZZY_MEMO_SIZE:
+                    self._fuzzy_memo.popitem(last=False)
+        return self.buildings.get(bldg_id) if bldg_id else None
+
+    def _fuzzy_match(self, key: str) -> Optional[str]:
+        """
+        Closest alias to a normalized name.
 
+        Numbers and single letters must match exactly ("Forest Resources
+        4" never matches "Forest Resources 1"); otherwise the alias must be
+        close in spelling, or one name must extend the other by whole words
+        with only one building matching.
+        """
+        if not key:
+            return None
+        markers = _name_markers(key)
+        candidates = [alias for alias in self._aliases if _name_markers(alias) == markers]
+
+        close = difflib.get_close_matches(key, candidates, n=1, cutoff=FUZZY_CUTOFF)
+        if close:
+            return self._aliases[close[0]]
+
+        extended = {
+            self._aliases[alias]
+            for alias in candidates
+            if alias.startswith(key + " ") or key.startswith(alias + " ")
+        }
+        if len(extended) == 1:
+            return extended.pop()
         return None
 
     def walking_time(self, from_building: str, to_building: str) -> Optional[int]:
         """Get walking time between two buildings in minutes."""
-        bldg1 = self.get_building(from_building)
-        bldg2 = self.get_building(to_building)
-
-        if not bldg1 or not bldg2:
+        rows = self._matrix_rows(from_building, to_building)
+        if rows is None:
             return None
+        return self._walk_minutes[rows[0]][rows[1]]
 
-        # Check for pre-computed path
-        for path in self.walking_paths:
-            if (path.from_building == from_building and path.to_building == to_building) or \
-               (path.from_building == to_building and path.to_building == from_building):
-                return path.estimated_minutes
-
-        # Calculate from coordinates
-        return bldg1.walking_time_to(bldg2)
+    def walking_distance(self, from_building: str, to_building: str) -> Optional[float]:
+        """Walking meters between two buildings (straight-line unless a path is known)."""
+        rows = self._matrix_rows(from_building, to_building)
+        if rows is None:
+            return None
+        return self._walk_meters[rows[0]][rows[1]]
 
     def find_schedule_conflicts(
         self,
         locations: list[StudentScheduleLocation],
         min_travel_minutes: int = 10
-    ) -> list[tuple[StudentScheduleLocation, StudentScheduleLocation, int]]:
+    ) -> list[ScheduleConflict]:
         """
-        Find back-to-back classes that may have travel time issues.
+        Find overlapping classes and back-to-back classes without enough travel time.
 
-        Returns list of (location1, location2, travel_time_needed) tuples.
+        A transition between buildings needs the walking time or
+        min_travel_minutes, whichever is larger. Each conflict's intervals
+        carry the locations as their key.
         """
-        conflicts = []
-
-        # Sort by day and time
-        # TODO: Implement proper time parsing
+        return find_conflicts(locations, self.walking_time, min_travel_minutes)
 
-        for i, loc1 in enumerate(locations):
-            for loc2 in locations[i+1:]:
-                # Check if same day and consecutive
-                if loc1.building != loc2.building:
-                    travel_time = self.walking_time(loc1.building, loc2.building)
-                    if travel_time and travel_time > min_travel_minutes:
-                        conflicts.append((loc1, loc2, travel_time))
+    def conflict_index(self, min_travel_minutes: int = 0) -> ConflictIndex:
+        """Empty ConflictIndex using this graph's walking times, for batch checks."""
+        return ConflictIndex(self.walking_time, min_travel_minutes)
 
-        return conflicts
-
-    def optimize_daily_route(
-        self,
-        locations: list[StudentScheduleLocation]
-    ) -> list[StudentScheduleLocation]:
+    def weekly_walking(self, locations: list[StudentScheduleLocation]) -> tuple[int, int]:
         """
-        Suggest optimal ordering of classes to minimize walking.
-        (For when students have flexibility in section choice)
+        Total weekly walking for a schedule.
+
+        Returns (walking minutes between consecutive classes on each day,
+        transitions where the walk is longer than the gap).
         """
-        # TODO: Implement TSP-style optimization
-        return locations
+        index = self.conflict_index()
+        for i, loc in enumerate(locations):
+            index.add(i, loc)
+        score = index.score(range(len(locations)))
+        return score.walking_minutes, score.tight_transitions
 
     def get_buildings_by_zone(self, zone: CampusZone) -> list[Building]:
         """Get all buildings in a campus zone."""
@@ -296,14 +614,89 @@ class CampusGraph:
     def add_parking(self, parking: ParkingLocation):
         """Add a parking location to the graph."""
         self.parking[parking.id] = parking
+        self._spatial = None
+        self._router = None
 
     def add_bus_stop(self, stop: BusStop):
         """Add a bus stop to the graph."""
         self.bus_stops[stop.id] = stop
+        self._spatial = None
+        self._router = None
 
     def add_bus_route(self, route: BusRoute):
         """Add a bus route to the graph."""
         self.bus_routes[route.id] = route
+        self._spatial = None
+        self._router = None
+
+    def build_spatial_index(self):
+        """Index buildings, parking and bus stops by location, and stops by route."""
+        def located(items) -> list[tuple[str, GeoLocation]]:
+            return [(item.id, item.location) for item in items if item.location]
+
+        self._spatial = {
+            "buildings": SpatialIndex(located(self.buildings.values())),
+            "parking": SpatialIndex(located(self.parking.values())),
+            "stops": SpatialIndex(located(self.bus_stops.values())),
+        }
+
+        stop_routes: dict[str, set[str]] = {
+            stop_id: set(stop.routes) for stop_id, stop in self.bus_stops.items()
+        }
+        for route in self.bus_routes.values():
+            for stop_id in route.stops:
+                stop_routes.setdefault(stop_id, set()).add(route.id)
+        self._stop_routes = stop_routes
+
+    def _index(self, kind: str) -> SpatialIndex:
+        if self._spatial is None:
+            self.build_spatial_index()
+        return self._spatial[kind]
+
+    def nearest_buildings(self, location: GeoLocation, k: int = 5) -> list[tuple[Building, float]]:
+        """The k buildings nearest a location, with distances in meters."""
+        nearest = self._index("buildings").nearest(location, k)
+        return [(self.buildings[key], d) for key, d in nearest]
+
+    def buildings_within(
+        self,
+        location: GeoLocation,
+        radius_meters: float,
+    ) -> list[tuple[Building, float]]:
+        """Buildings within a radius of a location, nearest first."""
+        within = self._index("buildings").within(location, radius_meters)
+        return [(self.buildings[key], d) for key, d in within]
+
+    def stops_within(
+        self,
+        location: GeoLocation,
+        radius_meters: float,
+    ) -> list[tuple[BusStop, float]]:
+        """Bus stops within a radius of a location, nearest first."""
+        within = self._index("stops").within(location, radius_meters)
+        return [(self.bus_stops[key], d) for key, d in within]
+
+    def routes_at_stop(self, stop_id: str) -> set[str]:
+        """IDs of the routes serving a stop."""
+        if self._spatial is None:
+            self.build_spatial_index()
+        return self._stop_routes.get(stop_id, set())
+
+    def stops_within_walk(
+        self,
+        location: GeoLocation,
+        max_walk_minutes: int,
+    ) -> list[tuple[BusStop, int]]:
+        """Bus stops reachable on foot within max_walk_minutes, with walking minutes."""
+        # walk = int(d * PATH_FACTOR / WALK_SPEED_MPS / 60) + 1 <= max
+        #   <=>  d < max * 60 * speed / factor
+        radius = max_walk_minutes * 60 * WALK_SPEED_MPS / PATH_FACTOR
+        results = []
+        for stop, dist in self.stops_within(location, radius):
+            walk = _walk_minutes(dist)
+            if walk <= max_walk_minutes:
+                results.append((stop, walk))
+        return results
 
     def find_nearest_parking(
         self,
@@ -323,20 +716,44 @@ class CampusGraph:
             List of (ParkingLocation, walking_minutes) tuples
         """
         building = self.get_building(building_name)
-        if not building:
+        if not building or not building.location:
             return []
 
-        results = []
-        for parking in self.parking.values():
-            if permit_type and parking.permit_required and permit_type not in parking.permit_required:
-                continue
+        def permitted(parking_id: str) -> bool:
+            parking = self.parking[parking_id]
+            if not permit_type or not parking.permit_required:
+                return True
+            return permit_type in parking.permit_required
 
-            walk_time = parking.walking_time_to(building)
-            if walk_time:
-                results.append((parking, walk_time))
+        nearest = self._index("parking").nearest(
+            building.location, max_results, predicate=permitted
+        )
+        return [(self.parking[key], _walk_minutes(dist)) for key, dist in nearest]
 
-        results.sort(key=lambda x: x[1])
-        return results[:max_results]
+    def plan_trip(
+        self,
+        from_building: str,
+        to_building: str,
+        depart: int,
+        day: str = "M",
+    ) -> Optional["Itinerary"]:
+        """
+        Fastest walk/bus itinerary between two buildings.
+
+        Args:
+            from_building: Starting building
+            to_building: Destination building
+            depart: Departure time in minutes since midnight
+            day: Day letter (M, T, W, R, F, S, U) for route service days
+
+        Returns:
+            Itinerary (walking only if no bus trip is faster), or None if
+            either building is unknown or has no location
+        """
+        if self._router is None:
+            from src.models.transit import TransitRouter
+            self._router = TransitRouter(self)
+        return self._router.plan(from_building, to_building, depart, day)
 
     def find_bus_options(
         self,
@@ -358,45 +775,38 @@ class CampusGraph:
         from_bldg = self.get_building(from_building)
         to_bldg = self.get_building(to_building)
 
-        if not from_bldg or not to_bldg:
+        if not from_bldg or not to_bldg or not from_bldg.location or not to_bldg.location:
             return []
 
-        options = []
+        origin_stops = self.stops_within_walk(from_bldg.location, max_walk_to_stop)
+        dest_stops = self.stops_within_walk(to_bldg.location, max_walk_to_stop)
+        if not origin_stops or not dest_stops:
+            return []
+
+        # Destination stops by route, so each origin stop only meets the
+        # destination stops that share one of its routes
+        dest_by_route: dict[str, list[tuple[BusStop, int]]] = {}
+        for dest_stop, walk_from in dest_stops:
+            for route_id in self.routes_at_stop(dest_stop.id):
+                dest_by_route.setdefault(route_id, []).append((dest_stop, walk_from))
 
-        # Find stops near origin
-        origin_stops = []
-        for stop in self.bus_stops.values():
-            if stop.location and from_bldg.location:
-                dist = from_bldg.location.distance_to(stop.location)
-                walk_time = int(dist * 1.2 / 1.4 / 60) + 1
-                if walk_time <= max_walk_to_stop:
-                    origin_stops.append((stop, walk_time))
-
-        # Find stops near destination
-        dest_stops = []
-        for stop in self.bus_stops.values():
-            if stop.location and to_bldg.location:
-                dist = to_bldg.location.distance_to(stop.location)
-                walk_time = int(dist * 1.2 / 1.4 / 60) + 1
-                if walk_time <= max_walk_to_stop:
-                    dest_stops.append((stop, walk_time))
-
-        # Find routes that connect origin stops to destination stops
+        options = []
         for origin_stop, walk_to in origin_stops:
-            for dest_stop, walk_from in dest_stops:
-                # Find common routes
-                common_routes = set(origin_stop.routes) & set(dest_stop.routes)
-                for route_id in common_routes:
-                    route = self.bus_routes.get(route_id)
-                    if route:
-                        options.append({
-                            "route": route,
-                            "board_at": origin_stop,
-                            "exit_at": dest_stop,
-                            "walk_to_stop": walk_to,
-                            "walk_from_stop": walk_from,
-                            "estimated_total": walk_to + walk_from + (route.frequency_minutes or 10)
-                        })
+            for route_id in self.routes_at_stop(origin_stop.id):
+                route = self.bus_routes.get(route_id)
+                if not route:
+                    continue
+                for dest_stop, walk_from in dest_by_route.get(route_id, ()):
+                    if dest_stop.id == origin_stop.id:
+                        continue
+                    options.append({
+                        "route": route,
+                        "board_at": origin_stop,
+                        "exit_at": dest_stop,
+                        "walk_to_stop": walk_to,
+                        "walk_from_stop": walk_from,
+                        "estimated_total": walk_to + walk_from + (route.frequency_minutes or 10)
+                    })
 
         return sorted(options, key=lambda x: x["estimated_total"])
 
@@ -707,6 +1117,19 @@ UGA_BUS_ROUTES = {
 }
 
 
+def build_campus_graph_from_coords() -> CampusGraph:
+    """Build a CampusGraph of just the buildings with known coordinates."""
+    graph = CampusGraph()
+    for name, (lat, lon) in ATHENS_BUILDING_COORDS.items():
+        graph.add_building(Building(
+            id=name.lower().replace(" ", "_"),
+            name=name,
+            location=GeoLocation(lat, lon)
+        ))
+    graph.build_walking_matrix()
+    return graph
+
+
 def build_campus_graph_from_schedule(buildings_json: dict) -> CampusGraph:
     """Build a CampusGraph from the scanned building data."""
     graph = CampusGraph()
@@ -756,8 +1179,18 @@ def build_campus_graph_from_schedule(buildings_json: dict) -> CampusGraph:
         )
         graph.add_parking(parking)
 
-    # Add bus routes
+    # Add bus routes, and their major stops placed at the building they serve
     for route_id, rdata in UGA_BUS_ROUTES.items():
+        stop_ids = []
+        for stop_name in rdata.get("major_stops", []):
+            stop_id = stop_name.lower().replace(" ", "_")
+            stop = graph.bus_stops.get(stop_id)
+            if stop is None:
+                stop = BusStop(id=stop_id, name=stop_name, location=_stop_location(stop_name))
+                graph.add_bus_stop(stop)
+            stop.routes.append(route_id)
+            stop_ids.append(stop_id)
+
         route = BusRoute(
             id=route_id,
             name=rdata["name"],
@@ -767,8 +1200,93 @@ def build_campus_graph_from_schedule(buildings_json: dict) -> CampusGraph:
             first_departure=rdata["hours"][0] if "hours" in rdata else None,
             last_departure=rdata["hours"][1] if "hours" in rdata else None,
             days_of_operation=rdata.get("days", "MTWRF"),
-            color=rdata.get("color")
+            color=rdata.get("color"),
+            stops=stop_ids,
         )
         graph.add_bus_route(route)
 
+    graph.build_walking_matrix()
+    graph.build_spatial_index()
     return graph
+
+
+def _stop_location(stop_name: str) -> Optional[GeoLocation]:
+    """
+    Location for a named stop: the building it is named after.
+
+    Uses an exact ATHENS_BUILDING_COORDS name, else the one location whose
+    building names contain every word of the stop name ("Tate Center" ->
+    "Tate Student Center"). None if no single building matches.
+    """
+    coords = ATHENS_BUILDING_COORDS.get(stop_name)
+    if coords is None:
+        key = normalize_building_name(stop_name)
+        words = key.split()
+        matches = {
+            ATHENS_BUILDING_COORDS[name]
+            for name in ATHENS_BUILDING_COORDS
+            if all(word in normalize_building_name(name).split() for word in words)
+        }
+        if len(matches) == 1:
+            coords = matches.pop()
+    return GeoLocation(coords[0], coords[1]) if coords else None
+
+
+def _walk_minutes(distance_meters: float) -> int:
+    """Walking minutes for a straight-line distance (same estimate as Building.walking_time_to)."""
+    return int(distance_meters * PATH_FACTOR / WALK_SPEED_MPS / 60) + 1
+
+
+def _name_markers(name: str) -> frozenset[str]:
+    """Words that distinguish otherwise similar buildings: numbers and single letters."""
+    return frozenset(w for w in name.split() if len(w) == 1 or any(c.isdigit() for c in w))
+
+
+_COORDINATE_NAMES: Optional[dict[tuple[float, float], list[str]]] = None
+
+
+def _coordinate_names() -> dict[tuple[float, float], list[str]]:
+    """ATHENS_BUILDING_COORDS names grouped by coordinates (names for the same building)."""
+    global _COORDINATE_NAMES
+    if _COORDINATE_NAMES is None:
+        grouped: dict[tuple[float, float], list[str]] = {}
+        for name, coords in ATHENS_BUILDING_COORDS.items():
+            grouped.setdefault(coords, []).append(name)
+        _COORDINATE_NAMES = grouped
+    return _COORDINATE_NAMES
+
+
+def _distance_matrix(locations: list[Optional[GeoLocation]]) -> list[list[Optional[float]]]:
+    """Pairwise haversine distances in meters; None where a location is missing."""
+    n = len(locations)
+    known = [i for i, loc in enumerate(locations) if loc is not None]
+    matrix: list[list[Optional[float]]] = [[None] * n for _ in range(n)]
+    if not known:
+        return matrix
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        lat = np.radians([locations[i].latitude for i in known])
+        lon = np.radians([locations[i].longitude for i in known])
+        dlat = lat[None, :] - lat[:, None]
+        dlon = lon[None, :] - lon[:, None]
+        cos_lat = np.cos(lat)
+        a = np.sin(dlat / 2) ** 2 + cos_lat[:, None] * cos_lat[None, :] * np.sin(dlon / 2) ** 2
+        distances = (EARTH_RADIUS_METERS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))).tolist()
+        for row, i in enumerate(known):
+            matrix_row = matrix[i]
+            for col, j in enumerate(known):
+                matrix_row[j] = distances[row][col]
+        return matrix
+
+    for i in known:
+        for j in known:
+            if j < i:
+                matrix[i][j] = matrix[j][i]
+            else:
+                matrix[i][j] = locations[i].distance_to(locations[j])
+    return matrix
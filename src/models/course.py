@@ -4,6 +4,8 @@ from typing import Optional
 from datetime import datetime
 import json
 
+from src.models import meeting_time
+
 
 @dataclass
 class CourseSection:
@@ -28,6 +30,21 @@ class CourseSection:
     def is_available(self) -> bool:
         return self.seats_available > 0 and self.status == 'A'
 
+    @property
+    def start_minutes(self) -> Optional[int]:
+        """Start time in minutes since midnight (None for TBA)."""
+        return meeting_time.meeting_minutes(self.start_time, self.end_time)[0]
+
+    @property
+    def end_minutes(self) -> Optional[int]:
+        """End time in minutes since midnight (None for TBA)."""
+        return meeting_time.meeting_minutes(self.start_time, self.end_time)[1]
+
+    @property
+    def day_mask(self) -> int:
+        """Meeting days as a bitmask (M=1 ... U=64)."""
+        return meeting_time.day_mask(self.days)
+
     @property
     def schedule_display(self) -> str:
         """Human-readable schedule string."""
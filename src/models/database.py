@@ -167,6 +167,13 @@ class Section(Base):
     room: Mapped[Optional[str]] = mapped_column(String(20))  # e.g., "0306"
     campus: Mapped[Optional[str]] = mapped_column(String(50))  # e.g., "Athens", "Tifton"
 
+    # Normalized meeting time (see src.models.meeting_time)
+    # Minutes since midnight, NULL for TBA
+    start_minutes: Mapped[Optional[int]] = mapped_column(Integer)
+    end_minutes: Mapped[Optional[int]] = mapped_column(Integer)
+    # M=1, T=2, W=4, R=8, F=16, S=32, U=64
+    day_mask: Mapped[int] = mapped_column(Integer, default=0)
+
     # Enrollment
     class_size: Mapped[int] = mapped_column(Integer, default=0)
     seats_available: Mapped[int] = mapped_column(Integer, default=0)
@@ -180,6 +187,8 @@ class Section(Base):
         Index("ix_sections_crn_course", "crn", "course_id"),
         Index("ix_sections_instructor", "instructor"),
         Index("ix_sections_status_available", "status", "seats_available"),
+        Index("ix_sections_times", "start_minutes", "end_minutes"),
+        Index("ix_sections_days_times", "day_mask", "start_minutes", "end_minutes"),
     )
 
     @property
@@ -409,6 +418,9 @@ class BulletinCourse(Base):
     corequisites: Mapped[Optional[str]] = mapped_column(Text)
     equivalent_courses: Mapped[Optional[str]] = mapped_column(Text)
 
+    # Hash of the parsed prerequisite text + parser version (for incremental re-parsing)
+    prerequisites_hash: Mapped[Optional[str]] = mapped_column(String(64))
+
     # Offering info
     semester_offered: Mapped[Optional[str]] = mapped_column(String(100))
     grading_system: Mapped[Optional[str]] = mapped_column(String(50))
@@ -1644,6 +1656,41 @@ class SeatHistory(Base):
         return f"<SeatHistory(crn={self.crn}, seats={self.seats_available}, time={self.recorded_at})>"
 
 
+class SourceState(Base):
+    """
+    Last-seen HTTP validators and content hash for a polled source file.
+
+    Lets the scanner send conditional requests (If-None-Match /
+    If-Modified-Since) across restarts, so an unchanged registrar file
+    costs a 304 instead of a download and parse.
+    """
+    __tablename__ = "source_states"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    url: Mapped[str] = mapped_column(String(500), nullable=False, unique=True, index=True)
+    name: Mapped[Optional[str]] = mapped_column(String(100))  # e.g. term
+
+    # Validators from the last 200 response
+    etag: Mapped[Optional[str]] = mapped_column(String(200))
+    last_modified: Mapped[Optional[str]] = mapped_column(String(100))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    content_length: Mapped[Optional[int]] = mapped_column(Integer)
+
+    # Tracking
+    last_checked: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    last_changed: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    check_count: Mapped[int] = mapped_column(Integer, default=0)
+    change_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Adaptive polling
+    change_rate: Mapped[Optional[float]] = mapped_column(Float)  # Smoothed changes per hour
+    poll_interval: Mapped[Optional[int]] = mapped_column(Integer)  # seconds
+    next_poll_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    def __repr__(self) -> str:
+        return f"<SourceState(url='{self.url}', hash={(self.content_hash or '')[:12]})>"
+
+
 # =============================================================================
 # Database Engine and Session Management
 # =============================================================================
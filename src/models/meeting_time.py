@@ -0,0 +1,102 @@
+"""
+Meeting time helpers.
+
+Section times arrive as text ("09:05 am", "2:20 pm") and days as letter
+strings ("MWF", "T R"). These helpers turn them into minutes since
+midnight and a weekly day bitmask so overlap checks are integer math.
+
+Day bits follow the registrar's letters: M=1, T=2, W=4, R=8, F=16, S=32, U=64.
+"""
+import re
+from functools import lru_cache
+from typing import Optional
+
+DAY_LETTERS = "MTWRFSU"
+DAY_BITS = {letter: 1 << i for i, letter in enumerate(DAY_LETTERS)}
+
+_CLOCK_RE = re.compile(r'^(\d{1,2}):(\d{2})\s*(?:([ap])\.?\s*m?\.?)?$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def parse_clock(time_str: Optional[str]) -> Optional[int]:
+    """
+    Parse a clock time to minutes since midnight.
+
+    Accepts 12-hour ("9:05 am", "12:30PM", "2:20 p.m.") and 24-hour
+    ("14:20") forms. Returns None for blanks, TBA and anything else.
+    """
+    if not time_str:
+        return None
+    match = _CLOCK_RE.match(time_str.strip())
+    if not match:
+        return None
+
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour %= 12
+        if meridiem.lower() == 'p':
+            hour += 12
+    elif hour > 23:
+        return None
+    return hour * 60 + minute
+
+
+@lru_cache(maxsize=512)
+def day_mask(days: Optional[str]) -> int:
+    """Bitmask of meeting days; 0 for blank or TBA."""
+    if not days:
+        return 0
+    days = days.strip().upper()
+    if days.startswith("TBA"):
+        return 0
+    mask = 0
+    for letter in days:
+        mask |= DAY_BITS.get(letter, 0)
+    return mask
+
+
+def days_from_mask(mask: int) -> str:
+    """Day letters for a bitmask, in week order ("MWF")."""
+    return ''.join(letter for letter, bit in DAY_BITS.items() if mask & bit)
+
+
+def day_indexes(mask: int) -> list[int]:
+    """Indexes (0 = Monday) of the days set in a bitmask."""
+    return [i for i in range(len(DAY_LETTERS)) if mask & (1 << i)]
+
+
+def day_subsets(mask: int) -> list[int]:
+    """Every non-empty subset of a day bitmask (for indexable IN filters)."""
+    subsets = []
+    subset = mask
+    while subset:
+        subsets.append(subset)
+        subset = (subset - 1) & mask
+    return subsets
+
+
+def meeting_minutes(
+    start_time: Optional[str],
+    end_time: Optional[str],
+) -> tuple[Optional[int], Optional[int]]:
+    """
+    Start and end minutes for a meeting.
+
+    Both are None unless both parse and the end is after the start.
+    """
+    start, end = parse_clock(start_time), parse_clock(end_time)
+    if start is None or end is None or end <= start:
+        return None, None
+    return start, end
+
+
+def format_clock(minutes: int) -> str:
+    """Format minutes since midnight as '09:05 am' (24:00 and later wrap to am)."""
+    hour, minute = divmod(minutes, 60)
+    hour %= 24
+    suffix = "am" if hour < 12 else "pm"
+    return f"{(hour % 12) or 12:02d}:{minute:02d} {suffix}"
@@ -0,0 +1,261 @@
+"""
+Sweep-line conflict detection over weekly meeting intervals.
+
+Meetings are expanded to (day, start, end, building) intervals and swept
+once in (day, start, end) order. A min-heap of active intervals keyed by
+end time gives, at each start:
+- every still-running interval, which overlaps the new one
+- the interval that ended most recently, i.e. the class just before,
+  whose gap is compared with the walk between the two buildings
+
+Time overlaps and insufficient travel gaps come out of the same pass in
+O(n log n + k) for n intervals and k conflicts.
+
+ConflictIndex precomputes and sorts each section's intervals once so many
+candidate schedules (schedule builder results, a cohort's plans) can be
+checked, scored or compared against each other without re-parsing times
+or re-resolving building names.
+"""
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from src.models.meeting_time import DAY_LETTERS, day_indexes
+
+# (building, building) -> walking minutes, or None if unknown
+WalkFunction = Callable[[str, str], Optional[int]]
+
+
+@dataclass(frozen=True, order=True)
+class Interval:
+    """One meeting of a section on one day."""
+    day: int  # 0 = Monday
+    start: int  # minutes since midnight
+    end: int
+    building: str = ""
+    key: Any = field(default=None, compare=False)  # what the meeting belongs to
+
+    @property
+    def day_letter(self) -> str:
+        return DAY_LETTERS[self.day]
+
+
+@dataclass
+class ScheduleConflict:
+    """Two meetings that overlap, or are too far apart for their gap."""
+    first: Interval
+    second: Interval
+    kind: str  # "overlap" or "travel"
+    gap_minutes: int  # negative when the meetings overlap
+    walk_minutes: int  # needed to get from first to second
+
+    @property
+    def day(self) -> str:
+        return self.first.day_letter
+
+
+@dataclass
+class ScheduleScore:
+    """Conflict counts and walking for one candidate schedule."""
+    overlaps: int
+    tight_transitions: int
+    walking_minutes: int
+
+    @property
+    def conflict_free(self) -> bool:
+        return self.overlaps == 0
+
+
+def meeting_intervals(item, key: Any = None) -> list[Interval]:
+    """
+    Expand a meeting to per-day intervals.
+
+    item is anything with day_mask, start_minutes, end_minutes and building
+    (Section, CourseSection, ScheduleSlot, StudentScheduleLocation).
+    Meetings without times (TBA, online) yield nothing.
+    """
+    start, end = item.start_minutes, item.end_minutes
+    if start is None or end is None:
+        return []
+    building = getattr(item, "building", None) or ""
+    return [Interval(day, start, end, building, key) for day in day_indexes(item.day_mask)]
+
+
+def sweep(
+    intervals: Iterable[Interval],
+    walk: Optional[WalkFunction] = None,
+    min_travel_minutes: int = 0,
+) -> list[ScheduleConflict]:
+    """
+    Find overlapping and too-tight consecutive meetings in one pass.
+
+    intervals must be sorted by (day, start, end). A transition between
+    different buildings is tight when the gap is shorter than the walk
+    (or min_travel_minutes, whichever is larger).
+    """
+    conflicts = []
+    active: list[tuple[int, int, Interval]] = []  # (end, seq, interval)
+    previous: Optional[Interval] = None
+    day = None
+    for seq, interval in enumerate(intervals):
+        if interval.day != day:
+            day, active, previous = interval.day, [], None
+
+        while active and active[0][0] <= interval.start:
+            _, _, ended = heapq.heappop(active)
+            if previous is None or ended.end >= previous.end:
+                previous = ended
+
+        for _, _, running in active:
+            conflicts.append(ScheduleConflict(
+                running, interval, "overlap", interval.start - running.end, 0
+            ))
+
+        if previous is not None and previous.building != interval.building:
+            needed = max(_walk(walk, previous.building, interval.building), min_travel_minutes)
+            gap = interval.start - previous.end
+            if gap < needed:
+                conflicts.append(ScheduleConflict(previous, interval, "travel", gap, needed))
+
+        heapq.heappush(active, (interval.end, seq, interval))
+    return conflicts
+
+
+def find_conflicts(
+    items: Iterable,
+    walk: Optional[WalkFunction] = None,
+    min_travel_minutes: int = 0,
+) -> list[ScheduleConflict]:
+    """Conflicts among meetings; each interval's key is the item itself."""
+    intervals = sorted(i for item in items for i in meeting_intervals(item, item))
+    return sweep(intervals, walk, min_travel_minutes)
+
+
+def _walk(walk: Optional[WalkFunction], a: str, b: str) -> int:
+    if walk is None or not a or not b:
+        return 0
+    return walk(a, b) or 0
+
+
+class ConflictIndex:
+    """
+    Precomputed meeting intervals for batch conflict checks.
+
+    Sections are added once under a key (usually the CRN); schedules are
+    then given as collections of keys. Walking times are memoized per
+    building pair.
+    """
+
+    def __init__(self, walk: Optional[WalkFunction] = None, min_travel_minutes: int = 0):
+        self._walk_fn = walk
+        self.min_travel_minutes = min_travel_minutes
+        self._intervals: dict[Hashable, list[Interval]] = {}
+        self._walks: dict[tuple[str, str], int] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._intervals
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, key: Hashable, item) -> None:
+        """Add a meeting (any object meeting_intervals accepts) under key."""
+        self._extend(key, meeting_intervals(item, key))
+
+    def add_meeting(
+        self,
+        key: Hashable,
+        days: int,
+        start: int,
+        end: int,
+        building: Optional[str] = None,
+    ) -> None:
+        """Add a meeting given as a day bitmask and minutes since midnight."""
+        building = building or ""
+        self._extend(key, [Interval(day, start, end, building, key) for day in day_indexes(days)])
+
+    def _extend(self, key: Hashable, intervals: list[Interval]) -> None:
+        merged = self._intervals.setdefault(key, [])
+        merged.extend(intervals)
+        merged.sort()
+
+    def walk(self, a: str, b: str) -> int:
+        """Memoized walking minutes between two buildings (0 if unknown)."""
+        pair = (a, b)
+        minutes = self._walks.get(pair)
+        if minutes is None:
+            minutes = self._walks[pair] = _walk(self._walk_fn, a, b)
+        return minutes
+
+    def intervals(self, keys: Iterable[Hashable]) -> list[Interval]:
+        """Sorted intervals of the given sections (unknown keys are skipped)."""
+        return list(heapq.merge(*(self._intervals[k] for k in keys if k in self._intervals)))
+
+    def conflicts(self, keys: Iterable[Hashable]) -> list[ScheduleConflict]:
+        """Overlaps and tight transitions within one schedule."""
+        return sweep(self.intervals(keys), self.walk, self.min_travel_minutes)
+
+    def score(self, keys: Iterable[Hashable]) -> ScheduleScore:
+        """
+        Counts and weekly walking for one schedule, without building conflicts.
+
+        overlaps counts meetings that start before an earlier one on the
+        same day has ended.
+        """
+        overlaps = tight = walking = 0
+        previous: Optional[Interval] = None
+        latest_end = -1
+        for interval in self.intervals(keys):
+            if previous is None or interval.day != previous.day:
+                previous, latest_end = None, -1
+            if interval.start < latest_end:
+                overlaps += 1
+            elif previous is not None and previous.building != interval.building:
+                minutes = self.walk(previous.building, interval.building)
+                walking += minutes
+                if interval.start - previous.end < max(minutes, self.min_travel_minutes):
+                    tight += 1
+            if interval.end >= latest_end:
+                previous, latest_end = interval, interval.end
+        return ScheduleScore(overlaps, tight, walking)
+
+    def score_many(self, schedules: Iterable[Iterable[Hashable]]) -> list[ScheduleScore]:
+        """Score many candidate schedules against the shared index."""
+        return [self.score(keys) for keys in schedules]
+
+    def overlaps_between(
+        self,
+        schedules: dict[Hashable, Iterable[Hashable]],
+    ) -> dict[tuple[Hashable, Hashable], int]:
+        """
+        Weekly minutes each pair of schedule owners are in class together.
+
+        schedules maps an owner (e.g., a user id) to section keys. All
+        owners' intervals are swept together, so the cost grows with the
+        number of overlapping pairs rather than with every pair of owners.
+        Pairs are ordered as given in schedules; pairs with no overlap are
+        omitted.
+        """
+        order = {owner: i for i, owner in enumerate(schedules)}
+        tagged = sorted(
+            (interval.day, interval.start, interval.end, order[owner], owner)
+            for owner, keys in schedules.items()
+            for key in set(keys)
+            for interval in self._intervals.get(key, ())
+        )
+
+        together: dict[tuple[Hashable, Hashable], int] = {}
+        active: list[tuple[int, int, Hashable]] = []  # (end, rank, owner)
+        day = None
+        for interval_day, start, end, rank, owner in tagged:
+            if interval_day != day:
+                day, active = interval_day, []
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for other_end, other_rank, other in active:
+                if other_rank == rank:
+                    continue
+                pair = (other, owner) if other_rank < rank else (owner, other)
+                together[pair] = together.get(pair, 0) + min(end, other_end) - start
+            heapq.heappush(active, (end, rank, owner))
+        return together
@@ -0,0 +1,330 @@
+"""
+Multi-modal walk + bus trip planning over the campus graph.
+
+Finds the earliest-arrival itinerary between two buildings for a given
+departure time and day, combining:
+- walking from the origin to nearby stops, between stops (transfers) and
+  from stops to the destination, using the graph's walking estimates
+- riding each BusRoute along its stop order, in both directions, with
+  departures every frequency_minutes within first/last departure and only
+  on the route's days of operation
+
+Routing is time-dependent Dijkstra on earliest arrival. Each stop has
+two labels, one for arriving on foot and one for arriving by bus, since
+only the latter may continue with a transfer walk (a walk leg never
+follows another walk leg). With frequency-based service a later arrival
+never leads to an earlier departure, so the first time a label is
+settled is its earliest arrival. The direct walk is always a candidate,
+so transit is only suggested when it is strictly faster.
+"""
+import heapq
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from src.models.meeting_time import format_clock, parse_clock
+
+if TYPE_CHECKING:
+    from src.models.campus_graph import CampusGraph
+
+# Average bus speed including stops, and time spent at each stop
+BUS_SPEED_MPS = 6.0
+DWELL_MINUTES = 1
+
+DEFAULT_MAX_WALK_TO_STOP = 8
+MAX_TRANSFER_WALK = 5
+
+# Planned trips remembered per router
+TRIP_CACHE_SIZE = 4096
+
+
+@dataclass
+class TripLeg:
+    """One walking or riding segment of an itinerary."""
+    mode: str  # "walk" or "bus"
+    from_place: str
+    to_place: str
+    depart: int  # minutes since midnight
+    arrive: int
+    route_id: Optional[str] = None
+    route_name: Optional[str] = None
+
+    @property
+    def minutes(self) -> int:
+        return self.arrive - self.depart
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "from": self.from_place,
+            "to": self.to_place,
+            "depart": format_clock(self.depart),
+            "arrive": format_clock(self.arrive),
+            "minutes": self.minutes,
+            "route_id": self.route_id,
+            "route": self.route_name,
+        }
+
+
+@dataclass
+class Itinerary:
+    """Fastest way between two buildings for a departure time."""
+    from_building: str
+    to_building: str
+    depart: int
+    arrive: int
+    legs: list[TripLeg] = field(default_factory=list)
+
+    @property
+    def total_minutes(self) -> int:
+        return self.arrive - self.depart
+
+    @property
+    def mode(self) -> str:
+        return "transit" if any(leg.mode == "bus" for leg in self.legs) else "walk"
+
+    @property
+    def walk_minutes(self) -> int:
+        return sum(leg.minutes for leg in self.legs if leg.mode == "walk")
+
+    @property
+    def ride_minutes(self) -> int:
+        return sum(leg.minutes for leg in self.legs if leg.mode == "bus")
+
+    @property
+    def wait_minutes(self) -> int:
+        return self.total_minutes - self.walk_minutes - self.ride_minutes
+
+    @property
+    def transfers(self) -> int:
+        return max(sum(1 for leg in self.legs if leg.mode == "bus") - 1, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "from": self.from_building,
+            "to": self.to_building,
+            "mode": self.mode,
+            "depart": format_clock(self.depart),
+            "arrive": format_clock(self.arrive),
+            "total_minutes": self.total_minutes,
+            "walk_minutes": self.walk_minutes,
+            "ride_minutes": self.ride_minutes,
+            "wait_minutes": self.wait_minutes,
+            "transfers": self.transfers,
+            "legs": [leg.to_dict() for leg in self.legs],
+        }
+
+
+@dataclass
+class _Pattern:
+    """One direction of a route: located stops in order with ride offsets."""
+    route_id: str
+    route_name: str
+    stops: list[str]
+    offsets: list[int]  # minutes from the first stop
+    first: int  # first departure from stops[0]
+    last: int
+    headway: int
+    days: str
+
+    def next_departure(self, index: int, t: int) -> Optional[int]:
+        """Earliest time at or after t that a bus leaves stops[index]."""
+        base = self.first + self.offsets[index]
+        n = max(0, math.ceil((t - base) / self.headway))
+        if self.first + n * self.headway > self.last:
+            return None
+        return base + n * self.headway
+
+
+class TransitRouter:
+    """Earliest-arrival walk + bus routing between buildings."""
+
+    def __init__(self, graph: "CampusGraph", max_walk_to_stop: int = DEFAULT_MAX_WALK_TO_STOP):
+        self.graph = graph
+        self.max_walk_to_stop = max_walk_to_stop
+        self.patterns: list[_Pattern] = []
+        self._stop_patterns: dict[str, list[tuple[int, int]]] = {}  # stop -> (pattern, index)
+        self._transfers: dict[str, list[tuple[str, int]]] = {}
+        self._cache: OrderedDict[tuple, Optional[Itinerary]] = OrderedDict()
+        self._cache_lock = threading.Lock()  # plans run in worker threads
+        self._build()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    def _build(self):
+        graph = self.graph
+        for route in graph.bus_routes.values():
+            stops = [s for s in route.stops if s in graph.bus_stops and graph.bus_stops[s].location]
+            if len(stops) < 2:
+                continue
+            first = parse_clock(route.first_departure) if route.first_departure else 0
+            last = parse_clock(route.last_departure) if route.last_departure else 24 * 60
+            if first is None:
+                first = 0
+            if last is None:
+                last = 24 * 60
+            elif last <= first:
+                last += 24 * 60  # "12:00 am" ends at midnight
+            for ordered in (stops, stops[::-1]):
+                offsets = [0]
+                for a, b in zip(ordered, ordered[1:]):
+                    meters = graph.bus_stops[a].location.distance_to(graph.bus_stops[b].location)
+                    ride = math.ceil(meters / BUS_SPEED_MPS / 60) + DWELL_MINUTES
+                    offsets.append(offsets[-1] + ride)
+                self.patterns.append(_Pattern(
+                    route_id=route.id,
+                    route_name=route.short_name or route.name,
+                    stops=ordered,
+                    offsets=offsets,
+                    first=first,
+                    last=last,
+                    headway=route.frequency_minutes or 10,
+                    days=route.days_of_operation,
+                ))
+
+        for p, pattern in enumerate(self.patterns):
+            for i, stop_id in enumerate(pattern.stops):
+                self._stop_patterns.setdefault(stop_id, []).append((p, i))
+
+        for stop_id in self._stop_patterns:
+            location = graph.bus_stops[stop_id].location
+            self._transfers[stop_id] = [
+                (other.id, walk)
+                for other, walk in graph.stops_within_walk(location, MAX_TRANSFER_WALK)
+                if other.id != stop_id and other.id in self._stop_patterns
+            ]
+
+    def plan(
+        self,
+        from_building: str,
+        to_building: str,
+        depart: int,
+        day: str = "M",
+    ) -> Optional[Itinerary]:
+        """
+        Fastest itinerary leaving at depart (minutes since midnight) on day.
+
+        Returns None if either building is unknown or has no location.
+        """
+        graph = self.graph
+        origin = graph.get_building(from_building)
+        dest = graph.get_building(to_building)
+        if not origin or not dest or not origin.location or not dest.location:
+            return None
+
+        key = (origin.id, dest.id, depart, day)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        itinerary = self._search(origin, dest, depart, day)
+        with self._cache_lock:
+            self._cache[key] = itinerary
+            if len(self._cache) > TRIP_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return itinerary
+
+    def _search(self, origin, dest, depart: int, day: str) -> Itinerary:
+        graph = self.graph
+        walk_direct = graph.walking_time(origin.id, dest.id) or 0
+        best_arrival = depart + walk_direct
+        best_legs = [TripLeg("walk", origin.name, dest.name, depart, best_arrival)]
+        if origin.id == dest.id or not self.patterns:
+            return Itinerary(origin.name, dest.name, depart, best_arrival, best_legs)
+
+        running = [day in p.days for p in self.patterns]
+        egress = {
+            stop.id: walk
+            for stop, walk in graph.stops_within_walk(dest.location, self.max_walk_to_stop)
+            if stop.id in self._stop_patterns
+        }
+        if not egress:
+            return Itinerary(origin.name, dest.name, depart, best_arrival, best_legs)
+
+        # Earliest arrival per label, and the leg that achieved it. A label
+        # is (stop, rode): whether the stop was reached by bus.
+        arrival: dict[tuple[str, bool], int] = {}
+        came_by: dict[tuple[str, bool], tuple[Optional[tuple[str, bool]], TripLeg]] = {}
+        heap: list[tuple[int, str, bool]] = []
+        for stop, walk in graph.stops_within_walk(origin.location, self.max_walk_to_stop):
+            if stop.id not in self._stop_patterns:
+                continue
+            t = depart + walk
+            label = (stop.id, False)
+            if t < arrival.get(label, math.inf):
+                arrival[label] = t
+                came_by[label] = (None, TripLeg("walk", origin.name, stop.name, depart, t))
+                heapq.heappush(heap, (t, stop.id, False))
+
+        settled = set()
+        best_label = None
+        while heap:
+            t, stop_id, rode = heapq.heappop(heap)
+            label = (stop_id, rode)
+            if label in settled:
+                continue
+            settled.add(label)
+            if t >= best_arrival:
+                break
+
+            if rode and stop_id in egress and t + egress[stop_id] < best_arrival:
+                best_arrival = t + egress[stop_id]
+                best_label = label
+
+            def relax(target: tuple[str, bool], at: int, leg: TripLeg):
+                if at < arrival.get(target, math.inf) and at < best_arrival:
+                    arrival[target] = at
+                    came_by[target] = (label, leg)
+                    heapq.heappush(heap, (at, *target))
+
+            stop_name = graph.bus_stops[stop_id].name
+            for p, i in self._stop_patterns[stop_id]:
+                if not running[p]:
+                    continue
+                pattern = self.patterns[p]
+                board = pattern.next_departure(i, t)
+                if board is None:
+                    continue
+                for j in range(i + 1, len(pattern.stops)):
+                    target = pattern.stops[j]
+                    at = board + pattern.offsets[j] - pattern.offsets[i]
+                    relax((target, True), at, TripLeg(
+                        "bus", stop_name, graph.bus_stops[target].name, board, at,
+                        route_id=pattern.route_id, route_name=pattern.route_name,
+                    ))
+
+            # A walk leg never follows another walk leg, and walking to a
+            # stop is pointless once a bus gets there no later
+            if rode:
+                for other, walk in self._transfers[stop_id]:
+                    at = t + walk
+                    if arrival.get((other, True), math.inf) <= at:
+                        continue
+                    leg = TripLeg("walk", stop_name, graph.bus_stops[other].name, t, at)
+                    relax((other, False), at, leg)
+
+        if best_label is None:
+            return Itinerary(origin.name, dest.name, depart, best_arrival, best_legs)
+
+        legs = []
+        label = best_label
+        while label is not None:
+            previous, leg = came_by[label]
+            legs.append(leg)
+            label = previous
+        legs.reverse()
+        best_stop = best_label[0]
+        t = arrival[best_label]
+        egress_leg = TripLeg("walk", graph.bus_stops[best_stop].name, dest.name, t, best_arrival)
+        legs.append(egress_leg)
+        return Itinerary(origin.name, dest.name, depart, best_arrival, legs)
@@ -0,0 +1,244 @@
+"""
+Content-addressed cache for parsed schedules.
+
+Parsed schedules are stored on disk keyed by the SHA-256 of the source
+(PDF bytes or CSV text) plus the parser name and version, so re-importing
+an unchanged file skips parsing entirely. Bumping a parser's PARSER_VERSION
+invalidates its entries.
+
+Each entry is two files:
+- <key>.courses.gz: gzip JSON lines, one positional row per course
+- <key>.json: metadata, errors and warnings, written last to mark the
+  entry complete
+
+Courses are written as they stream past and read back the same way, so
+neither side holds a whole schedule in memory.
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.config import settings
+from src.models.course import Course, CourseSection, ScheduleMetadata
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = "1"
+
+_SECTION_FIELDS = tuple(f.name for f in fields(CourseSection))
+
+
+@dataclass
+class CachedParse:
+    """A complete cache entry."""
+    metadata: ScheduleMetadata
+    errors: list[str]
+    warnings: list[str]
+    courses_path: Path
+
+    def iter_courses(self) -> Iterator[Course]:
+        """Stream cached courses back in their original order."""
+        with gzip.open(self.courses_path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield _course_from_row(json.loads(line))
+
+    def load_courses(self) -> list[Course]:
+        """Load every cached course."""
+        return list(self.iter_courses())
+
+
+def _course_to_row(course: Course) -> list:
+    return [
+        course.subject,
+        course.course_number,
+        course.title,
+        course.department,
+        course.bulletin_url,
+        [[getattr(s, name) for name in _SECTION_FIELDS] for s in course.sections],
+    ]
+
+
+def _course_from_row(row: list) -> Course:
+    subject, course_number, title, department, bulletin_url, sections = row
+    return Course(
+        subject=subject,
+        course_number=course_number,
+        title=title,
+        department=department,
+        bulletin_url=bulletin_url,
+        sections=[CourseSection(**dict(zip(_SECTION_FIELDS, values))) for values in sections],
+    )
+
+
+class ParseCache:
+    """On-disk parse cache keyed by source hash and parser version."""
+
+    def __init__(self, cache_dir: str | Path | None = None, enabled: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir or settings.parse_cache_dir)
+        self.enabled = settings.parse_cache_enabled if enabled is None else enabled
+
+    def _key(self, source_hash: str, parser: str, version: str) -> str:
+        return f"{parser}-{CACHE_FORMAT}.{version}-{source_hash}"
+
+    def get(self, source_hash: str, parser: str, version: str) -> Optional[CachedParse]:
+        """Return the cached parse for a source, or None on a miss."""
+        if not self.enabled or not source_hash:
+            return None
+
+        key = self._key(source_hash, parser, version)
+        meta_path = self.cache_dir / f"{key}.json"
+        courses_path = self.cache_dir / f"{key}.courses.gz"
+        if not meta_path.exists() or not courses_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            metadata = ScheduleMetadata(
+                term=meta["term"],
+                source_url=meta["source_url"],
+                parse_date=datetime.fromisoformat(meta["parse_date"]),
+                report_date=meta["report_date"],
+                total_courses=meta["total_courses"],
+                total_sections=meta["total_sections"],
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {key}: {e}")
+            return None
+
+        logger.info(f"Parse cache hit for {parser} {source_hash[:12]}")
+        return CachedParse(
+            metadata=metadata,
+            errors=meta["errors"],
+            warnings=meta["warnings"],
+            courses_path=courses_path,
+        )
+
+    def record(
+        self,
+        source_hash: str,
+        parser: str,
+        version: str,
+        courses: Iterable[Course],
+        metadata: ScheduleMetadata,
+        errors: Optional[list[str]] = None,
+        warnings: Optional[list[str]] = None,
+    ) -> Iterator[Course]:
+        """
+        Pass courses through while writing them to the cache.
+
+        metadata, errors and warnings are read once the stream is exhausted,
+        so they may be objects a streaming parser is still filling in. The
+        entry is only stored if every course was consumed.
+        """
+        if not self.enabled or not source_hash:
+            yield from courses
+            return
+
+        key = self._key(source_hash, parser, version)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        courses_tmp = self.cache_dir / f"{key}.courses.gz{suffix}"
+        meta_tmp = self.cache_dir / f"{key}.json{suffix}"
+
+        # A cache write failure must never cut the stream short
+        writer = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            writer = gzip.open(courses_tmp, "wt", encoding="utf-8", compresslevel=6)
+        except OSError as e:
+            logger.warning(f"Could not write parse cache entry {key}: {e}")
+
+        total_courses: set[str] = set()
+        total_sections = 0
+        complete = False
+        try:
+            for course in courses:
+                if writer is not None:
+                    try:
+                        writer.write(json.dumps(_course_to_row(course), separators=(",", ":")))
+                        writer.write("\n")
+                    except OSError as e:
+                        logger.warning(f"Could not write parse cache entry {key}: {e}")
+                        writer.close()
+                        writer = None
+                total_courses.add(course.course_code)
+                total_sections += len(course.sections)
+                yield course
+
+            if writer is not None:
+                writer.close()
+                meta = {
+                    "term": metadata.term,
+                    "source_url": metadata.source_url,
+                    "parse_date": metadata.parse_date.isoformat(),
+                    "report_date": metadata.report_date,
+                    "total_courses": len(total_courses),
+                    "total_sections": total_sections,
+                    "errors": list(errors or []),
+                    "warnings": list(warnings or []),
+                }
+                try:
+                    meta_tmp.write_text(json.dumps(meta, separators=(",", ":")), encoding="utf-8")
+
+                    # Courses first, metadata last: the .json file marks a complete entry
+                    os.replace(courses_tmp, self.cache_dir / f"{key}.courses.gz")
+                    os.replace(meta_tmp, self.cache_dir / f"{key}.json")
+                    complete = True
+                    logger.info(f"Cached parse for {parser} {source_hash[:12]}")
+                    self._prune(source_hash, parser, key)
+                except OSError as e:
+                    logger.warning(f"Could not write parse cache entry {key}: {e}")
+        finally:
+            if writer is not None:
+                writer.close()
+            if not complete:
+                courses_tmp.unlink(missing_ok=True)
+                meta_tmp.unlink(missing_ok=True)
+
+    def put(
+        self,
+        source_hash: str,
+        parser: str,
+        version: str,
+        courses: Iterable[Course],
+        metadata: ScheduleMetadata,
+        errors: Optional[list[str]] = None,
+        warnings: Optional[list[str]] = None,
+    ) -> None:
+        """Store an already-parsed schedule."""
+        for _ in self.record(source_hash, parser, version, courses, metadata, errors, warnings):
+            pass
+
+    def _prune(self, source_hash: str, parser: str, keep: str) -> None:
+        """Remove entries for the same source written by other parser versions."""
+        for path in self.cache_dir.glob(f"{parser}-*-{source_hash}.*"):
+            if not path.name.startswith(f"{keep}."):
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number of files removed."""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            if path.is_file():
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """Get the process-wide parse cache."""
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
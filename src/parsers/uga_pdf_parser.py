@@ -9,19 +9,44 @@ Handles the complex format of UGA's online class schedule PDFs including:
 - Missing instructors/sections
 - Negative seat availability (waitlist)
 - Courses spanning multiple pages
+
+Large PDFs can be parsed in parallel: page ranges are extracted and
+classified in a process pool, then replayed in page order so course/section
+continuity across range boundaries matches a sequential parse exactly.
+
+iter_courses() streams courses as they complete instead of building the
+whole schedule in memory.
 """
+import os
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import pdfplumber
 
 from src.models.course import Course, CourseSection, Schedule, ScheduleMetadata
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing rules change so cached parses are discarded
+PARSER_VERSION = "1"
+
+# Below this many pages, process pool start-up costs more than it saves
+PARALLEL_MIN_PAGES = 16
+
+# Upper bound on worker processes for a parallel parse
+MAX_PARSE_WORKERS = 8
+
+# Page ranges per worker; smaller ranges let results stream back sooner
+RANGES_PER_WORKER = 4
+
+# A page event is (kind, payload): kind is one of "course", "section",
+# "warning", "term", "report_date"
+PageEvent = tuple[str, object]
+
 
 @dataclass
 class ParseResult:
@@ -91,6 +116,33 @@ class UGAPDFParser:
 
     FOOTER_PATTERN = r'^Report ID: Schedule of Online Classes.*Page: \d+ of \d+'
 
+    # Precompiled line classification. Headers, course lines and section
+    # lines are told apart by first character before any regex runs.
+    _HEADER_RE = re.compile('|'.join(f'(?:{p})' for p in HEADER_PATTERNS + [FOOTER_PATTERN]))
+    _HEADER_FIRST_CHARS = frozenset(p[1] for p in HEADER_PATTERNS)
+    _COURSE_RE = re.compile(r'([A-Z]{2,5})\s+(\d{4}[A-Z]?[L]?)\s+(.+)')
+    _COURSE_URL_RE = re.compile(r'([A-Z]{2,5})\s+(\d{4}[A-Z]?)\s+(.+)')
+    _SECTION_RE = re.compile(r'\d{5}\s')
+    _SECTION_LIKE_RE = re.compile(r'\d+\s+[A-Z]\s+\d+\.\d+')
+    _TERM_RE = re.compile(r'Term\s*(\w+\s*\d{4})')
+    _REPORT_DATE_RE = re.compile(r'Report Run Date:\s*(.+)')
+    _TIME_RANGE_RE = re.compile(
+        r'(\d{1,2}:\d{2})\s*([ap]m)?\s*-\s*(\d{1,2}:\d{2})\s*([ap]m)?', re.IGNORECASE
+    )
+    _TIME_PREFIX_RE = re.compile(r'([ap]m)\s*-', re.IGNORECASE)
+    _DEPT_INDICATOR_RES = [
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r'\s+(School of \w+)$',
+            r'\s+(College of \w+)$',
+            r'\s+(Dept\.? of \w+)$',
+            r'\s+(\w+ Sciences?)$',
+            r'\s+(\w+ Education)$',
+            r'\s+(\w+ Psychology)$',
+            r'\s+(\w+ Studies)$',
+        )
+    ]
+
     # Parts of term we recognize
     TERM_PATTERNS = [
         'Full Term',
@@ -104,68 +156,182 @@ class UGAPDFParser:
     def __init__(self):
         self.errors: list[str] = []
         self.warnings: list[str] = []
-        self._current_course: Optional[Course] = None
-        self._courses: dict[str, Course] = {}  # Key: course_code
+        self.metadata: Optional[ScheduleMetadata] = None
 
         # Build department regex - sort by length (longest first)
         sorted_depts = sorted(self.KNOWN_DEPARTMENTS, key=len, reverse=True)
         escaped_depts = [re.escape(d) for d in sorted_depts]
         self._dept_pattern = re.compile(r'\s+(' + '|'.join(escaped_depts) + r')$', re.IGNORECASE)
 
-    def parse_file(self, file_path: str | Path, source_url: str = "") -> ParseResult:
-        """Parse a UGA schedule PDF file."""
+    def parse_file(
+        self,
+        file_path: str | Path,
+        source_url: str = "",
+        parallel: bool = False,
+        workers: Optional[int] = None,
+    ) -> ParseResult:
+        """
+        Parse a UGA schedule PDF file.
+
+        Args:
+            file_path: Path to the PDF
+            source_url: URL the PDF was downloaded from
+            parallel: Extract page ranges in a process pool
+            workers: Worker processes for a parallel parse (default: CPU count)
+        """
+        courses: dict[str, Course] = {}  # Key: course_code
+        for course in self.iter_courses(file_path, source_url, parallel, workers):
+            existing = courses.get(course.course_code)
+            if existing:
+                # Course already seen earlier (likely spanning pages)
+                existing.sections.extend(course.sections)
+            else:
+                courses[course.course_code] = course
+
+        # Finalize
+        metadata = self.metadata
+        metadata.total_courses = len(courses)
+        metadata.total_sections = sum(len(c.sections) for c in courses.values())
+
+        schedule = Schedule(metadata=metadata, courses=list(courses.values()))
+
+        logger.info(
+            f"Parsed {metadata.total_courses} courses with "
+            f"{metadata.total_sections} sections"
+        )
+
+        return ParseResult(
+            schedule=schedule,
+            errors=self.errors,
+            warnings=self.warnings
+        )
+
+    def iter_courses(
+        self,
+        file_path: str | Path,
+        source_url: str = "",
+        parallel: bool = False,
+        workers: Optional[int] = None,
+    ) -> Iterator[Course]:
+        """
+        Stream courses from a UGA schedule PDF as each one is complete.
+
+        A course is complete when the next course line starts. A course that
+        reappears later in the PDF is yielded again with only its new
+        sections, so consumers should merge by course_code.
+
+        self.metadata is set up front and gets the term and report date once
+        the first course has been yielded; errors and warnings accumulate as
+        parsing proceeds.
+        """
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"PDF file not found: {file_path}")
 
         self.errors = []
         self.warnings = []
-        self._courses = {}
-        self._current_course = None
-
-        metadata = ScheduleMetadata(
+        self.metadata = ScheduleMetadata(
             term="",
             source_url=source_url,
             parse_date=datetime.now(),
         )
+        return self._stream_courses(file_path, parallel, workers)
 
+    def _stream_courses(
+        self,
+        file_path: Path,
+        parallel: bool,
+        workers: Optional[int],
+    ) -> Iterator[Course]:
+        """Replay page events in order, yielding each course once complete."""
+        current: Optional[Course] = None
+        for events in self._iter_page_events(file_path, parallel, workers):
+            for kind, payload in events:
+                if kind == "course":
+                    if current and current.course_code == payload.course_code:
+                        logger.debug(f"Merging sections for {payload.course_code}")
+                        continue
+                    if current:
+                        yield current
+                    current = payload
+                elif kind == "section":
+                    section, orphan = payload
+                    if current:
+                        current.sections.append(section)
+                    elif orphan:
+                        self.warnings.append(orphan)
+                elif kind == "warning":
+                    self.warnings.append(payload)
+                elif kind == "term":
+                    self.metadata.term = payload
+                elif kind == "report_date":
+                    self.metadata.report_date = payload
+
+        if current:
+            yield current
+
+    def _iter_page_events(
+        self,
+        file_path: Path,
+        parallel: bool,
+        workers: Optional[int],
+    ) -> Iterator[list[PageEvent]]:
+        """Yield classified page events in page order."""
         with pdfplumber.open(file_path) as pdf:
-            logger.info(f"Parsing PDF with {len(pdf.pages)} pages")
+            page_count = len(pdf.pages)
+            logger.info(f"Parsing PDF with {page_count} pages")
 
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
-                if not text:
-                    self.warnings.append(f"Page {page_num}: No text extracted")
-                    continue
+            if not parallel or page_count < PARALLEL_MIN_PAGES:
+                for page_num, page in enumerate(pdf.pages, 1):
+                    yield self._extract_page_events(page, page_num)
+                return
 
-                lines = text.split('\n')
-                self._parse_page_lines(lines, page_num, metadata)
+        yield from self._extract_parallel(file_path, page_count, workers)
 
-        # Finalize
-        courses = list(self._courses.values())
-        metadata.total_courses = len(courses)
-        metadata.total_sections = sum(len(c.sections) for c in courses)
+    def _extract_parallel(
+        self,
+        file_path: Path,
+        page_count: int,
+        workers: Optional[int],
+    ) -> Iterator[list[PageEvent]]:
+        """Extract page events for contiguous page ranges in a process pool."""
+        workers = workers or min(os.cpu_count() or 1, MAX_PARSE_WORKERS)
+        workers = max(1, min(workers, page_count))
+
+        # Contiguous ranges, yielded in page order for a deterministic merge
+        chunk = -(-page_count // (workers * RANGES_PER_WORKER))
+        ranges = [
+            (start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)
+        ]
+        logger.info(f"Extracting {page_count} pages in {len(ranges)} ranges with {workers} workers")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(
+                _extract_page_range,
+                [str(file_path)] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
 
-        schedule = Schedule(metadata=metadata, courses=courses)
+    def _extract_page_events(self, page, page_num: int) -> list[PageEvent]:
+        """Extract text from one page and classify its lines."""
+        text = page.extract_text()
+        if not text:
+            return [("warning", f"Page {page_num}: No text extracted")]
+        return self._classify_page_lines(text.split('\n'), page_num)
 
-        logger.info(
-            f"Parsed {metadata.total_courses} courses with "
-            f"{metadata.total_sections} sections"
-        )
+    def _classify_page_lines(self, lines: list[str], page_num: int) -> list[PageEvent]:
+        """
+        Classify lines from a single page into page events.
 
-        return ParseResult(
-            schedule=schedule,
-            errors=self.errors,
-            warnings=self.warnings
-        )
+        Classification needs no state from earlier pages; which course a
+        section belongs to is resolved when events are applied in order.
+        """
+        events: list[PageEvent] = []
+        warnings = self.warnings
+        self.warnings = []
 
-    def _parse_page_lines(
-        self,
-        lines: list[str],
-        page_num: int,
-        metadata: ScheduleMetadata
-    ) -> None:
-        """Parse lines from a single page."""
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
             if not line:
@@ -174,53 +340,77 @@ class UGAPDFParser:
             # Extract metadata from first page
             if page_num == 1:
                 if 'For The Term' in line:
-                    match = re.search(r'Term\s*(\w+\s*\d{4})', line)
+                    match = self._TERM_RE.search(line)
                     if match:
-                        metadata.term = match.group(1)
+                        events.append(("term", match.group(1)))
                 elif 'Report Run Date:' in line:
-                    match = re.search(r'Report Run Date:\s*(.+)', line)
+                    match = self._REPORT_DATE_RE.search(line)
                     if match:
-                        metadata.report_date = match.group(1).strip()
-
-            # Skip headers and footers
-            if self._is_header_or_footer(line):
-                continue
-
-            # Try to parse as course line
-            course = self._try_parse_course_line(line)
-            if course:
-                self._add_or_merge_course(course)
-                continue
+                        events.append(("report_date", match.group(1).strip()))
+
+            # Dispatch each line to exactly one handler
+            first = line[0]
+            if first.isdigit():
+                # Section lines start with a 5-digit CRN
+                if self._SECTION_RE.match(line):
+                    section = self._try_parse_section_line(line, page_num, line_num)
+                    events.extend(("warning", w) for w in self.warnings)
+                    self.warnings.clear()
+                    if section:
+                        # Only a warning if no course precedes it, even on earlier pages
+                        orphan = None
+                        if len(line) > 10:
+                            orphan = (
+                                f"Page {page_num}, line {line_num}: Could not parse: {line[:80]}"
+                            )
+                        events.append(("section", (section, orphan)))
+                        continue
+            elif 'A' <= first <= 'Z':
+                # Skip headers and footers
+                if first in self._HEADER_FIRST_CHARS and self._HEADER_RE.match(line):
+                    continue
 
-            # Try to parse as section line
-            section = self._try_parse_section_line(line, page_num, line_num)
-            if section and self._current_course:
-                self._current_course.sections.append(section)
-                continue
+                match = self._COURSE_RE.match(line)
+                if match:
+                    course = self._try_parse_course_line(line, match)
+                    if course:
+                        events.append(("course", course))
+                        continue
 
             # If we couldn't parse the line and it's not empty/header
-            if len(line) > 10 and not self._is_header_or_footer(line):
-                self.warnings.append(
-                    f"Page {page_num}, line {line_num}: Could not parse: {line[:80]}"
-                )
+            if len(line) > 10:
+                events.append((
+                    "warning",
+                    f"Page {page_num}, line {line_num}: Could not parse: {line[:80]}",
+                ))
+
+        self.warnings = warnings
+        return events
 
     def _is_header_or_footer(self, line: str) -> bool:
         """Check if line is a header or footer to skip."""
-        for pattern in self.HEADER_PATTERNS:
-            if re.match(pattern, line):
-                return True
-        if re.match(self.FOOTER_PATTERN, line):
-            return True
-        return False
-
-    def _try_parse_course_line(self, line: str) -> Optional[Course]:
-        """Try to parse a line as a course definition."""
+        if not line or line[0] not in self._HEADER_FIRST_CHARS:
+            return False
+        return bool(self._HEADER_RE.match(line))
+
+    def _try_parse_course_line(
+        self,
+        line: str,
+        match: Optional[re.Match] = None,
+    ) -> Optional[Course]:
+        """
+        Try to parse a line as a course definition.
+
+        Args:
+            line: The stripped line
+            match: _COURSE_RE match for the line, if the caller already ran it
+        """
         # Course lines start with: SUBJECT (2-5 uppercase letters) + space + COURSE_NUM (4 digits + optional letter)
         # Section lines start with 5-digit CRN, so we can distinguish them
-
-        # Skip if line starts with a digit (likely a section line)
-        if line and line[0].isdigit():
-            return None
+        if match is None:
+            match = self._COURSE_RE.match(line)
+            if not match:
+                return None
 
         # Check for bulletin URL format (original format)
         if 'bulletin.uga.edu' in line:
@@ -228,11 +418,11 @@ class UGAPDFParser:
             if len(parts) == 2:
                 text_part = parts[0].strip()
                 url = 'http' + parts[1].strip()
-                match = re.match(r'^([A-Z]{2,5})\s+(\d{4}[A-Z]?)\s+(.+)', text_part)
-                if match:
-                    subject = match.group(1)
-                    course_num = match.group(2)
-                    remainder = match.group(3).strip()
+                url_match = self._COURSE_URL_RE.match(text_part)
+                if url_match:
+                    subject = url_match.group(1)
+                    course_num = url_match.group(2)
+                    remainder = url_match.group(3).strip()
                     title, department = self._split_title_department(remainder)
                     return Course(
                         subject=subject,
@@ -243,17 +433,13 @@ class UGAPDFParser:
                     )
 
         # Parse format without URL: "AAEC 2580 Appl Microeconomic Principles Agricultural and Applied Econ"
-        match = re.match(r'^([A-Z]{2,5})\s+(\d{4}[A-Z]?[L]?)\s+(.+)', line)
-        if not match:
-            return None
-
         subject = match.group(1)
         course_num = match.group(2)
         remainder = match.group(3).strip()
 
         # Make sure this isn't actually a section line that got mismatched
         # Section lines have patterns like "0 A 3.0" after the CRN
-        if re.match(r'^\d+\s+[A-Z]\s+\d+\.\d+', remainder):
+        if self._SECTION_LIKE_RE.match(remainder):
             return None
 
         # Try to split title and department using known departments
@@ -277,18 +463,8 @@ class UGAPDFParser:
             return title, department
 
         # Fallback: look for common department indicators
-        dept_indicators = [
-            r'\s+(School of \w+)$',
-            r'\s+(College of \w+)$',
-            r'\s+(Dept\.? of \w+)$',
-            r'\s+(\w+ Sciences?)$',
-            r'\s+(\w+ Education)$',
-            r'\s+(\w+ Psychology)$',
-            r'\s+(\w+ Studies)$',
-        ]
-
-        for pattern in dept_indicators:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._DEPT_INDICATOR_RES:
+            match = pattern.search(text)
             if match:
                 return text[:match.start()].strip(), match.group(1)
 
@@ -338,7 +514,7 @@ class UGAPDFParser:
         CRN   SEC ST CRED      DAYS    TIME (split)         BLDG  ROOM  CAMPUS INSTR   T SIZE AVL
         """
         # Section lines start with a 5-digit CRN
-        if not re.match(r'^\d{5}\s', line):
+        if not self._SECTION_RE.match(line):
             return None
 
         # Tokenize the line
@@ -472,11 +648,7 @@ class UGAPDFParser:
                     time_str = ' '.join(time_parts)
                     # Try to extract start and end time from combined string
                     # Format: "11:35 am-12:55 pm" or "11:35" "am-12:55" "pm" -> "11:35 am-12:55 pm"
-                    time_match = re.search(
-                        r'(\d{1,2}:\d{2})\s*([ap]m)?\s*-\s*(\d{1,2}:\d{2})\s*([ap]m)?',
-                        time_str,
-                        re.IGNORECASE
-                    )
+                    time_match = self._TIME_RANGE_RE.search(time_str)
                     if time_match:
                         start_h = time_match.group(1)
                         start_ampm = time_match.group(2) or ''
@@ -486,7 +658,7 @@ class UGAPDFParser:
                         # If we have the am/pm in the middle part (like "am-12:55"), extract it
                         if not start_ampm:
                             # Look for am/pm before the dash
-                            prefix_match = re.search(r'([ap]m)\s*-', time_str, re.IGNORECASE)
+                            prefix_match = self._TIME_PREFIX_RE.search(time_str)
                             if prefix_match:
                                 start_ampm = prefix_match.group(1)
 
@@ -540,22 +712,26 @@ class UGAPDFParser:
         except (ValueError, TypeError):
             return 0
 
-    def _add_or_merge_course(self, course: Course) -> None:
-        """Add a new course or merge with existing (for courses spanning pages)."""
-        course_code = course.course_code
-        if course_code in self._courses:
-            # Course already exists (likely spanning pages)
-            self._current_course = self._courses[course_code]
-            logger.debug(f"Merging sections for {course_code}")
-        else:
-            self._courses[course_code] = course
-            self._current_course = course
-
 
-def parse_uga_schedule(file_path: str | Path, source_url: str = "") -> ParseResult:
+def _extract_page_range(file_path: str, start: int, end: int) -> list[PageEvent]:
+    """Extract and classify pages [start, end) of a PDF (process pool worker)."""
+    parser = UGAPDFParser()
+    events: list[PageEvent] = []
+    with pdfplumber.open(file_path) as pdf:
+        for index in range(start, end):
+            events.extend(parser._extract_page_events(pdf.pages[index], index + 1))
+    return events
+
+
+def parse_uga_schedule(
+    file_path: str | Path,
+    source_url: str = "",
+    parallel: bool = False,
+    workers: Optional[int] = None,
+) -> ParseResult:
     """Convenience function to parse a UGA schedule PDF."""
     parser = UGAPDFParser()
-    return parser.parse_file(file_path, source_url)
+    return parser.parse_file(file_path, source_url, parallel=parallel, workers=workers)
 
 
 if __name__ == "__main__":
@@ -9,23 +9,44 @@ Features:
 - Parses building and room data for campus mapping
 - Supports all available terms (Spring, Summer, Fall)
 - Real-time seat availability updates
+- Streaming course iteration for bounded-memory imports
+- Conditional downloads: unchanged CSVs cost a 304, changed ones are
+  streamed to disk through an incremental hash instead of held in memory
+- Multi-term scans: all terms downloaded concurrently over one pooled
+  client and parsed in parallel worker processes
 """
 import asyncio
 import csv
+import hashlib
 import io
 import logging
+import multiprocessing
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import httpx
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
 from src.models.course import Course, CourseSection, Schedule, ScheduleMetadata
+from src.parsers.parse_cache import CachedParse, get_parse_cache
+from src.services.source_state import SourceStateStore, SourceValidators, get_source_state_store
 
 logger = logging.getLogger(__name__)
 
+# Bump when CSV parsing rules change so cached parses are discarded
+PARSER_VERSION = "1"
+
+# Upper bound on worker processes for multi-term parsing
+MAX_PARSE_WORKERS = 4
+
+# Connection pool for the shared HTTP client
+MAX_CONNECTIONS = 10
+
 
 @dataclass
 class ScanProgress:
@@ -45,6 +66,28 @@ class BuildingInfo:
     campus: str
 
 
+@dataclass
+class CSVDownload:
+    """Result of a (conditional) CSV download."""
+    term: str
+    url: str
+    content_hash: str
+    changed: bool
+    path: Optional[str] = None  # Spooled body; None when the server sent a 304
+    encoding: str = "utf-8-sig"
+    # To record with commit_download() once the consumer has used the body
+    validators: Optional[SourceValidators] = None
+
+
+@dataclass
+class TermScanResult:
+    """Outcome of one term in a multi-term scan."""
+    term: str
+    schedule: Optional[Schedule] = None  # None if unchanged or failed
+    changed: bool = False
+    error: Optional[str] = None
+
+
 class UGAScheduleScanner:
     """Scans UGA Schedule of Classes using CSV export."""
 
@@ -57,11 +100,89 @@ class UGAScheduleScanner:
         "Fall 2026": "https://apps.reg.uga.edu/soc/fall.csv",
     }
 
-    def __init__(self, headless: bool = True):
+    # CSV columns read per row: field -> (candidate headers, value if absent).
+    # The first candidate present in the header wins.
+    CSV_FIELDS = {
+        "subject": (("SCHEDULE_OFFERING.SUBJECT",), ""),
+        "course_number": (("SCHEDULE_OFFERING.COURSE_NUMBER",), ""),
+        "title": (("SCHEDULE_OFFERING.TITLE_LONG_DESC", "SCHEDULE_OFFERING.TITLE_SHORT_DESC"), ""),
+        "crn": (("SCHEDULE_OFFERING.COURSE_REFERENCE_NUMBER",), ""),
+        "credits": (("SCHEDULE_OFFERING.MAX_CREDITS", "SCHEDULE_OFFERING.MIN_CREDITS"), ""),
+        "time": (("Time",), ""),
+        "building_code": (("Building",), ""),
+        "building_name": (("MEETING_TIME.BUILDING_DESC",), ""),
+        "room": (("Room",), ""),
+        "instructor_first": (("SCHEDULE_OFFERING.PRIMARY_INSTRUCTOR_FIRST_NAME",), ""),
+        "instructor_last": (("SCHEDULE_OFFERING.PRIMARY_INSTRUCTOR_LAST_NAME",), ""),
+        "campus": (("SCHEDULE_OFFERING.CAMPUS_DESC", "MEETING_TIME.COURSE_CAMPUS_DESC"), ""),
+        "part_of_term": (("STVPTRM.STVPTRM_DESC",), "Full Term"),
+        "max_seats": (("SCHEDULE_OFFERING.MAXIMUM_ENROLLMENT",), "0"),
+        "avail_seats": (("SCHEDULE_OFFERING.SEATS_AVAILABLE",), "0"),
+        "section": (("MEETING_TIME.SECTION",), ""),
+    }
+
+    # Day indicator columns, in display order
+    DAY_COLUMNS = [
+        ('MEETING_TIME.MONDAY_IND', 'M'),
+        ('MEETING_TIME.TUESDAY_IND', 'T'),
+        ('MEETING_TIME.WEDNESDAY_IND', 'W'),
+        ('MEETING_TIME.THURSDAY_IND', 'R'),
+        ('MEETING_TIME.FRIDAY_IND', 'F'),
+        ('MEETING_TIME.SATURDAY_IND', 'S'),
+        ('MEETING_TIME.SUNDAY_IND', 'U'),
+    ]
+
+    # CSV uses the day letter itself as indicator (M, T, W, R, F, S, U)
+    # or could be 1, Y, etc.
+    DAY_INDICATOR_VALUES = frozenset((
+        'M', 'T', 'W', 'R', 'F', 'S', 'U', '1', 'Y', 'YES', 'TRUE', 'X'
+    ))
+
+    # Bytes per chunk when streaming a CSV to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        headless: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
+        state_store: Optional[SourceStateStore] = None,
+        consumer: Optional[str] = None,
+    ):
         self.headless = headless
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._playwright = None
+        self._client = client
+        self._owns_client = client is None
+        self.state_store = state_store or get_source_state_store()
+        # Who uses the downloads (e.g. "import"). Each consumer keeps its own
+        # validators, so one seeing a new CSV does not hide the change from
+        # another; None shares the seat poll's state under the bare URL.
+        self.consumer = consumer
+
+    async def __aenter__(self) -> "UGAScheduleScanner":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """HTTP client reused for every download made by this scanner."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this scanner created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
 
     async def get_available_terms(self) -> list[str]:
         """Get list of available terms."""
@@ -70,45 +191,29 @@ class UGAScheduleScanner:
     async def scan_term(
         self,
         term: str,
-        progress_callback: Optional[callable] = None
-    ) -> Schedule:
+        progress_callback: Optional[callable] = None,
+        if_changed: bool = False,
+    ) -> Optional[Schedule]:
         """
         Scan all courses for a given term by downloading the CSV.
 
         Args:
             term: Term identifier (e.g., "Spring 2026")
             progress_callback: Optional async callback for progress updates
+            if_changed: Return None if the CSV is unchanged since the last scan
 
         Returns:
             Schedule object with all courses and sections
         """
-        csv_url = self.CSV_URLS.get(term)
-        if not csv_url:
-            raise ValueError(f"Unknown term: {term}. Available: {list(self.CSV_URLS.keys())}")
-
-        logger.info(f"Downloading CSV for {term} from {csv_url}")
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(csv_url)
-            response.raise_for_status()
-            csv_content = response.text
-
-        logger.info(f"Downloaded {len(csv_content)} bytes, parsing...")
+        result = await self.stream_term(term, if_changed=if_changed)
+        if result is None:
+            return None
+        metadata, stream, download = result
 
-        # Parse CSV
-        courses, total_sections = self._parse_csv(csv_content)
-
-        # Build schedule
-        metadata = ScheduleMetadata(
-            term=term,
-            source_url=csv_url,
-            parse_date=datetime.now(),
-            report_date=datetime.now().strftime("%m/%d/%Y"),
-            total_courses=len(courses),
-            total_sections=total_sections
-        )
-
-        schedule = Schedule(metadata=metadata, courses=list(courses.values()))
+        courses_by_code, total_sections = self._merge_courses(stream)
+        courses = list(courses_by_code.values())
+        schedule = self._build_schedule(metadata, courses, total_sections)
+        self.commit_download(download)
 
         logger.info(
             f"Completed {term}: {metadata.total_courses} courses, "
@@ -125,6 +230,253 @@ class UGAScheduleScanner:
 
         return schedule
 
+    async def stream_term(
+        self,
+        term: str,
+        if_changed: bool = False,
+    ) -> Optional[tuple[ScheduleMetadata, Iterator[Course], CSVDownload]]:
+        """
+        Download a term's CSV and stream its courses.
+
+        Returns the schedule metadata (totals are left at zero), an
+        iterator of courses for CourseService.import_course_stream and the
+        download, or None when if_changed is set and the CSV has not
+        changed. Pass the download to commit_download() once the courses
+        are stored; until then the CSV still counts as changed.
+
+        An unchanged CSV is served from the parse cache without being
+        downloaded again; a changed one is parsed from its spool file as
+        the iterator is consumed.
+        """
+        prepared = await self._prepare_term(term, if_changed)
+        if prepared is None:
+            return None
+        metadata, cached, download = prepared
+
+        if cached:
+            return metadata, cached.iter_courses(), download
+        courses = get_parse_cache().record(
+            download.content_hash, "uga_csv", PARSER_VERSION,
+            self._iter_downloaded_courses(download), metadata,
+        )
+        return metadata, courses, download
+
+    async def scan_terms(
+        self,
+        terms: Optional[list[str]] = None,
+        if_changed: bool = False,
+        workers: Optional[int] = None,
+    ) -> list[TermScanResult]:
+        """
+        Scan several terms at once.
+
+        Downloads run concurrently over this scanner's pooled client, then
+        changed CSVs are parsed in parallel worker processes, so a refresh
+        takes about as long as the slowest single term. Daemonic processes
+        (Celery prefork workers) cannot start children, so there, or if the
+        pool cannot start, terms are parsed one after another. A failing
+        term is reported in its result rather than failing the others.
+
+        Args:
+            terms: Terms to scan (default: every term in CSV_URLS)
+            if_changed: Skip parsing terms whose CSV has not changed
+            workers: Parse processes (default: min(cpu count, MAX_PARSE_WORKERS))
+        """
+        terms = list(terms or self.CSV_URLS)
+        prepared = await asyncio.gather(
+            *(self._prepare_term(term, if_changed) for term in terms),
+            return_exceptions=True,
+        )
+
+        results: dict[str, TermScanResult] = {}
+        to_parse: list[tuple[str, ScheduleMetadata, CSVDownload]] = []
+        for term, outcome in zip(terms, prepared):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Scan failed for {term}: {outcome}")
+                results[term] = TermScanResult(term=term, error=str(outcome))
+            elif outcome is None:
+                results[term] = TermScanResult(term=term)
+            else:
+                metadata, cached, download = outcome
+                if cached:
+                    courses, total_sections = self._merge_courses(cached.iter_courses())
+                    results[term] = TermScanResult(
+                        term=term,
+                        schedule=self._build_schedule(
+                            metadata, list(courses.values()), total_sections
+                        ),
+                        changed=download.changed,
+                    )
+                    self.commit_download(download)
+                else:
+                    to_parse.append((term, metadata, download))
+
+        if len(to_parse) <= 1 or multiprocessing.current_process().daemon:
+            parsed = _parse_sequentially(to_parse)
+        else:
+            workers = workers or min(os.cpu_count() or 1, MAX_PARSE_WORKERS)
+            workers = max(1, min(workers, len(to_parse)))
+            logger.info(f"Parsing {len(to_parse)} terms with {workers} workers")
+            loop = asyncio.get_running_loop()
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        loop.run_in_executor(pool, _parse_downloaded_csv, download, metadata)
+                        for _, metadata, download in to_parse
+                    ]
+                    parsed = await asyncio.gather(*futures, return_exceptions=True)
+            except Exception as e:
+                # Raised while starting the workers, before any term was parsed
+                logger.warning(f"Parse pool unavailable ({e}), parsing terms sequentially")
+                parsed = _parse_sequentially(to_parse)
+
+        for (term, metadata, download), outcome in zip(to_parse, parsed):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Parse failed for {term}: {outcome}")
+                results[term] = TermScanResult(term=term, error=str(outcome))
+                continue
+            courses, total_sections = outcome
+            results[term] = TermScanResult(
+                term=term,
+                schedule=self._build_schedule(metadata, courses, total_sections),
+                changed=download.changed,
+            )
+            self.commit_download(download)
+
+        return [results[term] for term in terms]
+
+    async def _prepare_term(
+        self,
+        term: str,
+        if_changed: bool,
+    ) -> Optional[tuple[ScheduleMetadata, Optional[CachedParse], CSVDownload]]:
+        """
+        Download a term's CSV and look up its cached parse.
+
+        Returns None when if_changed is set and the CSV is unchanged.
+        Otherwise the download has a spool file unless the parse is cached.
+        """
+        download = await self.download_csv(term)
+        if if_changed and not download.changed:
+            if download.path:
+                os.unlink(download.path)
+            self.commit_download(download)
+            logger.info(f"CSV for {term} unchanged since last scan")
+            return None
+
+        cached = get_parse_cache().get(download.content_hash, "uga_csv", PARSER_VERSION)
+        if cached is None and download.path is None:
+            # 304, but the parse is no longer cached: fetch the body after all
+            download = await self.download_csv(term, conditional=False)
+        elif cached and download.path:
+            os.unlink(download.path)
+            download.path = None
+
+        metadata = ScheduleMetadata(
+            term=term,
+            source_url=download.url,
+            parse_date=datetime.now(),
+            report_date=datetime.now().strftime("%m/%d/%Y"),
+        )
+        return metadata, cached, download
+
+    def _build_schedule(
+        self,
+        metadata: ScheduleMetadata,
+        courses: list[Course],
+        total_sections: int,
+    ) -> Schedule:
+        """Fill in metadata totals and wrap parsed courses in a Schedule."""
+        metadata.total_courses = len(courses)
+        metadata.total_sections = total_sections
+        return Schedule(metadata=metadata, courses=courses)
+
+    async def download_csv(self, term: str, conditional: bool = True) -> CSVDownload:
+        """
+        Download a term's CSV, conditionally on the last version seen.
+
+        Sends If-None-Match / If-Modified-Since from this consumer's stored
+        validators. On a 304 nothing is downloaded. Otherwise the body is
+        streamed to a temporary file through an incremental SHA-256; the
+        caller owns that file. A 200 whose hash matches the stored one
+        counts as unchanged.
+
+        Nothing is stored here: the caller passes the download to
+        commit_download() after it has parsed or imported the body, so a
+        failure leaves the change to be picked up by the next attempt.
+        """
+        csv_url = self.CSV_URLS.get(term)
+        if not csv_url:
+            raise ValueError(f"Unknown term: {term}. Available: {list(self.CSV_URLS.keys())}")
+
+        state_key = self._state_key(csv_url)
+        previous = self.state_store.get(state_key)
+        headers = previous.conditional_headers() if previous and conditional else {}
+
+        logger.info(f"Downloading CSV for {term} from {csv_url}")
+        async with self._get_client().stream("GET", csv_url, headers=headers) as response:
+            if response.status_code == 304 and previous:
+                logger.info(f"CSV for {term} not modified")
+                return CSVDownload(
+                    term=term, url=csv_url, content_hash=previous.content_hash, changed=False,
+                    validators=previous,
+                )
+            response.raise_for_status()
+
+            hasher = hashlib.sha256()
+            size = 0
+            fd, path = tempfile.mkstemp(prefix="soc-", suffix=".csv")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+            except BaseException:
+                os.unlink(path)
+                raise
+
+            validators = SourceValidators(
+                url=state_key,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                content_hash=hasher.hexdigest(),
+                content_length=size,
+            )
+            encoding = response.charset_encoding or "utf-8-sig"
+
+        changed = previous is None or previous.content_hash != validators.content_hash
+        logger.info(f"Downloaded {size} bytes for {term} ({'changed' if changed else 'unchanged'})")
+
+        return CSVDownload(
+            term=term,
+            url=csv_url,
+            content_hash=validators.content_hash,
+            changed=changed,
+            path=path,
+            encoding=encoding,
+            validators=validators,
+        )
+
+    def commit_download(self, download: CSVDownload) -> None:
+        """Store a download's validators once its consumer has succeeded."""
+        if download.validators is not None:
+            self.state_store.record(
+                download.validators, changed=download.changed, name=download.term
+            )
+
+    def _state_key(self, url: str) -> str:
+        """Source state key for a URL: the URL itself, or URL#consumer."""
+        return f"{url}#{self.consumer}" if self.consumer else url
+
+    def _iter_downloaded_courses(self, download: CSVDownload) -> Iterator[Course]:
+        """Parse a spooled CSV line by line, deleting it afterwards."""
+        try:
+            with open(download.path, newline="", encoding=download.encoding) as f:
+                yield from self.iter_courses(f)
+        finally:
+            os.unlink(download.path)
+
     def _parse_csv(self, csv_content: str) -> tuple[dict[str, Course], int]:
         """
         Parse the CSV content from UGA registrar.
@@ -143,123 +495,191 @@ class UGAScheduleScanner:
         Returns:
             Tuple of (courses dict, total sections count)
         """
+        return self._merge_courses(self.iter_courses(csv_content))
+
+    def _merge_courses(self, stream: Iterator[Course]) -> tuple[dict[str, Course], int]:
+        """Collect streamed courses by course code. Returns (courses, total sections)."""
         courses: dict[str, Course] = {}
         total_sections = 0
 
-        reader = csv.DictReader(io.StringIO(csv_content))
+        for course in stream:
+            existing = courses.get(course.course_code)
+            if existing:
+                existing.sections.extend(course.sections)
+            else:
+                courses[course.course_code] = course
+            total_sections += len(course.sections)
+
+        return courses, total_sections
+
+    def iter_courses(self, csv_content: str | Iterable[str]) -> Iterator[Course]:
+        """
+        Stream courses from registrar CSV content as each one is complete.
+
+        csv_content is either the whole text or an iterable of lines, such
+        as a file opened with newline="".
+
+        Rows for a course are contiguous in the export, so a course is
+        complete when a row for a different course starts. A course that
+        reappears later is yielded again with only its new sections, so
+        consumers should merge by course_code.
+
+        Columns are resolved to indexes once from the header. Values that
+        repeat across a term (times, credits, seat counts, day indicator
+        combinations) are parsed once and memoized for the rest of the file.
+        """
+        if isinstance(csv_content, str):
+            csv_content = io.StringIO(csv_content)
+        reader = csv.reader(csv_content)
+        header = next(reader, None)
+        if not header:
+            return
+
+        idx, tail = self._csv_column_indexes(header)
+        width = len(header)
+        i_subject, i_number, i_title = idx["subject"], idx["course_number"], idx["title"]
+        i_crn, i_credits, i_time = idx["crn"], idx["credits"], idx["time"]
+        i_bcode, i_bname, i_room = idx["building_code"], idx["building_name"], idx["room"]
+        i_first, i_last, i_campus = idx["instructor_first"], idx["instructor_last"], idx["campus"]
+        i_pot, i_max, i_avail, i_section = (
+            idx["part_of_term"], idx["max_seats"], idx["avail_seats"], idx["section"]
+        )
+        day_idx = idx["days"]
+
+        time_cache: dict[str, tuple[Optional[str], Optional[str]]] = {}
+        credit_cache: dict[str, int] = {}
+        seats_cache: dict[tuple[str, str], tuple[int, int]] = {}
+        days_cache: dict[tuple[str, ...], Optional[str]] = {}
+
+        current: Optional[Course] = None
+        current_key: Optional[tuple[str, str]] = None
 
         for row in reader:
-            try:
-                # Extract fields from actual UGA CSV columns
-                subject = row.get('SCHEDULE_OFFERING.SUBJECT', '')
-                course_number = row.get('SCHEDULE_OFFERING.COURSE_NUMBER', '')
-                title = row.get('SCHEDULE_OFFERING.TITLE_LONG_DESC', row.get('SCHEDULE_OFFERING.TITLE_SHORT_DESC', ''))
-                crn = row.get('SCHEDULE_OFFERING.COURSE_REFERENCE_NUMBER', '')
-                credits = row.get('SCHEDULE_OFFERING.MAX_CREDITS', row.get('SCHEDULE_OFFERING.MIN_CREDITS', ''))
-                time_str = row.get('Time', '')
-                building_code = row.get('Building', '')
-                building_name = row.get('MEETING_TIME.BUILDING_DESC', '')
-                room = row.get('Room', '')
-                instructor_first = row.get('SCHEDULE_OFFERING.PRIMARY_INSTRUCTOR_FIRST_NAME', '')
-                instructor_last = row.get('SCHEDULE_OFFERING.PRIMARY_INSTRUCTOR_LAST_NAME', '')
-                campus = row.get('SCHEDULE_OFFERING.CAMPUS_DESC', row.get('MEETING_TIME.COURSE_CAMPUS_DESC', ''))
-                part_of_term = row.get('STVPTRM.STVPTRM_DESC', 'Full Term')
-                max_seats = row.get('SCHEDULE_OFFERING.MAXIMUM_ENROLLMENT', '0')
-                avail_seats = row.get('SCHEDULE_OFFERING.SEATS_AVAILABLE', '0')
-                department = row.get('SCHEDULE_OFFERING.DEPARTMENT_DESC', '')
-                college = row.get('SCHEDULE_OFFERING.COLLEGE_DESC', '')
-                section = row.get('MEETING_TIME.SECTION', '')
-
-                # Build days string from individual indicators
-                days = self._build_days_string(row)
-
-                # Build instructor name
-                instructor = f"{instructor_first} {instructor_last}".strip() if instructor_first or instructor_last else None
-
-                # Use building name if available, otherwise code
-                building = building_name if building_name else building_code
-
-                # Skip if missing essential fields
-                if not subject or not course_number:
-                    continue
-
-                # Parse time
-                start_time, end_time = self._parse_time(time_str)
-
-                # Parse numeric values
+            # Align ragged rows to the header, then append values for
+            # columns the header lacks
+            if len(row) != width:
+                row = (row + [''] * width)[:width]
+            row.extend(tail)
+
+            subject = row[i_subject]
+            course_number = row[i_number]
+
+            # Skip if missing essential fields
+            if not subject or not course_number:
+                continue
+
+            time_str = row[i_time]
+            times = time_cache.get(time_str)
+            if times is None:
+                times = time_cache[time_str] = self._parse_time(time_str)
+
+            credits = row[i_credits]
+            credit_hours = credit_cache.get(credits)
+            if credit_hours is None:
                 try:
                     credit_hours = int(float(credits)) if credits else 0
                 except ValueError:
                     credit_hours = 0
+                credit_cache[credits] = credit_hours
 
+            seat_key = (row[i_max], row[i_avail])
+            seats = seats_cache.get(seat_key)
+            if seats is None:
+                max_seats, avail_seats = seat_key
                 try:
-                    class_size = int(max_seats) if max_seats else 0
-                    seats_available = int(avail_seats) if avail_seats else 0
+                    seats = (
+                        int(max_seats) if max_seats else 0,
+                        int(avail_seats) if avail_seats else 0,
+                    )
                 except ValueError:
-                    class_size = 0
-                    seats_available = 0
-
-                # Clean building/room
-                building = building.strip() if building else None
-                room = room.strip() if room else None
-
-                # Create section
-                section_obj = CourseSection(
-                    crn=str(crn).strip(),
-                    section=str(section).strip() if section else "",
-                    status="A" if seats_available > 0 else "C",
-                    credit_hours=credit_hours,
-                    instructor=instructor.strip() if instructor else None,
-                    part_of_term=part_of_term.strip() if part_of_term else "Full Term",
-                    class_size=class_size,
-                    seats_available=seats_available,
-                    days=days.strip() if days else None,
-                    start_time=start_time,
-                    end_time=end_time,
-                    building=building,
-                    room=room,
-                    campus=campus.strip() if campus else None,
+                    seats = (0, 0)
+                seats_cache[seat_key] = seats
+            class_size, seats_available = seats
+
+            day_key = tuple([row[i] for i in day_idx])
+            if day_key in days_cache:
+                days = days_cache[day_key]
+            else:
+                days = days_cache[day_key] = self._days_from_indicators(day_key)
+
+            # Build instructor name
+            instructor_first, instructor_last = row[i_first], row[i_last]
+            instructor = None
+            if instructor_first or instructor_last:
+                instructor = f"{instructor_first} {instructor_last}".strip() or None
+
+            # Use building name if available, otherwise code
+            building = row[i_bname] or row[i_bcode]
+            room = row[i_room]
+            section = row[i_section]
+            part_of_term = row[i_pot]
+            campus = row[i_campus]
+
+            section_obj = CourseSection(
+                crn=row[i_crn].strip(),
+                section=section.strip() if section else "",
+                status="A" if seats_available > 0 else "C",
+                credit_hours=credit_hours,
+                instructor=instructor,
+                part_of_term=part_of_term.strip() if part_of_term else "Full Term",
+                class_size=class_size,
+                seats_available=seats_available,
+                days=days,
+                start_time=times[0],
+                end_time=times[1],
+                building=building.strip() if building else None,
+                room=room.strip() if room else None,
+                campus=campus.strip() if campus else None,
+            )
+
+            key = (subject, course_number)
+            if key != current_key:
+                if current:
+                    yield current
+                title = row[i_title]
+                current = Course(
+                    subject=subject,
+                    course_number=course_number,
+                    title=title.strip() if title else "",
+                    department="",  # Not provided
                 )
+                current_key = key
+            current.sections.append(section_obj)
 
-                # Add to course (create if doesn't exist)
-                course_key = f"{subject} {course_number}"
-                if course_key not in courses:
-                    courses[course_key] = Course(
-                        subject=subject,
-                        course_number=course_number,
-                        title=title.strip() if title else "",
-                        department="",  # Not provided
-                    )
+        if current:
+            yield current
 
-                courses[course_key].sections.append(section_obj)
-                total_sections += 1
-
-            except Exception as e:
-                logger.debug(f"Error parsing row: {e}")
-                continue
-
-        return courses, total_sections
+    def _csv_column_indexes(self, header: list[str]) -> tuple[dict, list[str]]:
+        """
+        Map CSV_FIELDS and DAY_COLUMNS to row indexes.
 
-    def _build_days_string(self, row: dict) -> Optional[str]:
-        """Build days string from individual day indicators (M, T, W, R, F, S, U)."""
-        days = []
-        day_map = [
-            ('MEETING_TIME.MONDAY_IND', 'M'),
-            ('MEETING_TIME.TUESDAY_IND', 'T'),
-            ('MEETING_TIME.WEDNESDAY_IND', 'W'),
-            ('MEETING_TIME.THURSDAY_IND', 'R'),
-            ('MEETING_TIME.FRIDAY_IND', 'F'),
-            ('MEETING_TIME.SATURDAY_IND', 'S'),
-            ('MEETING_TIME.SUNDAY_IND', 'U'),
+        Fields whose columns are all missing point past the end of the row,
+        at values the caller appends to every row. Returns (indexes, tail).
+        """
+        positions = {name: i for i, name in enumerate(header)}
+        tail: list[str] = []
+
+        def resolve(candidates: tuple[str, ...], default: str) -> int:
+            for candidate in candidates:
+                if candidate in positions:
+                    return positions[candidate]
+            tail.append(default)
+            return len(header) + len(tail) - 1
+
+        indexes: dict = {
+            field: resolve(candidates, default)
+            for field, (candidates, default) in self.CSV_FIELDS.items()
+        }
+        indexes["days"] = [resolve((column,), "") for column, _ in self.DAY_COLUMNS]
+        return indexes, tail
+
+    def _days_from_indicators(self, values: tuple[str, ...]) -> Optional[str]:
+        """Build days string from day indicator values in DAY_COLUMNS order."""
+        days = [
+            day_char
+            for value, (_, day_char) in zip(values, self.DAY_COLUMNS)
+            if value and value.strip().upper() in self.DAY_INDICATOR_VALUES
         ]
-
-        for col, day_char in day_map:
-            val = row.get(col, '').strip()
-            # CSV uses the day letter itself as indicator (M, T, W, R, F, S, U)
-            # or could be 1, Y, etc.
-            if val and val.upper() in ('M', 'T', 'W', 'R', 'F', 'S', 'U', '1', 'Y', 'YES', 'TRUE', 'X'):
-                days.append(day_char)
-
         return ''.join(days) if days else None
 
     def _parse_course_id(self, course_id: str) -> tuple[str, str]:
@@ -286,13 +706,20 @@ class UGAScheduleScanner:
 
         return time_str.strip(), None
 
-    async def update_seat_availability(self, term: str) -> dict[str, dict]:
+    async def update_seat_availability(
+        self,
+        term: str,
+        if_changed: bool = False,
+    ) -> dict[str, dict]:
         """
         Quick scan to update only seat availability.
-        Returns dict of CRN -> {class_size, seats_available, building, room}
+        Returns dict of CRN -> {class_size, seats_available, building, room},
+        empty when if_changed is set and the CSV has not changed.
         """
-        schedule = await self.scan_term(term)
+        schedule = await self.scan_term(term, if_changed=if_changed)
         availability: dict[str, dict] = {}
+        if schedule is None:
+            return availability
 
         for course in schedule.courses:
             for section in course.sections:
@@ -383,11 +810,42 @@ class UGAScheduleScanner:
             await self._close_browser()
 
 
+def _parse_downloaded_csv(
+    download: CSVDownload,
+    metadata: ScheduleMetadata,
+) -> tuple[list[Course], int]:
+    """
+    Parse (and cache) a spooled CSV. Runs in a worker process.
+
+    Returns (courses, total sections).
+    """
+    scanner = UGAScheduleScanner(state_store=SourceStateStore(persist=False))
+    stream = get_parse_cache().record(
+        download.content_hash, "uga_csv", PARSER_VERSION,
+        scanner._iter_downloaded_courses(download), metadata,
+    )
+    courses, total_sections = scanner._merge_courses(stream)
+    return list(courses.values()), total_sections
+
+
+def _parse_sequentially(
+    to_parse: list[tuple[str, ScheduleMetadata, CSVDownload]],
+) -> list:
+    """Parse spooled CSVs in this process; failures are returned, not raised."""
+    parsed = []
+    for _, metadata, download in to_parse:
+        try:
+            parsed.append(_parse_downloaded_csv(download, metadata))
+        except Exception as e:
+            parsed.append(e)
+    return parsed
+
+
 # Convenience function
 async def scan_schedule(term: str) -> Schedule:
     """Scan UGA schedule for a term."""
-    scanner = UGAScheduleScanner(headless=True)
-    return await scanner.scan_term(term)
+    async with UGAScheduleScanner(headless=True) as scanner:
+        return await scanner.scan_term(term)
 
 
 if __name__ == "__main__":
@@ -397,8 +855,10 @@ if __name__ == "__main__":
     term = sys.argv[1] if len(sys.argv) > 1 else "Spring 2026"
 
     async def main():
-        scanner = UGAScheduleScanner(headless=True)
+        async with UGAScheduleScanner(headless=True) as scanner:
+            await show(scanner)
 
+    async def show(scanner: UGAScheduleScanner):
         print(f"\n=== Scanning {term} ===\n")
         schedule = await scanner.scan_term(term)
 
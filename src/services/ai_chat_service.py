@@ -13,6 +13,7 @@ from src.services.embedding_service import create_embedding_service
 from src.services.progress_service import ProgressService
 from src.services.audit_service import AuditService
 from src.services.graduation_optimizer import GraduationOptimizer, OptimizationMode
+from src.services.prerequisite_graph import get_prerequisite_graph
 
 
 @dataclass
@@ -429,6 +430,23 @@ class AIChatService:
 
         return courses_info
 
+    def _format_eligibility(self, course_code: str, completed_codes: Optional[set[str]]) -> str:
+        """Format a prerequisite eligibility line for a logged-in student."""
+        if not completed_codes:
+            return ""
+        try:
+            graph = get_prerequisite_graph()
+        except Exception:
+            return ""
+        if not graph.has_prerequisites(course_code):
+            return ""
+
+        missing = graph.missing_prerequisites(course_code, completed_codes)
+        if not missing:
+            return "\n- **Your Eligibility:** Prerequisites satisfied by your completed courses"
+        needed = "; ".join(" or ".join(options) for options in missing)
+        return f"\n- **Your Eligibility:** Still needs {needed}"
+
     def _detect_credit_hours_query(self, query: str) -> int | None:
         """Detect if query is asking about specific credit hours."""
         import re
@@ -491,7 +509,13 @@ class AIChatService:
                 })
             return courses
 
-    def _build_context(self, query: str, max_courses: int = 8, max_documents: int = 5) -> tuple[str, list[dict]]:
+    def _build_context(
+        self,
+        query: str,
+        max_courses: int = 8,
+        max_documents: int = 5,
+        completed_codes: Optional[set[str]] = None,
+    ) -> tuple[str, list[dict]]:
         """Build context string from RAG retrieval."""
         sources = []
         context_parts = []
@@ -506,11 +530,12 @@ class AIChatService:
                     offered = "✓ Offered this semester" if course.get("offered_this_semester") else "Not in current schedule"
                     prereqs = course.get("prerequisites") or "None listed"
                     coreqs = course.get("corequisites") or "None"
+                    eligibility = self._format_eligibility(course["course_code"], completed_codes)
 
                     course_info = f"""
 ### {course['course_code']} - {course['title']}
 - **Prerequisites:** {prereqs}
-- **Corequisites:** {coreqs}
+- **Corequisites:** {coreqs}{eligibility}
 - **Credit Hours:** {course.get('credit_hours', 'N/A')}
 - **Status:** {offered}
 - **Description:** {(course.get('description') or 'No description')[:300]}...
@@ -613,9 +638,6 @@ Content excerpt: {doc.get('content', '')[:500]}...
         Returns:
             ChatResponse with answer and sources
         """
-        # Build context from RAG
-        context, sources = self._build_context(message, max_courses, max_documents)
-
         # Add user context if authenticated
         user_context = ""
         degree_audit_context = ""
@@ -629,6 +651,11 @@ Content excerpt: {doc.get('content', '')[:500]}...
             if self._is_schedule_planning_query(message):
                 graduation_path_context = self._get_graduation_path_context(user_id, message)
 
+        # Build context from RAG
+        context, sources = self._build_context(
+            message, max_courses, max_documents, completed_codes
+        )
+
         # Build messages for Claude
         messages = []
 
@@ -0,0 +1,158 @@
+"""
+Process-wide campus graph, loaded from a binary snapshot.
+
+Building the CampusGraph from data/campus_buildings.json means parsing the
+JSON, creating every building, room, parking deck and route, and computing
+the alias index and walking matrix. That work is done once and pickled:
+
+- The snapshot is keyed by the SHA-256 of the source JSON and of the
+  campus_graph module, so editing either regenerates it
+- The key is stored as a small header ahead of the graph, so a stale
+  snapshot is detected without unpickling the graph
+- Writes are atomic; if the snapshot location is read-only (serverless),
+  the snapshot goes to the temp directory instead, and the freshly built
+  graph is returned either way
+- Deploy builds run write_campus_graph_snapshot() (the campus-graph CLI
+  command) so the snapshot ships with the app and cold starts skip the
+  rebuild
+
+get_campus_graph() loads lazily on first use, never at import time.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from src.config import settings
+from src.models import campus_graph as campus_graph_module
+from src.models.campus_graph import (
+    CampusGraph, build_campus_graph_from_coords, build_campus_graph_from_schedule
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = "1"
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CAMPUS_BUILDINGS_PATH = PROJECT_ROOT / "data" / "campus_buildings.json"
+
+
+def _snapshot_key(source: Optional[bytes]) -> str:
+    digest = hashlib.sha256()
+    digest.update(SNAPSHOT_FORMAT.encode())
+    digest.update(Path(campus_graph_module.__file__).read_bytes())
+    digest.update(source if source is not None else b"<coords>")
+    return digest.hexdigest()
+
+
+def _snapshot_path(snapshot_path: Optional[Path]) -> Path:
+    """The snapshot location; relative settings are under the project root."""
+    path = Path(snapshot_path or settings.campus_graph_snapshot)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def _fallback_path(snapshot_path: Path) -> Path:
+    """Writable location for the snapshot when its configured one is not."""
+    return Path(tempfile.gettempdir()) / snapshot_path.name
+
+
+def _read_snapshot(snapshot_path: Path, key: str) -> Optional[CampusGraph]:
+    """The graph from a snapshot, or None if it is missing or stale."""
+    try:
+        with open(snapshot_path, "rb") as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable campus graph snapshot {snapshot_path}: {e}")
+    return None
+
+
+def _write_snapshot(snapshot_path: Path, key: str, graph: CampusGraph) -> None:
+    """Atomically write a snapshot. Raises OSError if the location is not writable."""
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # mkstemp creates 0600; a deployed snapshot is read by another user
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, snapshot_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(f"Wrote campus graph snapshot {snapshot_path} ({len(graph.buildings)} buildings)")
+
+
+def _build_graph(source: Optional[bytes]) -> CampusGraph:
+    if source is not None:
+        return build_campus_graph_from_schedule(json.loads(source))
+    return build_campus_graph_from_coords()
+
+
+def load_campus_graph(
+    source_path: Optional[Path] = None,
+    snapshot_path: Optional[Path] = None,
+) -> CampusGraph:
+    """
+    Load the campus graph from its snapshot, rebuilding it if stale.
+
+    Falls back to the known building coordinates if the source JSON is
+    missing.
+    """
+    source_path = Path(source_path or CAMPUS_BUILDINGS_PATH)
+    snapshot_path = _snapshot_path(snapshot_path)
+
+    source = source_path.read_bytes() if source_path.exists() else None
+    key = _snapshot_key(source)
+
+    locations = list(dict.fromkeys([snapshot_path, _fallback_path(snapshot_path)]))
+    for location in locations:
+        graph = _read_snapshot(location, key)
+        if graph is not None:
+            logger.debug(f"Loaded campus graph snapshot ({len(graph.buildings)} buildings)")
+            return graph
+
+    graph = _build_graph(source)
+    for location in locations:
+        try:
+            _write_snapshot(location, key, graph)
+            break
+        except OSError as e:
+            logger.warning(f"Could not write campus graph snapshot {location}: {e}")
+    return graph
+
+
+def write_campus_graph_snapshot(
+    source_path: Optional[Path] = None,
+    snapshot_path: Optional[Path] = None,
+) -> Path:
+    """
+    Build the campus graph and write its snapshot, for deploy builds.
+
+    Returns the snapshot path. Raises OSError if it cannot be written.
+    """
+    source_path = Path(source_path or CAMPUS_BUILDINGS_PATH)
+    snapshot_path = _snapshot_path(snapshot_path)
+
+    source = source_path.read_bytes() if source_path.exists() else None
+    _write_snapshot(snapshot_path, _snapshot_key(source), _build_graph(source))
+    return snapshot_path
+
+
+_graph: Optional[CampusGraph] = None
+
+
+def get_campus_graph() -> CampusGraph:
+    """Get the process-wide campus graph, loading it on first use."""
+    global _graph
+    if _graph is None:
+        _graph = load_campus_graph()
+    return _graph
@@ -7,20 +7,28 @@ graph-like queries for course relationships.
 Designed to be easily extended with Neo4j later.
 """
 import logging
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Optional
-from sqlalchemy import select, func, and_, or_, text
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import Session, selectinload
 
 from src.models.database import (
     Course, Section, BulletinCourse, Program, ProgramRequirement, RequirementCourse,
-    CoursePrerequisite, CourseEquivalent, CourseUnlock, ScheduleBulletinLink,
+    CourseEquivalent, CourseUnlock, ScheduleBulletinLink,
     get_engine, get_session_factory, init_db
 )
 from src.services.prerequisite_parser import PrerequisiteParser
+from src.services.prerequisite_graph import PrerequisiteGraph, get_prerequisite_graph
 
 logger = logging.getLogger(__name__)
 
+# Prerequisite DAGs keyed by (course_code, max_depth, graph version)
+PREREQ_CHAIN_CACHE_SIZE = 1024
+_prereq_chain_cache: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+_prereq_chain_lock = threading.Lock()
+
 
 @dataclass
 class CourseInfo:
@@ -84,6 +92,11 @@ class CourseLinker:
         self.session_factory = session_factory
         self.prereq_parser = PrerequisiteParser(session_factory)
 
+    @property
+    def prereq_graph(self) -> PrerequisiteGraph:
+        """Shared compiled prerequisite graph."""
+        return get_prerequisite_graph(self.session_factory)
+
     def link_schedule_to_bulletin(self, schedule_id: int = None) -> dict:
         """
         Link all schedule courses to their bulletin counterparts.
@@ -274,55 +287,29 @@ class CourseLinker:
         Returns:
             Dict with 'can_take', 'missing_prerequisites', 'satisfied_groups'
         """
-        with self.session_factory() as session:
-            prereqs = session.execute(
-                select(CoursePrerequisite)
-                .where(CoursePrerequisite.course_code == course_code)
-            ).scalars().all()
-
-            if not prereqs:
-                return {
-                    "can_take": True,
-                    "missing_prerequisites": [],
-                    "satisfied_groups": [],
-                }
-
-            # Get equivalents for completed courses
-            completed_with_equivs = set(completed_courses)
-            for cc in completed_courses:
-                equivs = self.get_equivalent_courses(cc)
-                completed_with_equivs.update(equivs)
-
-            # Group prerequisites by group_id
-            groups = {}
-            for p in prereqs:
-                if p.group_id not in groups:
-                    groups[p.group_id] = []
-                groups[p.group_id].append(p.prerequisite_code)
-
-            # Check each group (need one from each group to be satisfied)
-            satisfied_groups = []
-            missing_groups = []
-
-            for group_id, courses in groups.items():
-                # OR within group - need at least one
-                if any(c in completed_with_equivs for c in courses):
-                    satisfied_groups.append({
-                        "group_id": group_id,
-                        "options": courses,
-                        "satisfied_by": [c for c in courses if c in completed_with_equivs],
-                    })
-                else:
-                    missing_groups.append({
-                        "group_id": group_id,
-                        "options": courses,
-                    })
+        graph = self.prereq_graph
+        satisfied_groups = []
+        missing_groups = []
+
+        # Equivalents are folded into the graph's group bitsets
+        for group in graph.prerequisite_groups(course_code, completed_courses):
+            if group.satisfied_by:
+                satisfied_groups.append({
+                    "group_id": group.group_id,
+                    "options": group.options,
+                    "satisfied_by": group.satisfied_by,
+                })
+            else:
+                missing_groups.append({
+                    "group_id": group.group_id,
+                    "options": group.options,
+                })
 
-            return {
-                "can_take": len(missing_groups) == 0,
-                "missing_prerequisites": missing_groups,
-                "satisfied_groups": satisfied_groups,
-            }
+        return {
+            "can_take": len(missing_groups) == 0,
+            "missing_prerequisites": missing_groups,
+            "satisfied_groups": satisfied_groups,
+        }
 
     def get_available_courses(self, completed_courses: list[str], schedule_id: int = None) -> list[dict]:
         """
@@ -336,6 +323,9 @@ class CourseLinker:
             List of available courses with availability info
         """
         available = []
+        completed = set(completed_courses)
+        graph = self.prereq_graph
+        completed_mask = graph.mask_of(completed)
 
         with self.session_factory() as session:
             # Get all courses from current schedule
@@ -355,13 +345,11 @@ class CourseLinker:
 
             for course in courses:
                 # Skip if already completed
-                if course.course_code in completed_courses:
+                if course.course_code in completed:
                     continue
 
                 # Check if can take
-                eligibility = self.can_take_course(course.course_code, completed_courses)
-
-                if eligibility["can_take"]:
+                if graph.is_eligible(course.course_code, completed_mask):
                     available.append({
                         "code": course.course_code,
                         "title": course.title,
@@ -409,10 +397,9 @@ class CourseLinker:
                 raise ValueError(f"Program {program_id} not found")
 
             # Get equivalents for all completed courses
-            all_completed = set(completed_courses)
-            for cc in completed_courses:
-                equivs = self.get_equivalent_courses(cc)
-                all_completed.update(equivs)
+            graph = self.prereq_graph
+            all_completed = graph.with_equivalents(completed_courses)
+            completed_mask = graph.mask_of(all_completed)
 
             all_in_progress = set(in_progress_courses)
 
@@ -446,8 +433,7 @@ class CourseLinker:
                         req_status.remaining_courses.append(code)
 
                         # Check if available this semester
-                        eligibility = self.can_take_course(code, list(all_completed))
-                        if eligibility["can_take"]:
+                        if graph.is_eligible(code, completed_mask):
                             req_status.available_courses.append(code)
 
                 # Calculate remaining
@@ -499,93 +485,137 @@ class CourseLinker:
 
         return recommendations
 
-    def get_prerequisite_chain(self, course_code: str, max_depth: int = 10) -> dict:
+    def get_prerequisite_chain(
+        self,
+        course_code: str,
+        max_depth: int = 10,
+        view: str = "tree",
+    ) -> dict:
         """
         Get the full prerequisite chain for a course (recursive).
 
-        Uses a recursive CTE in PostgreSQL for efficiency.
-
         Args:
             course_code: Course to get chain for
             max_depth: Maximum recursion depth
+            view: "tree" for the nested rendering, "dag" for nodes + edges
 
         Returns:
-            Tree structure of prerequisites
+            Tree structure of prerequisites, or the DAG from get_prerequisite_dag
         """
-        with self.session_factory() as session:
-            # Use recursive CTE
-            cte_query = text("""
-                WITH RECURSIVE prereq_chain AS (
-                    -- Base case
-                    SELECT
-                        course_code,
-                        prerequisite_code,
-                        group_id,
-                        1 as depth
-                    FROM course_prerequisites
-                    WHERE course_code = :course_code
-
-                    UNION ALL
-
-                    -- Recursive case
-                    SELECT
-                        cp.course_code,
-                        cp.prerequisite_code,
-                        cp.group_id,
-                        pc.depth + 1
-                    FROM course_prerequisites cp
-                    JOIN prereq_chain pc ON cp.course_code = pc.prerequisite_code
-                    WHERE pc.depth < :max_depth
-                )
-                SELECT DISTINCT course_code, prerequisite_code, group_id, depth
-                FROM prereq_chain
-                ORDER BY depth, course_code, group_id
-            """)
-
-            try:
-                result = session.execute(
-                    cte_query,
-                    {"course_code": course_code, "max_depth": max_depth}
-                ).fetchall()
-            except Exception:
-                # Table might not exist yet
-                return {"course": course_code, "prerequisites": []}
-
-            # Build tree structure
-            return self._build_prereq_tree(course_code, result)
-
-    def _build_prereq_tree(self, course_code: str, rows: list) -> dict:
-        """Build a tree structure from prerequisite rows."""
-        tree = {"course": course_code, "prerequisites": []}
-
-        # Find direct prerequisites
-        direct = [r for r in rows if r[0] == course_code]
-
-        # Group by group_id
-        groups = {}
-        for row in direct:
-            prereq = row[1]
-            group_id = row[2]
-            if group_id not in groups:
-                groups[group_id] = []
-            groups[group_id].append(prereq)
-
-        for group_id, prereqs in sorted(groups.items()):
-            if len(prereqs) == 1:
-                # Single prerequisite
-                subtree = self._build_prereq_tree(prereqs[0], rows)
-                tree["prerequisites"].append(subtree)
-            else:
-                # OR group
-                tree["prerequisites"].append({
-                    "type": "OR",
-                    "options": [
-                        self._build_prereq_tree(p, rows)
-                        for p in prereqs
-                    ]
-                })
+        dag = self.get_prerequisite_dag(course_code, max_depth)
+        if view == "dag":
+            return dag
+        return self._build_prereq_tree(course_code, dag["edges"])
+
+    def get_prerequisite_dag(self, course_code: str, max_depth: int = 10) -> dict:
+        """
+        Get the prerequisite chain as a deduplicated DAG.
+
+        Each course appears once in "nodes" (with its shortest depth) and each
+        prerequisite relationship once in "edges", annotated with its group and
+        whether the group is an OR of alternatives. Only prerequisite edges
+        are followed: corequisites and recommended courses never block
+        enrollment (see prerequisite_graph.BLOCKING_RELATIONS), so they are
+        not part of the chain. Results are cached per course per
+        prerequisite graph version and must be treated as read-only.
+
+        Args:
+            course_code: Course to get chain for
+            max_depth: Maximum depth of prerequisite edges to follow
+
+        Returns:
+            Dict with course, nodes, edges and the graph version
+        """
+        graph = self.prereq_graph
+        key = (course_code, max_depth, graph.version)
+
+        with _prereq_chain_lock:
+            cached = _prereq_chain_cache.get(key)
+            if cached is not None:
+                _prereq_chain_cache.move_to_end(key)
+                return cached
+
+        dag = self._build_prereq_dag(graph, course_code, max_depth)
+
+        with _prereq_chain_lock:
+            _prereq_chain_cache[key] = dag
+            while len(_prereq_chain_cache) > PREREQ_CHAIN_CACHE_SIZE:
+                _prereq_chain_cache.popitem(last=False)
+
+        return dag
+
+    def _build_prereq_dag(self, graph: PrerequisiteGraph, course_code: str, max_depth: int) -> dict:
+        """Breadth-first walk of the prerequisite graph, visiting each course once."""
+        depths = {course_code: 0}
+        edges = []
+        queue = deque([course_code])
+
+        while queue:
+            code = queue.popleft()
+            depth = depths[code]
+            if depth >= max_depth:
+                continue
+
+            for group in graph.prerequisite_groups(code):
+                logic = "OR" if len(group.options) > 1 else "SINGLE"
+                for prereq in group.options:
+                    edges.append({
+                        "course": code,
+                        "prerequisite": prereq,
+                        "group_id": group.group_id,
+                        "logic": logic,
+                    })
+                    if prereq not in depths:
+                        depths[prereq] = depth + 1
+                        queue.append(prereq)
+
+        return {
+            "course": course_code,
+            "nodes": [{"code": code, "depth": depth} for code, depth in depths.items()],
+            "edges": edges,
+            "version": graph.version,
+        }
+
+    def _build_prereq_tree(self, course_code: str, edges: list[dict]) -> dict:
+        """
+        Render prerequisite DAG edges as the nested tree format.
+
+        Subtrees are built once per course and shared wherever that course
+        appears again. Cycles are cut at the repeated course.
+        """
+        groups_by_course: dict[str, dict[int, list[str]]] = {}
+        for edge in edges:
+            groups = groups_by_course.setdefault(edge["course"], {})
+            groups.setdefault(edge["group_id"], []).append(edge["prerequisite"])
+
+        memo: dict[str, dict] = {}
+        visiting: set[str] = set()
+
+        def render(code: str) -> dict:
+            if code in memo:
+                return memo[code]
+
+            tree = {"course": code, "prerequisites": []}
+            if code in visiting:
+                return tree
+            visiting.add(code)
+
+            for group_id, prereqs in sorted(groups_by_course.get(code, {}).items()):
+                if len(prereqs) == 1:
+                    # Single prerequisite
+                    tree["prerequisites"].append(render(prereqs[0]))
+                else:
+                    # OR group
+                    tree["prerequisites"].append({
+                        "type": "OR",
+                        "options": [render(p) for p in prereqs],
+                    })
+
+            visiting.discard(code)
+            memo[code] = tree
+            return tree
 
-        return tree
+        return render(course_code)
 
 
 def create_linker() -> CourseLinker:
@@ -7,20 +7,31 @@ Uses PostgreSQL with pgvector for vector search capabilities.
 import hashlib
 import logging
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Optional
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import Session, selectinload
+from typing import Iterable, Optional
+from sqlalchemy import select, insert, func, and_, or_
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from src.models.database import (
     Schedule, Course, Section, Instructor,
     get_engine, get_session_factory, init_db
 )
-from src.models.course import Schedule as ParsedSchedule, Course as ParsedCourse
-from src.parsers.uga_pdf_parser import parse_uga_schedule, ParseResult
+from src.models.course import (
+    Schedule as ParsedSchedule, Course as ParsedCourse,
+    CourseSection as ParsedSection, ScheduleMetadata as ParsedMetadata,
+)
+from src.models.meeting_time import day_subsets
+from src.parsers.uga_pdf_parser import (
+    UGAPDFParser, ParseResult, PARSER_VERSION as PDF_PARSER_VERSION
+)
+from src.parsers.parse_cache import get_parse_cache
 
 logger = logging.getLogger(__name__)
 
+# Courses written per flush when importing a course stream
+IMPORT_CHUNK_SIZE = 200
+
 
 class CourseService:
     """Service for managing course data in the database."""
@@ -47,125 +58,233 @@ class CourseService:
             source_hash: Optional hash of the source file for deduplication
             mark_as_current: If True, mark this schedule as current and unmark others
 
+        Returns:
+            The created Schedule database object
+        """
+        return self.import_course_stream(
+            parsed.courses,
+            parsed.metadata,
+            source_hash=source_hash,
+            mark_as_current=mark_as_current,
+        )
+
+    def import_course_stream(
+        self,
+        courses: Iterable[ParsedCourse],
+        metadata: ParsedMetadata,
+        source_hash: Optional[str] = None,
+        mark_as_current: bool = True,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Schedule:
+        """
+        Import courses from a streaming parser, writing them in chunks.
+
+        The schedule record is created once the first course arrives (a
+        streaming parser has read the term by then) and its totals are set
+        at the end. Courses repeated in the stream are merged by course code.
+        Each chunk is flushed as it fills, so writes overlap with parsing;
+        the whole import is committed once.
+
+        Args:
+            courses: Parsed courses, e.g. from UGAPDFParser.iter_courses
+            metadata: Schedule metadata, filled in by the parser as it runs
+            source_hash: Optional hash of the source file for deduplication
+            mark_as_current: If True, mark this schedule as current and unmark others
+            chunk_size: Courses written per flush
+
         Returns:
             The created Schedule database object
         """
         with self.session_factory() as session:
-            # Check for duplicate import
+            # Check for duplicate import before pulling anything from the stream
             if source_hash:
                 existing = session.execute(
                     select(Schedule).where(Schedule.source_hash == source_hash)
                 ).scalar_one_or_none()
                 if existing:
+                    # A source that changed back to an earlier version is current again
+                    if mark_as_current and not existing.is_current:
+                        session.execute(
+                            Schedule.__table__.update()
+                            .where(Schedule.term == existing.term)
+                            .values(is_current=False)
+                        )
+                        existing.is_current = True
+                        session.commit()
                     return existing
 
+            courses = iter(courses)
+            first = next(courses, None)
+            if first is not None:
+                courses = chain([first], courses)
+
             # Mark previous schedules as not current
             if mark_as_current:
                 session.execute(
                     Schedule.__table__.update()
-                    .where(Schedule.term == parsed.metadata.term)
+                    .where(Schedule.term == metadata.term)
                     .values(is_current=False)
                 )
 
             # Create schedule record
             schedule = Schedule(
-                term=parsed.metadata.term,
-                source_url=parsed.metadata.source_url,
+                term=metadata.term,
+                source_url=metadata.source_url,
                 source_hash=source_hash,
-                parse_date=parsed.metadata.parse_date,
-                report_date=parsed.metadata.report_date,
-                total_courses=parsed.metadata.total_courses,
-                total_sections=parsed.metadata.total_sections,
+                parse_date=metadata.parse_date,
+                report_date=metadata.report_date,
+                total_courses=0,
+                total_sections=0,
                 is_current=mark_as_current,
             )
             session.add(schedule)
             session.flush()  # Get the schedule ID
 
-            # Track instructors
-            instructor_cache: dict[str, Instructor] = {}
-
-            # Import courses and sections
-            for parsed_course in parsed.courses:
-                course = Course(
-                    schedule_id=schedule.id,
-                    subject=parsed_course.subject,
-                    course_number=parsed_course.course_number,
-                    title=parsed_course.title,
-                    department=parsed_course.department,
-                    bulletin_url=parsed_course.bulletin_url,
-                    course_code=parsed_course.course_code,
-                )
-                session.add(course)
-                session.flush()
-
-                for parsed_section in parsed_course.sections:
-                    # Calculate waitlist from negative seats
-                    waitlist = 0
-                    seats = parsed_section.seats_available
-                    if seats < 0:
-                        waitlist = abs(seats)
-                        seats = 0
-
-                    section = Section(
-                        course_id=course.id,
-                        crn=parsed_section.crn,
-                        section_code=parsed_section.section,
-                        status=parsed_section.status,
-                        credit_hours=parsed_section.credit_hours,
-                        instructor=parsed_section.instructor,
-                        part_of_term=parsed_section.part_of_term,
-                        class_size=parsed_section.class_size,
-                        seats_available=seats,
-                        waitlist_count=waitlist,
-                        # Schedule info
-                        days=parsed_section.days,
-                        start_time=parsed_section.start_time,
-                        end_time=parsed_section.end_time,
-                        building=parsed_section.building,
-                        room=parsed_section.room,
-                        campus=parsed_section.campus,
-                    )
-                    session.add(section)
+            course_ids: dict[str, int] = {}
+            known_instructors: set[str] = set()
+            total_sections = 0
 
-                    # Track instructor
-                    if parsed_section.instructor:
-                        self._ensure_instructor(
-                            session, parsed_section.instructor, instructor_cache
-                        )
+            chunk: list[ParsedCourse] = []
+            for parsed_course in courses:
+                chunk.append(parsed_course)
+                if len(chunk) >= chunk_size:
+                    total_sections += self._write_course_chunk(
+                        session, schedule.id, chunk, course_ids, known_instructors
+                    )
+                    chunk = []
+            if chunk:
+                total_sections += self._write_course_chunk(
+                    session, schedule.id, chunk, course_ids, known_instructors
+                )
 
+            schedule.total_courses = len(course_ids)
+            schedule.total_sections = total_sections
             session.commit()
+
+            if mark_as_current:
+                self._refresh_room_occupancy(schedule.id)
             return schedule
 
-    def _ensure_instructor(
-        self,
-        session: Session,
-        name: str,
-        cache: dict[str, Instructor]
-    ) -> Instructor:
-        """Ensure instructor exists in database, using cache for efficiency."""
-        if name in cache:
-            return cache[name]
+    def _refresh_room_occupancy(self, schedule_id: int) -> None:
+        """Rebuild the room occupancy index for a newly imported schedule."""
+        from src.services.room_occupancy import refresh_room_occupancy
 
-        instructor = session.execute(
-            select(Instructor).where(Instructor.name == name)
-        ).scalar_one_or_none()
+        try:
+            refresh_room_occupancy(self.session_factory, schedule_id)
+        except Exception as e:
+            # Built on first query instead
+            logger.warning(f"Room occupancy index not built for schedule {schedule_id}: {e}")
 
-        if not instructor:
-            instructor = Instructor(name=name)
-            session.add(instructor)
-            session.flush()
+    def _write_course_chunk(
+        self,
+        session: Session,
+        schedule_id: int,
+        chunk: list[ParsedCourse],
+        course_ids: dict[str, int],
+        known_instructors: set[str],
+    ) -> int:
+        """Write a chunk of parsed courses and their sections. Returns sections written."""
+        new_courses: dict[str, Course] = {}
+        for parsed_course in chunk:
+            code = parsed_course.course_code
+            if code in course_ids or code in new_courses:
+                continue
+            new_courses[code] = Course(
+                schedule_id=schedule_id,
+                subject=parsed_course.subject,
+                course_number=parsed_course.course_number,
+                title=parsed_course.title,
+                department=parsed_course.department,
+                bulletin_url=parsed_course.bulletin_url,
+                course_code=code,
+            )
 
-        cache[name] = instructor
-        return instructor
+        session.add_all(new_courses.values())
+        session.flush()  # Get the course IDs
+        for code, course in new_courses.items():
+            course_ids[code] = course.id
+
+        section_rows = []
+        instructors = set()
+        for parsed_course in chunk:
+            course_id = course_ids[parsed_course.course_code]
+            for parsed_section in parsed_course.sections:
+                section_rows.append(self._section_row(course_id, parsed_section))
+                if parsed_section.instructor:
+                    instructors.add(parsed_section.instructor)
+
+        if section_rows:
+            session.execute(insert(Section), section_rows)
+
+        self._ensure_instructors(session, instructors - known_instructors)
+        known_instructors.update(instructors)
+        session.flush()
+        return len(section_rows)
+
+    def _section_row(self, course_id: int, parsed_section: ParsedSection) -> dict:
+        """Build a sections row from a parsed section."""
+        # Calculate waitlist from negative seats
+        waitlist = 0
+        seats = parsed_section.seats_available
+        if seats < 0:
+            waitlist = abs(seats)
+            seats = 0
+
+        return {
+            "course_id": course_id,
+            "crn": parsed_section.crn,
+            "section_code": parsed_section.section,
+            "status": parsed_section.status,
+            "credit_hours": parsed_section.credit_hours,
+            "instructor": parsed_section.instructor,
+            "part_of_term": parsed_section.part_of_term,
+            "class_size": parsed_section.class_size,
+            "seats_available": seats,
+            "waitlist_count": waitlist,
+            # Schedule info
+            "days": parsed_section.days,
+            "start_time": parsed_section.start_time,
+            "end_time": parsed_section.end_time,
+            "building": parsed_section.building,
+            "room": parsed_section.room,
+            "campus": parsed_section.campus,
+            "start_minutes": parsed_section.start_minutes,
+            "end_minutes": parsed_section.end_minutes,
+            "day_mask": parsed_section.day_mask,
+        }
+
+    def _ensure_instructors(self, session: Session, names: set[str]) -> None:
+        """Ensure instructors exist in database, creating any that are missing."""
+        if not names:
+            return
+
+        existing = set(session.execute(
+            select(Instructor.name).where(Instructor.name.in_(names))
+        ).scalars().all())
+
+        session.add_all(Instructor(name=name) for name in sorted(names - existing))
 
     def import_pdf(
         self,
         pdf_path: str | Path,
-        source_url: str = ""
+        source_url: str = "",
+        parallel: bool = False,
+        workers: Optional[int] = None,
     ) -> tuple[Schedule, ParseResult]:
         """
         Parse a PDF file and import it into the database.
 
+        Courses are streamed from the parser straight into the database, so
+        the returned ParseResult carries schedule metadata, errors and
+        warnings but no courses. A PDF whose content was parsed before (by
+        the same parser version) is read back from the parse cache instead.
+
+        Args:
+            pdf_path: Path to the PDF
+            source_url: URL the PDF was downloaded from
+            parallel: Extract pages in a process pool (see UGAPDFParser)
+            workers: Worker processes for a parallel parse
+
         Returns:
             Tuple of (Schedule, ParseResult)
         """
@@ -175,15 +294,38 @@ class CourseService:
         with open(pdf_path, 'rb') as f:
             source_hash = hashlib.sha256(f.read()).hexdigest()
 
-        # Parse the PDF
-        result = parse_uga_schedule(pdf_path, source_url)
+        cache = get_parse_cache()
+        cached = cache.get(source_hash, "uga_pdf", PDF_PARSER_VERSION)
+        if cached:
+            metadata = cached.metadata
+            metadata.source_url = source_url or metadata.source_url
+            courses = cached.iter_courses()
+            errors, warnings = cached.errors, cached.warnings
+        else:
+            # Parse the PDF, caching courses as they stream past
+            parser = UGAPDFParser()
+            courses = parser.iter_courses(pdf_path, source_url, parallel=parallel, workers=workers)
+            metadata, errors, warnings = parser.metadata, parser.errors, parser.warnings
+            courses = cache.record(
+                source_hash, "uga_pdf", PDF_PARSER_VERSION, courses, metadata, errors, warnings
+            )
 
-        # Import into database
-        schedule = self.import_schedule(
-            result.schedule,
+        # Import into database as courses complete
+        schedule = self.import_course_stream(
+            courses,
+            metadata,
             source_hash=source_hash
         )
 
+        metadata.term = metadata.term or schedule.term
+        metadata.total_courses = schedule.total_courses
+        metadata.total_sections = schedule.total_sections
+        result = ParseResult(
+            schedule=ParsedSchedule(metadata=metadata),
+            errors=errors,
+            warnings=warnings,
+        )
+
         return schedule, result
 
     def get_current_schedule(self, term: Optional[str] = None) -> Optional[Schedule]:
@@ -195,6 +337,17 @@ class CourseService:
             query = query.order_by(Schedule.parse_date.desc()).limit(1)
             return session.execute(query).scalar_one_or_none()
 
+    def get_active_terms(self) -> list[str]:
+        """Get the terms that have a current schedule."""
+        with self.session_factory() as session:
+            query = (
+                select(Schedule.term)
+                .where(Schedule.is_current.is_(True))
+                .distinct()
+                .order_by(Schedule.term)
+            )
+            return list(session.execute(query).scalars().all())
+
     def get_courses(
         self,
         schedule_id: Optional[int] = None,
@@ -309,6 +462,107 @@ class CourseService:
 
             return session.execute(query).scalar_one_or_none()
 
+    def search_sections(
+        self,
+        schedule_id: Optional[int] = None,
+        subject: Optional[str] = None,
+        days: int = 0,
+        days_match: str = "within",
+        start_after: Optional[int] = None,
+        start_before: Optional[int] = None,
+        end_before: Optional[int] = None,
+        campus: Optional[str] = None,
+        building: Optional[str] = None,
+        credit_hours_min: Optional[int] = None,
+        credit_hours_max: Optional[int] = None,
+        open_only: bool = False,
+        part_of_term: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Section]:
+        """
+        Search sections by meeting pattern, time window and attributes.
+
+        Times are minutes since midnight and days a day bitmask (see
+        src.models.meeting_time), so filters run against the indexed
+        integer columns.
+
+        Args:
+            schedule_id: Filter by schedule (defaults to current)
+            subject: Filter by subject code (e.g., "CSCI")
+            days: Day bitmask to match (0 = any days)
+            days_match: "within" meets only on those days, "exact" meets
+                on exactly those days, "includes" meets on at least those days
+            start_after: Earliest start time
+            start_before: Latest start time
+            end_before: Latest end time
+            campus: Filter by campus (e.g., "Athens")
+            building: Filter by building name (partial match)
+            credit_hours_min: Minimum credit hours
+            credit_hours_max: Maximum credit hours
+            open_only: Only active sections with open seats
+            part_of_term: Filter by part of term
+            limit: Maximum results
+            offset: Pagination offset
+
+        Returns:
+            List of Section objects with their course loaded
+        """
+        with self.session_factory() as session:
+            query = (
+                select(Section)
+                .join(Course)
+                .options(contains_eager(Section.course))
+            )
+
+            if schedule_id is None:
+                current = self.get_current_schedule()
+                if current:
+                    schedule_id = current.id
+
+            if schedule_id:
+                query = query.where(Course.schedule_id == schedule_id)
+
+            if subject:
+                query = query.where(Course.subject == subject.upper())
+
+            # "within" and "exact" become equality / IN on day_mask so the
+            # (day_mask, start_minutes, end_minutes) index applies
+            if days:
+                if days_match == "exact":
+                    query = query.where(Section.day_mask == days)
+                elif days_match == "includes":
+                    query = query.where(Section.day_mask.op("&")(days) == days)
+                else:
+                    query = query.where(Section.day_mask.in_(day_subsets(days)))
+
+            if start_after is not None:
+                query = query.where(Section.start_minutes >= start_after)
+            if start_before is not None:
+                query = query.where(Section.start_minutes <= start_before)
+            if end_before is not None:
+                query = query.where(Section.end_minutes <= end_before)
+
+            if campus:
+                query = query.where(Section.campus.ilike(campus))
+            if building:
+                query = query.where(Section.building.ilike(f"%{building}%"))
+            if credit_hours_min is not None:
+                query = query.where(Section.credit_hours >= credit_hours_min)
+            if credit_hours_max is not None:
+                query = query.where(Section.credit_hours <= credit_hours_max)
+            if open_only:
+                query = query.where(Section.status == 'A', Section.seats_available > 0)
+            if part_of_term:
+                query = query.where(Section.part_of_term == part_of_term)
+
+            query = query.order_by(
+                Course.subject, Course.course_number, Section.start_minutes, Section.crn
+            )
+            query = query.limit(limit).offset(offset)
+
+            return list(session.execute(query).scalars().all())
+
     def get_subjects(self, schedule_id: Optional[int] = None) -> list[str]:
         """Get list of all unique subject codes."""
         with self.session_factory() as session:
@@ -14,7 +14,7 @@ Combines:
 """
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -30,7 +30,9 @@ from src.models.database import (
 from src.services.audit_service import AuditService
 from src.services.progress_service import ProgressService
 from src.services.rules_engine import SatisfactionStatus
+from src.services.prerequisite_graph import PrerequisiteGraph, get_prerequisite_graph
 from src.models.campus_graph import CampusGraph, build_campus_graph_from_schedule
+from src.services.campus_graph_store import get_campus_graph
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +113,37 @@ class GraduationPath:
     generated_at: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass(frozen=True)
+class PlanningContext:
+    """
+    Mode-independent inputs for path planning, loaded once per student.
+
+    Holds the audit totals and the unscored course options so that several
+    modes and hours-per-semester variants can be planned without re-running
+    the audit or reloading courses. Planning never mutates the context; each
+    plan works on its own copies of the course options.
+    """
+    user_id: int
+    program_name: str
+    degree_type: str
+    total_hours_required: int
+    total_hours_earned: int
+    completed_codes: frozenset[str]
+    course_options: tuple[CourseOption, ...]
+    prereq_graph: Optional[PrerequisiteGraph] = None
+
+    @property
+    def hours_remaining(self) -> int:
+        return self.total_hours_required - self.total_hours_earned
+
+
+@dataclass(frozen=True)
+class PlanVariant:
+    """One mode / load combination to plan against a shared context."""
+    mode: OptimizationMode = OptimizationMode.BALANCED
+    hours_per_semester: int = 15
+
+
 class GraduationOptimizer:
     """
     Generates optimized graduation paths.
@@ -140,9 +173,9 @@ class GraduationOptimizer:
 
     @property
     def campus_graph(self) -> CampusGraph:
-        """Lazy-load campus graph."""
+        """Lazy-load the shared campus graph."""
         if self._campus_graph is None:
-            self._campus_graph = CampusGraph()
+            self._campus_graph = get_campus_graph()
         return self._campus_graph
 
     def generate_path(
@@ -166,6 +199,61 @@ class GraduationOptimizer:
         Returns:
             GraduationPath with semester-by-semester plan
         """
+        context = self.load_planning_context(user_id)
+        return self.plan_path(
+            context,
+            mode=mode,
+            hours_per_semester=hours_per_semester,
+            start_semester=start_semester,
+            interests=interests,
+        )
+
+    def generate_paths(
+        self,
+        user_id: int,
+        variants: list[PlanVariant],
+        start_semester: Optional[str] = None,
+        interests: Optional[list[str]] = None,
+        context: Optional[PlanningContext] = None,
+    ) -> list[GraduationPath]:
+        """
+        Generate one graduation path per variant from a single audit.
+
+        The audit, completed courses and course options are loaded once and
+        shared by every variant. Variants are planned one after another:
+        planning is pure-Python and CPU-bound, so threads would not help.
+
+        Args:
+            user_id: The student's user ID
+            variants: Mode / hours-per-semester combinations to plan
+            start_semester: Starting semester (default: next available)
+            interests: Student interests for elective selection
+            context: Previously loaded context to reuse
+
+        Returns:
+            GraduationPaths in the same order as variants
+        """
+        if context is None:
+            context = self.load_planning_context(user_id)
+
+        return [
+            self.plan_path(
+                context,
+                mode=variant.mode,
+                hours_per_semester=variant.hours_per_semester,
+                start_semester=start_semester,
+                interests=interests,
+            )
+            for variant in variants
+        ]
+
+    def load_planning_context(self, user_id: int) -> PlanningContext:
+        """
+        Load everything path planning needs that does not depend on the mode.
+
+        Runs the degree audit once and builds the remaining course options
+        with availability and instructor ratings.
+        """
         with self.session_factory() as session:
             # Get user and enrollment
             user = session.get(User, user_id)
@@ -188,68 +276,123 @@ class GraduationOptimizer:
             completed_codes = self.progress_service.get_completed_course_codes(user_id)
 
             # Get remaining courses needed
+            prereq_graph = get_prerequisite_graph(self.session_factory)
             remaining_courses = self._get_remaining_courses(
-                session, audit, completed_codes, mode
-            )
-
-            # Determine starting semester
-            if not start_semester:
-                start_semester = self._get_next_semester()
-
-            # Generate semester plans
-            semesters = self._plan_semesters(
-                session,
-                remaining_courses,
-                completed_codes,
-                mode,
-                hours_per_semester,
-                start_semester,
-                interests or [],
+                session, audit, completed_codes, prereq_graph
             )
 
-            # Calculate estimated graduation
-            hours_remaining = audit.total_hours_required - audit.total_hours_earned
-            total_semesters = len(semesters)
-
-            if semesters:
-                estimated_graduation = semesters[-1].semester
-            else:
-                estimated_graduation = start_semester
-
-            # Build warnings
-            warnings = []
-            if hours_remaining > total_semesters * hours_per_semester:
-                warnings.append(
-                    f"At {hours_per_semester} hours/semester, you may need more semesters. "
-                    f"Consider taking {self.MAX_HOURS_PER_SEMESTER}+ hours some semesters."
-                )
-
-            return GraduationPath(
+            return PlanningContext(
                 user_id=user_id,
                 program_name=program.name,
                 degree_type=program.degree_type,
-                optimization_mode=mode,
-                current_hours=audit.total_hours_earned,
-                hours_remaining=hours_remaining,
-                semesters=semesters,
-                estimated_graduation=estimated_graduation,
-                total_semesters_remaining=total_semesters,
-                warnings=warnings,
+                total_hours_required=audit.total_hours_required,
+                total_hours_earned=audit.total_hours_earned,
+                completed_codes=frozenset(completed_codes),
+                course_options=tuple(remaining_courses),
+                prereq_graph=prereq_graph,
+            )
+
+    def plan_path(
+        self,
+        context: PlanningContext,
+        mode: OptimizationMode = OptimizationMode.BALANCED,
+        hours_per_semester: int = 15,
+        start_semester: Optional[str] = None,
+        interests: Optional[list[str]] = None,
+    ) -> GraduationPath:
+        """
+        Plan a graduation path from a loaded context.
+
+        Does not touch the database or modify the context, so one context
+        can be planned for several modes.
+        """
+        remaining_courses = self._score_course_options(context.course_options, mode)
+
+        # Determine starting semester
+        if not start_semester:
+            start_semester = self._get_next_semester()
+
+        # Generate semester plans
+        semesters = self._plan_semesters(
+            remaining_courses,
+            set(context.completed_codes),
+            context.prereq_graph,
+            mode,
+            hours_per_semester,
+            start_semester,
+            interests or [],
+        )
+
+        # Calculate estimated graduation
+        hours_remaining = context.hours_remaining
+        total_semesters = len(semesters)
+
+        if semesters:
+            estimated_graduation = semesters[-1].semester
+        else:
+            estimated_graduation = start_semester
+
+        # Build warnings
+        warnings = []
+        if hours_remaining > total_semesters * hours_per_semester:
+            warnings.append(
+                f"At {hours_per_semester} hours/semester, you may need more semesters. "
+                f"Consider taking {self.MAX_HOURS_PER_SEMESTER}+ hours some semesters."
             )
 
+        return GraduationPath(
+            user_id=context.user_id,
+            program_name=context.program_name,
+            degree_type=context.degree_type,
+            optimization_mode=mode,
+            current_hours=context.total_hours_earned,
+            hours_remaining=hours_remaining,
+            semesters=semesters,
+            estimated_graduation=estimated_graduation,
+            total_semesters_remaining=total_semesters,
+            warnings=warnings,
+        )
+
+    def _score_course_options(
+        self,
+        course_options: tuple[CourseOption, ...],
+        mode: OptimizationMode,
+    ) -> list[CourseOption]:
+        """Copy shared course options and score them for a mode."""
+        scored = []
+        for option in course_options:
+            scored.append(replace(
+                option,
+                prerequisites=list(option.prerequisites),
+                priority_score=self._calculate_priority(
+                    option.course_code,
+                    option.requirement_category,
+                    option.prereqs_satisfied,
+                    option.seats_available,
+                    option.avg_difficulty,
+                    mode,
+                ),
+            ))
+
+        # Sort by priority
+        scored.sort(key=lambda c: -c.priority_score)
+        return scored
+
     def _get_remaining_courses(
         self,
         session: Session,
         audit,
         completed_codes: set[str],
-        mode: OptimizationMode,
+        prereq_graph: Optional[PrerequisiteGraph] = None,
     ) -> list[CourseOption]:
         """
         Get all courses still needed to satisfy requirements.
 
-        Enriches with instructor ratings and availability.
+        Enriches with instructor ratings and availability. Priority scores
+        are left unset; they depend on the mode (see _score_course_options).
         """
         remaining = []
+        instructor_cache: dict[str, Optional[Instructor]] = {}
 
         for req_result in audit.requirements:
             if req_result.status == SatisfactionStatus.COMPLETE:
@@ -282,15 +425,13 @@ class GraduationOptimizer:
                     req_result.requirement_name,
                     req_result.category,
                     completed_codes,
-                    mode,
+                    instructor_cache,
+                    prereq_graph,
                 )
 
                 if course_option:
                     remaining.append(course_option)
 
-        # Sort by priority
-        remaining.sort(key=lambda c: -c.priority_score)
-
         return remaining
 
     def _build_course_option(
@@ -301,7 +442,8 @@ class GraduationOptimizer:
         requirement_name: str,
         requirement_category: str,
         completed_codes: set[str],
-        mode: OptimizationMode,
+        instructor_cache: dict[str, Optional[Instructor]],
+        prereq_graph: Optional[PrerequisiteGraph] = None,
     ) -> Optional[CourseOption]:
         """Build a CourseOption with all relevant data."""
 
@@ -321,8 +463,14 @@ class GraduationOptimizer:
             if bulletin.prerequisites:
                 prerequisites = self._parse_prerequisites(bulletin.prerequisites)
 
+        # Prefer the structured AND-of-OR prerequisites when they are indexed
+        if prereq_graph is not None and prereq_graph.has_prerequisites(course_code):
+            prerequisites = prereq_graph.prerequisite_codes(course_code)
+
         # Check if prereqs are satisfied
-        prereqs_satisfied = all(p in completed_codes for p in prerequisites)
+        prereqs_satisfied = self._prereqs_met(
+            prereq_graph, course_code, prerequisites, completed_codes
+        )
 
         # Get current semester availability
         current_course = session.execute(
@@ -343,23 +491,13 @@ class GraduationOptimizer:
             seats_available = sum(s.seats_available for s in sections if s.is_available)
 
             # Get instructor ratings
-            instructor_data = self._get_instructor_ratings(session, sections, mode)
+            instructor_data = self._get_instructor_ratings(session, sections, instructor_cache)
             if instructor_data:
                 avg_rating = instructor_data.get("avg_rating")
                 avg_difficulty = instructor_data.get("avg_difficulty")
                 easiest_instructor = instructor_data.get("easiest_instructor")
                 easiest_crn = instructor_data.get("easiest_crn")
 
-        # Calculate priority score
-        priority_score = self._calculate_priority(
-            course_code,
-            requirement_category,
-            prereqs_satisfied,
-            seats_available,
-            avg_difficulty,
-            mode,
-        )
-
         return CourseOption(
             course_code=course_code,
             title=title,
@@ -375,16 +513,15 @@ class GraduationOptimizer:
             easiest_section_crn=easiest_crn,
             prerequisites=prerequisites,
             prereqs_satisfied=prereqs_satisfied,
-            priority_score=priority_score,
         )
 
     def _get_instructor_ratings(
         self,
         session: Session,
         sections: list[Section],
-        mode: OptimizationMode,
+        instructor_cache: dict[str, Optional[Instructor]],
     ) -> dict:
-        """Get instructor ratings for sections."""
+        """Get instructor ratings for sections, memoizing lookups by name."""
         ratings = []
         difficulties = []
         easiest = None
@@ -394,10 +531,12 @@ class GraduationOptimizer:
             if not section.instructor:
                 continue
 
-            instructor = session.execute(
-                select(Instructor)
-                .where(Instructor.name == section.instructor)
-            ).scalar_one_or_none()
+            if section.instructor not in instructor_cache:
+                instructor_cache[section.instructor] = session.execute(
+                    select(Instructor)
+                    .where(Instructor.name == section.instructor)
+                ).scalar_one_or_none()
+            instructor = instructor_cache[section.instructor]
 
             if instructor:
                 if instructor.rmp_rating:
@@ -481,9 +620,9 @@ class GraduationOptimizer:
 
     def _plan_semesters(
         self,
-        session: Session,
         remaining_courses: list[CourseOption],
         completed_codes: set[str],
+        prereq_graph: Optional[PrerequisiteGraph],
         mode: OptimizationMode,
         hours_per_semester: int,
         start_semester: str,
@@ -513,8 +652,9 @@ class GraduationOptimizer:
                 any_unlocked = False
                 for course in remaining_courses:
                     if course.course_code not in courses_scheduled:
-                        course.prereqs_satisfied = all(
-                            p in unlocked_codes for p in course.prerequisites
+                        course.prereqs_satisfied = self._prereqs_met(
+                            prereq_graph, course.course_code,
+                            course.prerequisites, unlocked_codes,
                         )
                         if course.prereqs_satisfied:
                             any_unlocked = True
@@ -568,8 +708,9 @@ class GraduationOptimizer:
             # Update remaining courses prerequisites
             for course in remaining_courses:
                 if course.course_code not in courses_scheduled:
-                    course.prereqs_satisfied = all(
-                        p in unlocked_codes for p in course.prerequisites
+                    course.prereqs_satisfied = self._prereqs_met(
+                        prereq_graph, course.course_code,
+                        course.prerequisites, unlocked_codes,
                     )
                     course.priority_score = self._calculate_priority(
                         course.course_code,
@@ -620,6 +761,23 @@ class GraduationOptimizer:
 
         return selected
 
+    def _prereqs_met(
+        self,
+        prereq_graph: Optional[PrerequisiteGraph],
+        course_code: str,
+        prerequisites: list[str],
+        completed_codes: set[str],
+    ) -> bool:
+        """
+        Check prerequisites, using the compiled graph's OR groups when available.
+
+        Falls back to requiring every course named in the bulletin text for
+        courses that have no structured prerequisites yet.
+        """
+        if prereq_graph is not None and prereq_graph.has_prerequisites(course_code):
+            return prereq_graph.is_eligible(course_code, completed_codes)
+        return all(p in completed_codes for p in prerequisites)
+
     def _parse_prerequisites(self, prereq_text: str) -> list[str]:
         """Extract course codes from prerequisite text."""
         import re
@@ -714,6 +872,7 @@ class GraduationOptimizer:
         semester: str,
         target_hours: int = 12,
         preferred_times: Optional[list[str]] = None,  # ["afternoon", "no_early"]
+        context: Optional[PlanningContext] = None,
     ) -> SemesterPlan:
         """
         Generate an optimal "party mode" schedule for a specific semester.
@@ -723,36 +882,40 @@ class GraduationOptimizer:
         - Good instructors (high RMP rating)
         - Preferred times (no 8am classes, etc.)
         - Minimal walking between classes
+
+        Pass a PlanningContext to reuse an already loaded audit.
         """
-        with self.session_factory() as session:
-            # Get needed courses with party mode optimization
-            path = self.generate_path(
-                user_id,
-                mode=OptimizationMode.PARTY_MODE,
-                hours_per_semester=target_hours,
-                start_semester=semester,
-            )
+        if context is None:
+            context = self.load_planning_context(user_id)
+
+        # Get needed courses with party mode optimization
+        path = self.plan_path(
+            context,
+            mode=OptimizationMode.PARTY_MODE,
+            hours_per_semester=target_hours,
+            start_semester=semester,
+        )
 
-            if path.semesters:
-                semester_plan = path.semesters[0]
+        if path.semesters:
+            semester_plan = path.semesters[0]
 
-                # Add party mode notes
-                semester_plan.notes.append(
-                    "Schedule optimized for low difficulty and good instructor ratings"
-                )
+            # Add party mode notes
+            semester_plan.notes.append(
+                "Schedule optimized for low difficulty and good instructor ratings"
+            )
 
-                # Filter for time preferences if specified
-                if preferred_times and "no_early" in preferred_times:
-                    semester_plan.notes.append("Avoiding early morning classes where possible")
+            # Filter for time preferences if specified
+            if preferred_times and "no_early" in preferred_times:
+                semester_plan.notes.append("Avoiding early morning classes where possible")
 
-                return semester_plan
+            return semester_plan
 
-            return SemesterPlan(
-                semester=semester,
-                courses=[],
-                total_hours=0,
-                notes=["No courses available - check requirements"],
-            )
+        return SemesterPlan(
+            semester=semester,
+            courses=[],
+            total_hours=0,
+            notes=["No courses available - check requirements"],
+        )
 
 
 def create_graduation_optimizer() -> GraduationOptimizer:
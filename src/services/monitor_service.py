@@ -3,10 +3,17 @@ URL monitoring service for detecting schedule changes.
 
 Monitors UGA schedule PDF URLs for changes and automatically imports
 new versions when detected.
+
+- Validators (ETag, Last-Modified) and content hashes are persisted in
+  source_states, so a restart does not re-import unchanged PDFs
+- Checks are conditional GETs over one pooled client; changed bodies are
+  streamed to disk through an incremental hash
+- Imports run on a background worker, off the check loop
 """
 import asyncio
 import hashlib
 import logging
+import os
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +23,7 @@ from typing import Callable, Optional
 import httpx
 
 from src.services.course_service import CourseService, create_service
+from src.services.source_state import SourceStateStore, SourceValidators, get_source_state_store
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +34,13 @@ class MonitoredURL:
     url: str
     name: str
     last_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
     last_check: Optional[datetime] = None
     last_change: Optional[datetime] = None
     check_count: int = 0
     error_count: int = 0
+    pending_hash: Optional[str] = None  # Downloaded, import still queued
 
 
 @dataclass
@@ -55,6 +66,8 @@ class ScheduleMonitor:
 
         # Or run continuously
         await monitor.run(interval_seconds=3600)  # Check hourly
+
+        await monitor.aclose()
     """
 
     # Known UGA schedule URLs
@@ -64,22 +77,58 @@ class ScheduleMonitor:
         "fall": "https://apps.reg.uga.edu/soc/OnlineSOCfall.pdf",
     }
 
+    # Bytes per chunk when streaming a PDF to disk
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
     def __init__(
         self,
         service: Optional[CourseService] = None,
         auto_import: bool = True,
+        state_store: Optional[SourceStateStore] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         self.service = service or create_service()
         self.auto_import = auto_import
+        self.state_store = state_store or get_source_state_store()
         self.urls: dict[str, MonitoredURL] = {}
         self.callbacks: list[Callable[[ChangeEvent], None]] = []
         self._running = False
+        self._client = client
+        self._owns_client = client is None
+        self._imports: Optional[asyncio.Queue] = None
+        self._import_worker: Optional[asyncio.Task] = None
 
     def add_url(self, url: str, name: str) -> None:
-        """Add a URL to monitor."""
-        self.urls[url] = MonitoredURL(url=url, name=name)
+        """Add a URL to monitor, restoring its last known state."""
+        monitored = MonitoredURL(url=url, name=name)
+        stored = self.state_store.get(url)
+        if stored:
+            monitored.last_hash = stored.content_hash
+            monitored.etag = stored.etag
+            monitored.last_modified = stored.last_modified
+        self.urls[url] = monitored
         logger.info(f"Added URL to monitor: {name} ({url})")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive client shared by every check."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Finish queued imports and close the HTTP client if we created it."""
+        await self.wait_for_imports()
+        if self._import_worker:
+            self._import_worker.cancel()
+            self._import_worker = None
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
     def add_known_urls(self) -> None:
         """Add all known UGA schedule URLs."""
         for name, url in self.KNOWN_URLS.items():
@@ -93,6 +142,11 @@ class ScheduleMonitor:
         """
         Check a single URL for changes.
 
+        Sends a conditional GET using the stored validators. A 304, or a
+        200 whose ETag matches the stored one, ends the check without
+        reading the body. Otherwise the body is streamed to a temporary
+        file while it is hashed.
+
         Returns a ChangeEvent if the content has changed, None otherwise.
         """
         if url not in self.urls:
@@ -103,81 +157,160 @@ class ScheduleMonitor:
         monitored.check_count += 1
         monitored.last_check = datetime.now()
 
+        headers = {}
+        if monitored.last_hash:
+            if monitored.etag:
+                headers["If-None-Match"] = monitored.etag
+            if monitored.last_modified:
+                headers["If-Modified-Since"] = monitored.last_modified
+
+        temp_path = None
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    follow_redirects=True,
-                    timeout=60.0,
-                )
+            async with self._get_client().stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and monitored.last_hash:
+                    self._record_state(monitored, changed=False)
+                    return None
                 response.raise_for_status()
 
-                # Calculate hash
-                content_hash = hashlib.sha256(response.content).hexdigest()
-
-                # Check for change
-                if monitored.last_hash and monitored.last_hash != content_hash:
-                    event = ChangeEvent(
-                        url=url,
-                        name=monitored.name,
-                        old_hash=monitored.last_hash,
-                        new_hash=content_hash,
-                        timestamp=datetime.now(),
-                    )
-
-                    monitored.last_hash = content_hash
-                    monitored.last_change = datetime.now()
-
-                    logger.info(f"Change detected: {monitored.name}")
-
-                    # Auto-import if enabled
-                    if self.auto_import:
-                        await self._import_pdf(url, response.content)
-
-                    # Notify callbacks
-                    for callback in self.callbacks:
-                        try:
-                            callback(event)
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
-
-                    return event
-
-                elif monitored.last_hash is None:
-                    # First check - store hash but don't report as change
-                    monitored.last_hash = content_hash
-                    logger.info(f"Initial hash recorded for {monitored.name}")
+                etag = response.headers.get("ETag")
+                strong = etag and not etag.startswith("W/")
+                if monitored.last_hash and strong and etag == monitored.etag:
+                    # Server ignored If-None-Match but the strong ETag is unchanged
+                    self._record_state(monitored, changed=False)
+                    return None
+
+                hasher = hashlib.sha256()
+                fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        f.write(chunk)
+                content_hash = hasher.hexdigest()
+                last_modified = response.headers.get("Last-Modified")
+
+            old_hash = monitored.last_hash
+            validators = SourceValidators(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=content_hash,
+            )
+
+            if old_hash == content_hash:
+                self._apply_validators(monitored, validators)
+                self._record_state(monitored, changed=False)
+                return None
+            if monitored.pending_hash == content_hash:
+                # Already queued for import; state is saved when it finishes
+                return None
 
-                    # Import on first check if auto_import
-                    if self.auto_import:
-                        await self._import_pdf(url, response.content)
+            event = None
+            if old_hash:
+                monitored.last_change = datetime.now()
+                event = ChangeEvent(
+                    url=url,
+                    name=monitored.name,
+                    old_hash=old_hash,
+                    new_hash=content_hash,
+                    timestamp=monitored.last_change,
+                )
+                logger.info(f"Change detected: {monitored.name}")
+            else:
+                # First check - store hash but don't report as change
+                logger.info(f"Initial hash recorded for {monitored.name}")
+
+            if self.auto_import:
+                # Validators are applied and saved once the import succeeds,
+                # so a failed import is retried on the next check
+                self._queue_import(monitored, temp_path, validators, changed=event is not None)
+                temp_path = None
+            else:
+                self._apply_validators(monitored, validators)
+                self._record_state(monitored, changed=event is not None)
 
-                return None
+            if event:
+                for callback in self.callbacks:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
+            return event
 
         except Exception as e:
             monitored.error_count += 1
             logger.error(f"Error checking {monitored.name}: {e}")
             return None
+        finally:
+            if temp_path:
+                Path(temp_path).unlink(missing_ok=True)
+
+    def _apply_validators(self, monitored: MonitoredURL, validators: SourceValidators) -> None:
+        """Make a download's validators the URL's current state."""
+        monitored.etag = validators.etag
+        monitored.last_modified = validators.last_modified
+        monitored.last_hash = validators.content_hash
+
+    def _record_state(self, monitored: MonitoredURL, changed: bool) -> None:
+        """Persist a URL's validators and hash."""
+        self.state_store.record(
+            SourceValidators(
+                url=monitored.url,
+                etag=monitored.etag,
+                last_modified=monitored.last_modified,
+                content_hash=monitored.last_hash,
+            ),
+            changed=changed,
+            name=monitored.name,
+        )
 
-    async def _import_pdf(self, url: str, content: bytes) -> None:
-        """Import PDF content into the database."""
-        try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-                f.write(content)
-                temp_path = f.name
+    def _queue_import(
+        self,
+        monitored: MonitoredURL,
+        pdf_path: str,
+        validators: SourceValidators,
+        changed: bool,
+    ) -> None:
+        """Hand a downloaded PDF and its pending validators to the import worker."""
+        if self._imports is None:
+            self._imports = asyncio.Queue()
+        if self._import_worker is None or self._import_worker.done():
+            self._import_worker = asyncio.create_task(self._run_imports())
+        monitored.pending_hash = validators.content_hash
+        self._imports.put_nowait((monitored, pdf_path, validators, changed))
+
+    async def _run_imports(self) -> None:
+        """
+        Import queued PDFs one at a time, off the event loop.
 
+        A PDF's validators become the URL's state only after its import
+        succeeds; after a failure the old ones stay, so the next check
+        downloads the PDF again instead of getting a 304.
+        """
+        while True:
+            monitored, pdf_path, validators, changed = await self._imports.get()
             try:
-                schedule, result = self.service.import_pdf(temp_path, url)
+                schedule, result = await asyncio.to_thread(
+                    self.service.import_pdf, pdf_path, monitored.url, parallel=True
+                )
                 logger.info(
                     f"Imported {schedule.term}: "
                     f"{schedule.total_courses} courses, "
                     f"{schedule.total_sections} sections"
                 )
+                self._apply_validators(monitored, validators)
+                self._record_state(monitored, changed=changed)
+            except Exception as e:
+                logger.error(f"Failed to import PDF: {e}")
             finally:
-                Path(temp_path).unlink()
+                if monitored.pending_hash == validators.content_hash:
+                    monitored.pending_hash = None
+                Path(pdf_path).unlink(missing_ok=True)
+                self._imports.task_done()
 
-        except Exception as e:
-            logger.error(f"Failed to import PDF: {e}")
+    async def wait_for_imports(self) -> None:
+        """Wait until every queued import has finished."""
+        if self._imports is not None:
+            await self._imports.join()
 
     async def check_all(self) -> list[ChangeEvent]:
         """Check all monitored URLs for changes."""
@@ -218,9 +351,10 @@ class ScheduleMonitor:
 
             iteration += 1
 
-            if self._running:
+            if self._running and not (max_iterations and iteration >= max_iterations):
                 await asyncio.sleep(interval_seconds)
 
+        await self.wait_for_imports()
         logger.info("Monitor stopped")
 
     def stop(self) -> None:
@@ -242,6 +376,7 @@ class ScheduleMonitor:
                 }
                 for m in self.urls.values()
             ],
+            "pending_imports": self._imports.qsize() if self._imports else 0,
         }
 
 
@@ -254,7 +389,10 @@ async def run_monitor(interval: int = 3600) -> None:
         print(f"[{event.timestamp}] Schedule changed: {event.name}")
 
     monitor.on_change(on_change)
-    await monitor.run(interval_seconds=interval)
+    try:
+        await monitor.run(interval_seconds=interval)
+    finally:
+        await monitor.aclose()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+"""
+Adaptive polling for seat availability refreshes.
+
+Decides how often each term's registrar CSV is polled. The interval
+follows the observed change rate, so polling tightens during registration
+and drop/add and relaxes to the configured maximum mid-semester.
+
+Change rate per term (changes per hour) is the larger of:
+- scan rate: exponentially smoothed rate of content changes seen by
+  successive scans
+- history rate: seat-count changes per hour recorded in SeatHistory over
+  the last seat_poll_history_hours
+
+The target interval is the time in which one change is expected
+(3600 / rate), clamped to [seat_poll_min_interval, seat_poll_max_interval].
+State is kept on the source's SourceState row.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, func, select
+
+from src.config import settings
+from src.models.database import (
+    Course, Schedule, SeatHistory, Section, SourceState, get_session_factory
+)
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest observation in the smoothed scan rate
+SMOOTHING = 0.3
+
+
+@dataclass
+class PollDecision:
+    """Polling state and decision for one term."""
+    term: str
+    url: str
+    interval: int  # seconds
+    next_poll_at: Optional[datetime]
+    due: bool
+    scan_rate: float = 0.0  # changes/hour from successive scans
+    history_rate: float = 0.0  # seat changes/hour from SeatHistory
+    last_checked: Optional[datetime] = None
+    last_changed: Optional[datetime] = None
+    check_count: int = 0
+    change_count: int = 0
+
+    @property
+    def change_rate(self) -> float:
+        return max(self.scan_rate, self.history_rate)
+
+    def to_dict(self) -> dict:
+        return {
+            "term": self.term,
+            "url": self.url,
+            "interval_seconds": self.interval,
+            "next_poll_at": self.next_poll_at,
+            "due": self.due,
+            "change_rate": round(self.change_rate, 3),
+            "scan_rate": round(self.scan_rate, 3),
+            "history_rate": round(self.history_rate, 3),
+            "last_checked": self.last_checked,
+            "last_changed": self.last_changed,
+            "check_count": self.check_count,
+            "change_count": self.change_count,
+        }
+
+
+class SeatPollScheduler:
+    """Chooses which terms are due for a seat refresh and when to poll next."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        min_interval: Optional[int] = None,
+        max_interval: Optional[int] = None,
+        history_hours: Optional[int] = None,
+    ):
+        self.session_factory = session_factory or get_session_factory()
+        self.min_interval = min_interval or settings.seat_poll_min_interval
+        self.max_interval = max_interval or settings.seat_poll_max_interval
+        self.history_hours = history_hours or settings.seat_poll_history_hours
+
+    def plan(self, sources: dict[str, str], now: Optional[datetime] = None) -> list[PollDecision]:
+        """
+        Load polling state for each term (term -> source URL).
+
+        Terms never polled before are due immediately.
+        """
+        now = now or datetime.utcnow()
+        with self.session_factory() as session:
+            rows = {
+                row.url: row
+                for row in session.execute(
+                    select(SourceState).where(SourceState.url.in_(list(sources.values())))
+                ).scalars()
+            }
+            history = self._history_rates(session, list(sources), now)
+
+        decisions = []
+        for term, url in sources.items():
+            row = rows.get(url)
+            interval = (row.poll_interval if row else None) or self.min_interval
+            next_poll_at = row.next_poll_at if row else None
+            decisions.append(PollDecision(
+                term=term,
+                url=url,
+                interval=interval,
+                next_poll_at=next_poll_at,
+                due=next_poll_at is None or next_poll_at <= now,
+                scan_rate=(row.change_rate if row else None) or 0.0,
+                history_rate=history.get(term, 0.0),
+                last_checked=row.last_checked if row else None,
+                last_changed=row.last_changed if row else None,
+                check_count=row.check_count if row else 0,
+                change_count=row.change_count if row else 0,
+            ))
+        return decisions
+
+    def record(
+        self,
+        decision: PollDecision,
+        changed: bool,
+        failed: bool = False,
+        now: Optional[datetime] = None,
+    ) -> PollDecision:
+        """
+        Update a term's rate and interval after a poll and persist them.
+
+        decision must come from plan() before the poll, so its
+        last_checked is the previous poll time. A failed poll keeps the
+        current interval.
+        """
+        now = now or datetime.utcnow()
+        if not failed:
+            if decision.last_checked:
+                elapsed_hours = max((now - decision.last_checked).total_seconds(), 1) / 3600
+            else:
+                elapsed_hours = decision.interval / 3600
+            observed = (1.0 if changed else 0.0) / elapsed_hours
+            decision.scan_rate = SMOOTHING * observed + (1 - SMOOTHING) * decision.scan_rate
+            decision.interval = self.target_interval(decision.change_rate)
+
+        decision.next_poll_at = now + timedelta(seconds=decision.interval)
+        decision.due = False
+
+        with self.session_factory() as session:
+            row = session.execute(
+                select(SourceState).where(SourceState.url == decision.url)
+            ).scalar_one_or_none()
+            if row is None:
+                row = SourceState(
+                    url=decision.url, name=decision.term, check_count=0, change_count=0
+                )
+                session.add(row)
+            row.change_rate = decision.scan_rate
+            row.poll_interval = decision.interval
+            row.next_poll_at = decision.next_poll_at
+            session.commit()
+
+        logger.info(
+            f"{decision.term}: {'changed' if changed else 'unchanged'}, "
+            f"{decision.change_rate:.2f} changes/h, next poll in {decision.interval}s"
+        )
+        return decision
+
+    def target_interval(self, change_rate: float) -> int:
+        """Seconds in which one change is expected, clamped to the bounds."""
+        if change_rate <= 0:
+            return self.max_interval
+        return int(min(self.max_interval, max(self.min_interval, 3600 / change_rate)))
+
+    def _history_rates(self, session, terms: list[str], now: datetime) -> dict[str, float]:
+        """Seat-count changes per hour over the history window, by term."""
+        if not terms:
+            return {}
+
+        since = now - timedelta(hours=self.history_hours)
+        previous = func.lag(SeatHistory.seats_available).over(
+            partition_by=(Schedule.term, SeatHistory.crn), order_by=SeatHistory.recorded_at
+        )
+        snapshots = (
+            select(
+                Schedule.term.label("term"),
+                SeatHistory.seats_available.label("seats"),
+                previous.label("previous_seats"),
+            )
+            .select_from(SeatHistory)
+            .join(Section, SeatHistory.section_id == Section.id)
+            .join(Course, Section.course_id == Course.id)
+            .join(Schedule, Course.schedule_id == Schedule.id)
+            .where(and_(Schedule.term.in_(terms), SeatHistory.recorded_at >= since))
+            .subquery()
+        )
+        query = (
+            select(snapshots.c.term, func.count())
+            .where(
+                snapshots.c.previous_seats.is_not(None),
+                snapshots.c.previous_seats != snapshots.c.seats,
+            )
+            .group_by(snapshots.c.term)
+        )
+        return {
+            term: count / self.history_hours
+            for term, count in session.execute(query).all()
+        }
+
+
+def create_poll_scheduler() -> SeatPollScheduler:
+    """Create a SeatPollScheduler with default configuration."""
+    return SeatPollScheduler()
@@ -14,10 +14,11 @@ from sqlalchemy import select, and_
 from sqlalchemy.orm import Session, selectinload
 
 from src.models.database import (
-    CoursePrerequisite, CourseUnlock, Course, Section, Schedule,
+    Course, Section, Schedule,
     Program, ProgramRequirement, RequirementCourse,
     get_engine, get_session_factory
 )
+from src.services.prerequisite_graph import PrerequisiteGraph, get_prerequisite_graph
 
 
 class GoalType(str, Enum):
@@ -123,11 +124,12 @@ class PossibilitiesService:
             course_codes = [c["course_code"] for c in program_courses]
             availability_map = self._get_availability_map(session, course_codes)
 
-            # Step 3: Get prerequisite data in bulk
-            prereq_map = self._get_prerequisite_map(session, course_codes)
+            # Step 3: Get the compiled prerequisite graph
+            graph = get_prerequisite_graph(self.session_factory)
+            completed_mask = graph.mask_of(completed)
 
             # Step 4: Get which courses are prerequisites for others (for unlock scoring)
-            unlock_value_map = self._get_unlock_value_map(session, course_codes)
+            unlock_value_map = self._get_unlock_value_map(graph, course_codes)
 
             # Step 5: Build possibilities with eligibility check
             possibilities = []
@@ -144,8 +146,7 @@ class PossibilitiesService:
                     continue  # Not offered or full
 
                 # Check prerequisites
-                prereqs = prereq_map.get(code, [])
-                prereqs_met, missing = self._check_prerequisites(prereqs, completed)
+                prereqs_met, missing = self._check_prerequisites(graph, code, completed_mask)
 
                 if not prereqs_met:
                     continue  # Prerequisites not met
@@ -299,59 +300,23 @@ class PossibilitiesService:
 
         return availability
 
-    def _get_prerequisite_map(
-        self, session: Session, course_codes: list[str]
-    ) -> dict[str, list[dict]]:
-        """Bulk fetch prerequisites for courses."""
-        if not course_codes:
-            return {}
-
-        query = (
-            select(CoursePrerequisite)
-            .where(CoursePrerequisite.course_code.in_(course_codes))
-            .order_by(CoursePrerequisite.group_id)
-        )
-        prereqs = session.execute(query).scalars().all()
-
-        # Group by course
-        prereq_map: dict[str, list[dict]] = {}
-        for p in prereqs:
-            if p.course_code not in prereq_map:
-                prereq_map[p.course_code] = []
-            prereq_map[p.course_code].append({
-                "prerequisite_code": p.prerequisite_code,
-                "group_id": p.group_id,
-                "min_grade": p.min_grade,
-            })
-
-        return prereq_map
-
     def _get_unlock_value_map(
-        self, session: Session, course_codes: list[str]
+        self, graph: PrerequisiteGraph, course_codes: list[str]
     ) -> dict[str, int]:
         """
         Calculate how many courses each course unlocks.
 
         Courses that are prerequisites for many others have higher unlock value.
         """
-        if not course_codes:
-            return {}
-
-        # Count how many courses each code is a prerequisite for
-        query = (
-            select(CoursePrerequisite.prerequisite_code)
-            .where(CoursePrerequisite.prerequisite_code.in_(course_codes))
-        )
-        results = session.execute(query).all()
-
         unlock_counts: dict[str, int] = {}
-        for (prereq_code,) in results:
-            unlock_counts[prereq_code] = unlock_counts.get(prereq_code, 0) + 1
-
+        for code in course_codes:
+            count = graph.unlock_count(code)
+            if count:
+                unlock_counts[code] = count
         return unlock_counts
 
     def _check_prerequisites(
-        self, prereqs: list[dict], completed: set[str]
+        self, graph: PrerequisiteGraph, course_code: str, completed_mask: int
     ) -> tuple[bool, list[str]]:
         """
         Check if prerequisites are met.
@@ -359,25 +324,12 @@ class PossibilitiesService:
         Prerequisites with same group_id are OR alternatives.
         Different group_ids must ALL be satisfied.
         """
-        if not prereqs:
+        if graph.is_eligible(course_code, completed_mask):
             return True, []
 
-        # Group by group_id
-        groups: dict[int, list[str]] = {}
-        for p in prereqs:
-            gid = p["group_id"]
-            if gid not in groups:
-                groups[gid] = []
-            groups[gid].append(p["prerequisite_code"])
-
-        # Check each group - at least one course per group must be completed
-        missing = []
-        for gid, alternatives in groups.items():
-            if not any(alt in completed for alt in alternatives):
-                # None of the alternatives completed
-                missing.append(alternatives[0])  # Report first alternative as missing
-
-        return len(missing) == 0, missing
+        # Report first alternative of each unsatisfied group as missing
+        missing = graph.missing_prerequisites(course_code, completed_mask)
+        return False, [alternatives[0] for alternatives in missing]
 
     def _calculate_priority(
         self, possibility: CoursePossibility,
@@ -0,0 +1,495 @@
+"""
+Prerequisite Expression Grammar.
+
+Tokenizer and recursive-descent parser for UGA Bulletin prerequisite text.
+Produces a normalized boolean expression tree instead of flat AND-of-OR
+groups, so nesting like "(A or B) and (C or D or (E and F))" is kept.
+
+Grammar (OR binds tighter than AND, matching how the bulletin is written,
+e.g. "CSCI 1302 and MATH 2250 or MATH 2260"):
+
+    expr     := or_expr ((AND | <juxtaposition>) or_expr)*
+    or_expr  := postfix (OR postfix)*
+    postfix  := [GRADE_IN | CONCURRENT_IN] pair (GRADE | CONCURRENT)*
+    pair     := primary ('-' primary)*
+    primary  := COURSE | '(' expr ')' | NOISE [primary]
+
+- Bare numbers inherit the previous subject ("CSCI 1301 or 1301H")
+- "1301-1301L" means lecture AND lab and binds tightest, so
+  "A-B or C-D" is (A and B) or (C and D); "1301/1301E" means either
+- Comma lists take the meaning of the conjunction that ends them
+  ("A, B, or C" is OR, "A, B, and C" is AND)
+- A grade or concurrency clause applies to the preceding course or
+  parenthesized group; a grade clause that ends the whole text applies to
+  every course that has no grade of its own
+- Non-course phrases ("permission of department") are dropped
+
+Parsed trees are cached by text, so re-parsing the bulletin is cheap.
+"""
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import product
+from typing import Optional, Union
+
+# Maximum AND-of-OR groups produced when flattening an expression for storage
+MAX_CNF_GROUPS = 32
+
+# Letter grades from lowest to highest, for comparing minimum grade clauses
+_GRADE_RANK = {
+    grade: rank
+    for rank, grade in enumerate(
+        ["F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
+    )
+}
+
+# Phrases with no course content that would otherwise add structure
+_NOISE_PHRASES = [
+    re.compile(
+        r'permission\s+of\s+(?:the\s+)?(?:department|instructor|major\s+advisor)', re.IGNORECASE
+    ),
+    re.compile(r'admission\s+to\s+[^,;.()]+', re.IGNORECASE),
+    re.compile(r'not\s+open\s+to\s+students\s+with\s+credit\s+in\s+.+?(?:\.|$)', re.IGNORECASE),
+]
+
+_TOKEN_RE = re.compile(r'''
+    (?P<course>\b[A-Z]{2,4}\s*\d{4}[A-Z]?\b)
+  | (?P<number>\b\d{4}[A-Z]?\b)
+  | (?P<grade>(?i:(?:(?:with\s+)?an?\s+)?(?:minimum\s+)?grade\s+of\s+(?:an?\s+)?["\u201c']?)
+        (?P<grade_value>[A-DF][+-]?)(?![A-Za-z])["\u201d']?
+        (?i:\s+or\s+(?:better|higher|above))?
+        (?P<grade_in>(?i:\s+in)\b)?)
+  | (?P<concurrent>(?i:\(?\s*(?:which\s+)?(?:may|can)\s+be\s+taken\s+concurrently\s*\)?
+        |\bconcurrently\b(?!\s+enroll)))
+  | (?P<concurrent_in>(?i:\bconcurrent(?:ly)?\s+enroll(?:ment|ed)(?:\s+in)?\b))
+  | (?P<lparen>[(\[])
+  | (?P<rparen>[)\]])
+  | (?P<and>(?i:\band\b)|&|;)
+  | (?P<or>(?i:\bor\b)|/)
+  | (?P<hyphen>-(?=\s*\d{4}))
+  | (?P<comma>,)
+  | (?P<noise>[A-Za-z]+|[^\sA-Za-z0-9])
+''', re.VERBOSE)
+
+_SPACE_RE = re.compile(r'\s+')
+
+
+# =============================================================================
+# Expression tree
+# =============================================================================
+
+@dataclass(frozen=True)
+class CourseRequirement:
+    """A single course in a prerequisite expression."""
+    course_code: str
+    min_grade: Optional[str] = None
+    concurrent_allowed: bool = False
+
+    def courses(self) -> list["CourseRequirement"]:
+        return [self]
+
+    def evaluate(self, completed: set[str]) -> bool:
+        return self.course_code in completed
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "COURSE",
+            "code": self.course_code,
+            "min_grade": self.min_grade,
+            "concurrent": self.concurrent_allowed,
+        }
+
+
+@dataclass(frozen=True)
+class AllOf:
+    """Every child must be satisfied."""
+    children: tuple["PrereqExpr", ...]
+
+    def courses(self) -> list[CourseRequirement]:
+        return [c for child in self.children for c in child.courses()]
+
+    def evaluate(self, completed: set[str]) -> bool:
+        return all(child.evaluate(completed) for child in self.children)
+
+    def to_dict(self) -> dict:
+        return {"type": "AND", "children": [c.to_dict() for c in self.children]}
+
+
+@dataclass(frozen=True)
+class AnyOf:
+    """At least one child must be satisfied."""
+    children: tuple["PrereqExpr", ...]
+
+    def courses(self) -> list[CourseRequirement]:
+        return [c for child in self.children for c in child.courses()]
+
+    def evaluate(self, completed: set[str]) -> bool:
+        return any(child.evaluate(completed) for child in self.children)
+
+    def to_dict(self) -> dict:
+        return {"type": "OR", "children": [c.to_dict() for c in self.children]}
+
+
+PrereqExpr = Union[CourseRequirement, AllOf, AnyOf]
+
+
+def _combine(kind: type, children: list[Optional[PrereqExpr]]) -> Optional[PrereqExpr]:
+    """Build a normalized AND/OR node: flattened, deduplicated, no singletons."""
+    flat: list[PrereqExpr] = []
+    for child in children:
+        if child is None:
+            continue
+        if isinstance(child, kind):
+            flat.extend(child.children)
+        else:
+            flat.append(child)
+
+    unique: list[PrereqExpr] = []
+    for child in flat:
+        if child not in unique:
+            unique.append(child)
+
+    if not unique:
+        return None
+    if len(unique) == 1:
+        return unique[0]
+    return kind(tuple(unique))
+
+
+def _with_flags(
+    node: Optional[PrereqExpr],
+    min_grade: Optional[str] = None,
+    concurrent: bool = False,
+) -> Optional[PrereqExpr]:
+    """Apply a grade / concurrency clause to every course under a node."""
+    if node is None or (min_grade is None and not concurrent):
+        return node
+    if isinstance(node, CourseRequirement):
+        return replace(
+            node,
+            min_grade=node.min_grade or min_grade,
+            concurrent_allowed=node.concurrent_allowed or concurrent,
+        )
+    return type(node)(tuple(_with_flags(c, min_grade, concurrent) for c in node.children))
+
+
+# =============================================================================
+# Tokenizer
+# =============================================================================
+
+def tokenize(text: str) -> list[tuple[str, str]]:
+    """
+    Split prerequisite text into (kind, value) tokens.
+
+    Course tokens are normalized to "SUBJ 1234", bare numbers get the
+    previous subject, runs of noise collapse into one token and comma
+    separators are resolved to AND/OR.
+    """
+    tokens: list[tuple[str, str]] = []
+    subject: Optional[str] = None
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "grade_value" or kind == "grade_in":
+            kind = "grade"
+
+        if kind == "course":
+            code = _SPACE_RE.sub("", match.group("course"))
+            split = re.match(r"([A-Z]+)(\d.*)", code)
+            subject = split.group(1)
+            tokens.append(("course", f"{subject} {split.group(2)}"))
+        elif kind == "number":
+            if subject is None:
+                continue
+            tokens.append(("course", f"{subject} {match.group('number')}"))
+        elif kind == "grade":
+            grade = match.group("grade_value").upper()
+            tokens.append(("grade_in" if match.group("grade_in") else "grade", grade))
+        elif kind == "hyphen":
+            tokens.append(("hyphen", "-"))
+        elif kind == "noise":
+            if tokens and tokens[-1][0] == "noise":
+                continue
+            tokens.append(("noise", ""))
+        else:
+            tokens.append((kind, match.group(kind)))
+
+    return _resolve_commas(tokens)
+
+
+def _resolve_commas(tokens: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Give each comma the meaning of the next AND/OR at the same depth."""
+    resolved = list(tokens)
+    for i, (kind, _) in enumerate(tokens):
+        if kind != "comma":
+            continue
+        depth = 0
+        meaning = "and"
+        for next_kind, _ in tokens[i + 1:]:
+            if next_kind == "lparen":
+                depth += 1
+            elif next_kind == "rparen":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif depth == 0 and next_kind in ("and", "or"):
+                meaning = next_kind
+                break
+        resolved[i] = (meaning, ",")
+
+    # "A, or B" leaves a doubled operator; keep the explicit one
+    cleaned: list[tuple[str, str]] = []
+    for token in resolved:
+        if (
+            cleaned
+            and token[0] in ("and", "or")
+            and cleaned[-1][0] in ("and", "or")
+            and cleaned[-1][1] == ","
+        ):
+            cleaned[-1] = token
+            continue
+        cleaned.append(token)
+    return cleaned
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    PRIMARY_START = ("course", "lparen", "noise", "grade_in", "concurrent_in")
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][0]
+        return None
+
+    def take(self) -> tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Optional[PrereqExpr]:
+        children = []
+        while self.peek() is not None:
+            children.append(self.expr())
+            # Skip stray closing parens / dangling operators
+            if self.peek() is not None:
+                self.take()
+        return _combine(AllOf, children)
+
+    def expr(self) -> Optional[PrereqExpr]:
+        children = [self.or_expr()]
+        while True:
+            kind = self.peek()
+            if kind == "and":
+                self.take()
+            elif kind not in self.PRIMARY_START:
+                break
+            children.append(self.or_expr())
+        return _combine(AllOf, children)
+
+    def or_expr(self) -> Optional[PrereqExpr]:
+        children = [self.postfix()]
+        while self.peek() == "or":
+            self.take()
+            children.append(self.postfix())
+        return _combine(AnyOf, children)
+
+    def postfix(self) -> Optional[PrereqExpr]:
+        prefix_grade = None
+        prefix_concurrent = False
+        while self.peek() in ("grade_in", "concurrent_in"):
+            kind, value = self.take()
+            if kind == "grade_in":
+                prefix_grade = value
+            else:
+                prefix_concurrent = True
+
+        node = _with_flags(self.pair(), min_grade=prefix_grade, concurrent=prefix_concurrent)
+
+        while self.peek() in ("grade", "concurrent"):
+            kind, value = self.take()
+            if kind == "grade":
+                node = _with_flags(node, min_grade=value)
+            else:
+                node = _with_flags(node, concurrent=True)
+        return node
+
+    def pair(self) -> Optional[PrereqExpr]:
+        """A lecture-lab pair ("1211-1211L"): every part is required."""
+        children = [self.primary()]
+        while self.peek() == "hyphen":
+            self.take()
+            children.append(self.primary())
+        return _combine(AllOf, children)
+
+    def primary(self) -> Optional[PrereqExpr]:
+        kind = self.peek()
+        if kind == "course":
+            return CourseRequirement(course_code=self.take()[1])
+        if kind == "lparen":
+            self.take()
+            node = self.expr()
+            if self.peek() == "rparen":
+                self.take()
+            return node
+        if kind == "noise":
+            self.take()
+            # Noise directly before a course ("either CSCI 1301 ...") is a prefix
+            if self.peek() in ("course", "lparen"):
+                return self.primary()
+            return None
+        return None
+
+
+def _apply_trailing_grade(
+    tokens: list[tuple[str, str]],
+) -> tuple[list[tuple[str, str]], Optional[str]]:
+    """Detach a grade clause that ends the text and is the only grade clause."""
+    grades = [i for i, (kind, _) in enumerate(tokens) if kind in ("grade", "grade_in")]
+    end = len(tokens)
+    while end and tokens[end - 1][0] == "noise":
+        end -= 1
+    if len(grades) == 1 and grades[0] == end - 1 and tokens[grades[0]][0] == "grade":
+        return tokens[:grades[0]] + tokens[grades[0] + 1:], tokens[grades[0]][1]
+    return tokens, None
+
+
+@lru_cache(maxsize=16384)
+def parse_prerequisite_expression(text: str) -> Optional[PrereqExpr]:
+    """
+    Parse prerequisite text into a normalized expression tree.
+
+    Returns None when the text names no courses. Results are cached by text.
+    """
+    if not text:
+        return None
+
+    text = _SPACE_RE.sub(" ", text).strip()
+    for pattern in _NOISE_PHRASES:
+        text = pattern.sub(" ", text)
+
+    tokens, trailing_grade = _apply_trailing_grade(tokenize(text))
+    node = _Parser(tokens).parse()
+    if trailing_grade:
+        node = _with_flags(node, min_grade=trailing_grade)
+    return node
+
+
+class ExpressionTooComplex(ValueError):
+    """Raised when an expression expands to more than MAX_CNF_GROUPS groups."""
+
+
+def to_groups(
+    node: Optional[PrereqExpr],
+    limit: int = MAX_CNF_GROUPS,
+) -> list[list[CourseRequirement]]:
+    """
+    Flatten an expression to AND-of-OR groups (conjunctive normal form).
+
+    Each returned group is a list of alternatives; every group must be
+    satisfied. This is the storage shape of course_prerequisites.group_id.
+    Groups that are supersets of another group are dropped.
+
+    Raises:
+        ExpressionTooComplex: If distributing ORs over ANDs exceeds the limit
+    """
+    if node is None:
+        return []
+    return _absorb(_cnf(node, limit))
+
+
+def to_strict_groups(
+    node: Optional[PrereqExpr],
+    limit: int = MAX_CNF_GROUPS,
+) -> list[list[CourseRequirement]]:
+    """
+    Flatten an expression that to_groups rejects into a stricter rule.
+
+    ANDed parts are kept as separate groups. Where an OR still expands past
+    the limit, only its first alternative is kept, so anyone satisfying the
+    returned groups also satisfies the full expression. Some students who
+    took another alternative are wrongly blocked, which is why callers
+    should flag the course for review rather than treat this as exact.
+    """
+    if node is None:
+        return []
+    return _absorb(_strict_cnf(node, limit))
+
+
+def _strict_cnf(node: PrereqExpr, limit: int) -> list[list[CourseRequirement]]:
+    try:
+        return _cnf(node, limit)
+    except ExpressionTooComplex:
+        pass
+    if isinstance(node, AllOf):
+        # Conjunction only adds groups, so it is not bound by the limit here
+        return [group for child in node.children for group in _strict_cnf(child, limit)]
+    return _strict_cnf(node.children[0], limit)
+
+
+def _absorb(groups: list[list[CourseRequirement]]) -> list[list[CourseRequirement]]:
+    """Absorption: (A) and (A or B) == (A)."""
+    code_sets = [frozenset(c.course_code for c in g) for g in groups]
+    result = []
+    for i, group in enumerate(groups):
+        absorbed = any(
+            j != i and code_sets[j] <= code_sets[i] and (code_sets[j] != code_sets[i] or j < i)
+            for j in range(len(groups))
+        )
+        if not absorbed:
+            result.append(group)
+    return result
+
+
+def _cnf(node: PrereqExpr, limit: int) -> list[list[CourseRequirement]]:
+    if isinstance(node, CourseRequirement):
+        return [[node]]
+
+    if isinstance(node, AllOf):
+        groups = []
+        for child in node.children:
+            groups.extend(_cnf(child, limit))
+        if len(groups) > limit:
+            raise ExpressionTooComplex(f"More than {limit} prerequisite groups")
+        return groups
+
+    # AnyOf: pick one group from each child and OR them together
+    child_groups = [_cnf(child, limit) for child in node.children]
+    total = 1
+    for groups in child_groups:
+        total *= len(groups)
+        if total > limit:
+            raise ExpressionTooComplex(f"More than {limit} prerequisite groups")
+
+    result = []
+    for combination in product(*child_groups):
+        merged: dict[str, CourseRequirement] = {}
+        for group in combination:
+            for course in group:
+                existing = merged.get(course.course_code)
+                if existing is None:
+                    merged[course.course_code] = course
+                else:
+                    # Either alternative satisfies the group, so keep the looser terms
+                    merged[course.course_code] = replace(
+                        existing,
+                        min_grade=_lower_grade(existing.min_grade, course.min_grade),
+                        concurrent_allowed=existing.concurrent_allowed or course.concurrent_allowed,
+                    )
+        result.append(list(merged.values()))
+    return result
+
+
+def _lower_grade(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    """The looser of two minimum grades; no minimum beats any minimum."""
+    if a is None or b is None:
+        return None
+    return min(a, b, key=lambda grade: _GRADE_RANK.get(grade, 0))
@@ -0,0 +1,463 @@
+"""
+Compiled Prerequisite Graph.
+
+In-memory, read-only view of course_prerequisites, course_equivalents and
+course_unlocks for fast eligibility checks:
+- Every course code gets an integer index
+- Each course's prerequisite groups are stored CSR-style (offsets + flat arrays)
+- Each group (OR of alternatives) is a bitset over course indexes, with
+  equivalent courses folded in
+- A set of completed courses is a bitset too, so "is X eligible" is one AND
+  per group and "everything eligible" only visits courses unlocked by S
+
+The graph is shared per process via get_prerequisite_graph() and recompiled
+when the prerequisite index changes (see PrerequisiteParser.rebuild_unlock_index).
+"""
+import logging
+import threading
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from sqlalchemy import select, func
+
+from src.models.database import (
+    CoursePrerequisite, CourseEquivalent, CourseUnlock,
+    get_session_factory,
+)
+
+logger = logging.getLogger(__name__)
+
+# Relation types that must be completed before enrolling.
+# Corequisites may be taken concurrently, so they never block eligibility.
+BLOCKING_RELATIONS = frozenset({"prerequisite"})
+
+
+@dataclass
+class PrerequisiteGroup:
+    """One AND-ed group of OR alternatives, as reported to callers."""
+    group_id: int
+    options: list[str]
+    satisfied_by: list[str]
+
+
+class PrerequisiteGraph:
+    """
+    Integer-indexed prerequisite graph with bitset eligibility checks.
+
+    Build with PrerequisiteGraph.compile(); instances are never mutated
+    after construction and are safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        prerequisite_rows: Iterable[tuple[str, str, int, str]],
+        equivalent_rows: Iterable[tuple[str, str]] = (),
+        unlock_rows: Iterable[tuple[str, str]] = (),
+        version: int = 0,
+        fingerprint: tuple = (),
+    ):
+        """
+        Compile the graph from raw rows.
+
+        Args:
+            prerequisite_rows: (course_code, prerequisite_code, group_id, relation_type)
+            equivalent_rows: (course_code, equivalent_code), treated as bidirectional
+            unlock_rows: (completed_code, unlocked_code); derived from the
+                prerequisite rows when empty
+            version: Monotonic compile counter, used as a cache key by callers
+            fingerprint: Database state the graph was compiled from
+        """
+        self.version = version
+        self.fingerprint = fingerprint
+        self.compiled_at = time.time()
+
+        prerequisite_rows = list(prerequisite_rows)
+        equivalent_rows = list(equivalent_rows)
+        unlock_rows = list(unlock_rows)
+
+        # Assign indexes in sorted order so compiles are deterministic
+        codes: set[str] = set()
+        for course, prereq, _, _ in prerequisite_rows:
+            codes.add(course)
+            codes.add(prereq)
+        for a, b in equivalent_rows:
+            codes.add(a)
+            codes.add(b)
+        for a, b in unlock_rows:
+            codes.add(a)
+            codes.add(b)
+
+        self.codes: list[str] = sorted(codes)
+        self.index: dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+        n = len(self.codes)
+
+        # Equivalence bitsets (each course is equivalent to itself)
+        self.equivalent_masks: list[int] = [1 << i for i in range(n)]
+        for a, b in equivalent_rows:
+            ia, ib = self.index[a], self.index[b]
+            self.equivalent_masks[ia] |= 1 << ib
+            self.equivalent_masks[ib] |= 1 << ia
+
+        # Collect blocking groups per course, keyed by (relation, group_id)
+        groups_by_course: dict[int, dict[tuple[str, int], list[int]]] = {}
+        for course, prereq, group_id, relation in prerequisite_rows:
+            if relation not in BLOCKING_RELATIONS:
+                continue
+            course_groups = groups_by_course.setdefault(self.index[course], {})
+            options = course_groups.setdefault((relation, group_id), [])
+            prereq_idx = self.index[prereq]
+            if prereq_idx not in options:
+                options.append(prereq_idx)
+
+        # CSR: course -> groups -> options
+        self.group_offsets = array("i", [0] * (n + 1))
+        self.group_ids = array("i")
+        self.group_masks: list[int] = []
+        self.option_offsets = array("i", [0])
+        self.options = array("i")
+
+        has_prereqs = 0
+        for i in range(n):
+            course_groups = groups_by_course.get(i)
+            if course_groups:
+                has_prereqs |= 1 << i
+                for (_, group_id), options in sorted(course_groups.items()):
+                    mask = 0
+                    for o in options:
+                        mask |= self.equivalent_masks[o]
+                    self.group_ids.append(group_id)
+                    self.group_masks.append(mask)
+                    self.options.extend(options)
+                    self.option_offsets.append(len(self.options))
+            self.group_offsets[i + 1] = len(self.group_masks)
+
+        self.all_mask = (1 << n) - 1
+        self.no_prerequisites_mask = self.all_mask & ~has_prereqs
+
+        # CSR: completed course -> courses it (partially) unlocks
+        if not unlock_rows:
+            unlock_rows = [
+                (prereq, course) for course, prereq, _, relation in prerequisite_rows
+                if relation in BLOCKING_RELATIONS
+            ]
+        unlocks_by_course: dict[int, set[int]] = {}
+        for completed, unlocked in unlock_rows:
+            unlocks_by_course.setdefault(self.index[completed], set()).add(self.index[unlocked])
+
+        self.unlock_offsets = array("i", [0] * (n + 1))
+        self.unlock_targets = array("i")
+        self.unlock_masks: list[int] = [0] * n
+        for i in range(n):
+            targets = sorted(unlocks_by_course.get(i, ()))
+            self.unlock_targets.extend(targets)
+            self.unlock_offsets[i + 1] = len(self.unlock_targets)
+            mask = 0
+            for t in targets:
+                mask |= 1 << t
+            self.unlock_masks[i] = mask
+
+        self._transitive_counts: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def compile(
+        cls,
+        session_factory=None,
+        version: int = 0,
+        fingerprint: tuple = (),
+    ) -> "PrerequisiteGraph":
+        """Load the relationship tables and compile a graph."""
+        if session_factory is None:
+            session_factory = get_session_factory()
+
+        start = time.perf_counter()
+        with session_factory() as session:
+            prerequisite_rows = session.execute(
+                select(
+                    CoursePrerequisite.course_code,
+                    CoursePrerequisite.prerequisite_code,
+                    CoursePrerequisite.group_id,
+                    CoursePrerequisite.relation_type,
+                )
+            ).all()
+            equivalent_rows = session.execute(
+                select(CourseEquivalent.course_code, CourseEquivalent.equivalent_code)
+            ).all()
+            unlock_rows = session.execute(
+                select(CourseUnlock.completed_code, CourseUnlock.unlocked_code)
+            ).all()
+
+        graph = cls(
+            [tuple(r) for r in prerequisite_rows],
+            [tuple(r) for r in equivalent_rows],
+            [tuple(r) for r in unlock_rows],
+            version=version,
+            fingerprint=fingerprint,
+        )
+        logger.info(
+            f"Compiled prerequisite graph v{version}: {len(graph.codes)} courses, "
+            f"{len(graph.group_masks)} groups in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return graph
+
+    # =========================================================================
+    # Bitset helpers
+    # =========================================================================
+
+    def mask_of(self, course_codes: Iterable[str]) -> int:
+        """Bitset of the given course codes (unknown codes are ignored)."""
+        mask = 0
+        index = self.index
+        for code in course_codes:
+            i = index.get(code)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def codes_of(self, mask: int) -> list[str]:
+        """Course codes for the bits set in a mask, in index order."""
+        codes = []
+        while mask:
+            low = mask & -mask
+            codes.append(self.codes[low.bit_length() - 1])
+            mask ^= low
+        return codes
+
+    def _as_mask(self, completed) -> int:
+        return completed if isinstance(completed, int) else self.mask_of(completed)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def has_prerequisites(self, course_code: str) -> bool:
+        """Whether the course has any blocking prerequisite groups."""
+        i = self.index.get(course_code)
+        return i is not None and self.group_offsets[i + 1] > self.group_offsets[i]
+
+    def is_eligible(self, course_code: str, completed) -> bool:
+        """
+        Check whether every prerequisite group is satisfied.
+
+        Args:
+            course_code: Course to check
+            completed: Completed course codes, or a mask from mask_of()
+        """
+        i = self.index.get(course_code)
+        if i is None:
+            return True
+        completed_mask = self._as_mask(completed)
+        masks = self.group_masks
+        for g in range(self.group_offsets[i], self.group_offsets[i + 1]):
+            if not masks[g] & completed_mask:
+                return False
+        return True
+
+    def eligible_mask(self, completed) -> int:
+        """
+        Bitset of every indexed course whose prerequisites are satisfied.
+
+        Only courses with no prerequisites or unlocked by a completed
+        course are examined.
+        """
+        completed_mask = self._as_mask(completed)
+
+        # Expand by equivalents so unlocks of equivalent courses count too
+        expanded = 0
+        remaining = completed_mask
+        while remaining:
+            low = remaining & -remaining
+            expanded |= self.equivalent_masks[low.bit_length() - 1]
+            remaining ^= low
+
+        candidates = 0
+        remaining = expanded
+        while remaining:
+            low = remaining & -remaining
+            candidates |= self.unlock_masks[low.bit_length() - 1]
+            remaining ^= low
+
+        eligible = self.no_prerequisites_mask
+        masks = self.group_masks
+        offsets = self.group_offsets
+        while candidates:
+            low = candidates & -candidates
+            i = low.bit_length() - 1
+            candidates ^= low
+            for g in range(offsets[i], offsets[i + 1]):
+                if not masks[g] & completed_mask:
+                    break
+            else:
+                eligible |= low
+        return eligible
+
+    def eligible_courses(self, completed) -> list[str]:
+        """Course codes whose prerequisites are satisfied (excluding completed)."""
+        completed_mask = self._as_mask(completed)
+        return self.codes_of(self.eligible_mask(completed_mask) & ~completed_mask)
+
+    def prerequisite_groups(self, course_code: str, completed=0) -> list[PrerequisiteGroup]:
+        """Blocking prerequisite groups for a course with satisfaction details."""
+        i = self.index.get(course_code)
+        if i is None:
+            return []
+        completed_mask = self._as_mask(completed)
+        groups = []
+        for g in range(self.group_offsets[i], self.group_offsets[i + 1]):
+            option_idx = self.options[self.option_offsets[g]:self.option_offsets[g + 1]]
+            groups.append(PrerequisiteGroup(
+                group_id=self.group_ids[g],
+                options=[self.codes[o] for o in option_idx],
+                satisfied_by=[
+                    self.codes[o] for o in option_idx
+                    if self.equivalent_masks[o] & completed_mask
+                ],
+            ))
+        return groups
+
+    def missing_prerequisites(self, course_code: str, completed) -> list[list[str]]:
+        """Option lists for each unsatisfied prerequisite group."""
+        i = self.index.get(course_code)
+        if i is None:
+            return []
+        completed_mask = self._as_mask(completed)
+        missing = []
+        for g in range(self.group_offsets[i], self.group_offsets[i + 1]):
+            if not self.group_masks[g] & completed_mask:
+                option_idx = self.options[self.option_offsets[g]:self.option_offsets[g + 1]]
+                missing.append([self.codes[o] for o in option_idx])
+        return missing
+
+    def prerequisite_codes(self, course_code: str) -> list[str]:
+        """All courses named in the course's blocking groups, in group order."""
+        i = self.index.get(course_code)
+        if i is None:
+            return []
+        start = self.option_offsets[self.group_offsets[i]]
+        end = self.option_offsets[self.group_offsets[i + 1]]
+        seen = []
+        for o in self.options[start:end]:
+            code = self.codes[o]
+            if code not in seen:
+                seen.append(code)
+        return seen
+
+    def equivalents(self, course_code: str) -> list[str]:
+        """Directly equivalent courses (excluding the course itself)."""
+        i = self.index.get(course_code)
+        if i is None:
+            return []
+        return self.codes_of(self.equivalent_masks[i] & ~(1 << i))
+
+    def with_equivalents(self, course_codes: Iterable[str]) -> set[str]:
+        """Course codes plus every direct equivalent."""
+        result = set(course_codes)
+        for code in list(result):
+            result.update(self.equivalents(code))
+        return result
+
+    def unlock_count(self, course_code: str) -> int:
+        """Number of courses that list this course as a prerequisite."""
+        i = self.index.get(course_code)
+        if i is None:
+            return 0
+        return self.unlock_offsets[i + 1] - self.unlock_offsets[i]
+
+    def transitive_unlock_count(self, course_code: str) -> int:
+        """Number of courses reachable through unlock edges (memoized)."""
+        i = self.index.get(course_code)
+        if i is None:
+            return 0
+        cached = self._transitive_counts.get(i)
+        if cached is not None:
+            return cached
+
+        seen = 1 << i
+        queue = deque([i])
+        offsets = self.unlock_offsets
+        targets = self.unlock_targets
+        while queue:
+            node = queue.popleft()
+            for t in targets[offsets[node]:offsets[node + 1]]:
+                bit = 1 << t
+                if not seen & bit:
+                    seen |= bit
+                    queue.append(t)
+
+        count = seen.bit_count() - 1
+        with self._lock:
+            self._transitive_counts[i] = count
+        return count
+
+
+# =============================================================================
+# Process-wide shared graph
+# =============================================================================
+
+# How often (seconds) to check the database for a rebuilt prerequisite index
+REFRESH_CHECK_INTERVAL = 60
+
+_graph: Optional[PrerequisiteGraph] = None
+_graph_version = 0
+_checked_at = 0.0
+_graph_lock = threading.Lock()
+
+
+def _index_fingerprint(session_factory) -> tuple:
+    """Cheap summary of the relationship tables that changes on every rebuild."""
+    with session_factory() as session:
+        prereq = session.execute(
+            select(func.count(CoursePrerequisite.id), func.max(CoursePrerequisite.id))
+        ).one()
+        equiv = session.execute(
+            select(func.count(CourseEquivalent.id), func.max(CourseEquivalent.id))
+        ).one()
+        unlock = session.execute(
+            select(func.count(CourseUnlock.id), func.max(CourseUnlock.id))
+        ).one()
+    return tuple(prereq) + tuple(equiv) + tuple(unlock)
+
+
+def get_prerequisite_graph(session_factory=None) -> PrerequisiteGraph:
+    """
+    Get the shared prerequisite graph, compiling it on first use.
+
+    At most every REFRESH_CHECK_INTERVAL seconds the table fingerprint is
+    compared so that rebuilds in other processes are picked up.
+    """
+    global _graph, _graph_version, _checked_at
+
+    now = time.monotonic()
+    graph = _graph
+    if graph is not None and now - _checked_at < REFRESH_CHECK_INTERVAL:
+        return graph
+
+    with _graph_lock:
+        if _graph is not None and now - _checked_at < REFRESH_CHECK_INTERVAL:
+            return _graph
+
+        if session_factory is None:
+            session_factory = get_session_factory()
+
+        fingerprint = _index_fingerprint(session_factory)
+        if _graph is None or _graph.fingerprint != fingerprint:
+            _graph_version += 1
+            _graph = PrerequisiteGraph.compile(
+                session_factory, version=_graph_version, fingerprint=fingerprint
+            )
+        _checked_at = time.monotonic()
+        return _graph
+
+
+def reload_prerequisite_graph(session_factory=None) -> PrerequisiteGraph:
+    """Force a recompile of the shared graph (after rebuilding the index)."""
+    global _graph
+    with _graph_lock:
+        _graph = None
+    return get_prerequisite_graph(session_factory)
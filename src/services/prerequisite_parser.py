@@ -6,19 +6,35 @@ Designed to populate CoursePrerequisite and CourseEquivalent tables
 for later Neo4j export.
 """
 import re
+import os
+import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert, update
 from sqlalchemy.orm import Session
 
 from src.models.database import (
     BulletinCourse, CoursePrerequisite, CourseEquivalent, CourseUnlock,
     get_engine, get_session_factory, init_db
 )
+from src.services.prerequisite_graph import reload_prerequisite_graph
+from src.services.prerequisite_expression import (
+    PrereqExpr, ExpressionTooComplex, parse_prerequisite_expression, to_groups, to_strict_groups,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing rules change so incremental runs re-parse every course
+PARSER_VERSION = "2"
+
+# Below this many distinct texts, parsing in-process beats pool start-up cost
+PARALLEL_PARSE_THRESHOLD = 500
+
+# Maximum course codes per IN (...) clause when clearing old relationships
+DELETE_BATCH_SIZE = 1000
+
 
 @dataclass
 class ParsedPrerequisite:
@@ -45,6 +61,46 @@ class PrerequisiteParseResult:
     corequisites: list[ParsedPrerequisite] = field(default_factory=list)
     equivalents: list[ParsedEquivalent] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    expression: Optional[PrereqExpr] = None  # Full boolean tree for prerequisites
+    corequisite_expression: Optional[PrereqExpr] = None
+
+
+def combine_prerequisite_texts(
+    prereq_text: Optional[str],
+    coreq_text: Optional[str] = None,
+    equiv_text: Optional[str] = None,
+) -> str:
+    """Combine bulletin prerequisite fields into the single text that gets parsed."""
+    full_text = prereq_text or ""
+    if coreq_text:
+        full_text += f" Corequisite: {coreq_text}"
+    if equiv_text:
+        full_text += f" {equiv_text}"
+    return full_text
+
+
+def prerequisite_text_hash(full_text: str) -> str:
+    """Hash of combined prerequisite text and parser version."""
+    return hashlib.sha256(f"{PARSER_VERSION}\0{full_text}".encode()).hexdigest()
+
+
+def _parse_texts(texts: list[str]) -> list[Optional[PrerequisiteParseResult]]:
+    """
+    Parse a batch of prerequisite texts (process pool worker).
+
+    Parsing needs no database, so the parser is created without a session
+    factory. Equivalents are course-specific and extracted by the caller.
+    Returns None for texts that fail to parse.
+    """
+    parser = PrerequisiteParser.__new__(PrerequisiteParser)
+    results = []
+    for text in texts:
+        try:
+            results.append(parser.parse(text))
+        except Exception as e:
+            logger.error(f"Error parsing prerequisite text {text[:60]!r}: {e}")
+            results.append(None)
+    return results
 
 
 class PrerequisiteParser:
@@ -57,15 +113,16 @@ class PrerequisiteParser:
     - "CSCI 1301 and MATH 2250" (AND - separate groups)
     - "CSCI 1301 with a minimum grade of C" (grade requirement)
     - "(CSCI 1301 or CSCI 1301H) and MATH 2250" (nested groups)
+    - "CSCI 2610 (may be taken concurrently)" (concurrent enrollment)
     - "Not open to students with credit in CSCI 3030E" (equivalent)
+
+    Requirement text goes through the grammar in prerequisite_expression;
+    the resulting tree is flattened to AND-of-OR groups for storage.
     """
 
     # Course code pattern: 2-4 letter subject + 4 digit number + optional letter
     COURSE_PATTERN = r'\b([A-Z]{2,4})\s*(\d{4}[A-Z]?(?:[/-]\d{4}[A-Z]?)?)\b'
 
-    # Grade pattern
-    GRADE_PATTERN = r'(?:minimum\s+)?grade\s+(?:of\s+)?([A-DF][+-]?)'
-
     def __init__(self, session_factory=None):
         """Initialize the parser."""
         if session_factory is None:
@@ -99,11 +156,17 @@ class PrerequisiteParser:
 
         # Parse prerequisites
         if prereq_text:
-            result.prerequisites = self._parse_requirements(prereq_text, "prerequisite")
+            result.expression = parse_prerequisite_expression(prereq_text)
+            result.prerequisites = self._flatten_expression(
+                result.expression, "prerequisite", result.warnings
+            )
 
         # Parse corequisites
         if coreq_text:
-            result.corequisites = self._parse_requirements(coreq_text, "corequisite")
+            result.corequisite_expression = parse_prerequisite_expression(coreq_text)
+            result.corequisites = self._flatten_expression(
+                result.corequisite_expression, "corequisite", result.warnings
+            )
 
         return result
 
@@ -111,7 +174,7 @@ class PrerequisiteParser:
         """Split text into prerequisite and corequisite parts."""
         coreq_markers = [
             r'corequisite[s]?\s*[:;]?\s*',
-            r'concurrent(?:ly)?\s+(?:with|enrollment)\s*[:;]?\s*',
+            r'concurrent(?:ly)?\s+with\s*[:;]?\s*',
             r'must\s+be\s+taken\s+(?:with|concurrently)',
         ]
 
@@ -159,73 +222,35 @@ class PrerequisiteParser:
             return "online"
         return "full"
 
-    def _parse_requirements(self, text: str, relation_type: str) -> list[ParsedPrerequisite]:
-        """Parse a requirements string into structured prerequisites."""
-        requirements = []
-        current_group = 0
-
-        # Clean up the text
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Remove common non-course phrases
-        text = re.sub(r'permission\s+of\s+(?:the\s+)?(?:department|instructor)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'admission\s+to\s+[^,;.]+', '', text, flags=re.IGNORECASE)
+    def _flatten_expression(
+        self,
+        expression: Optional[PrereqExpr],
+        relation_type: str,
+        warnings: list[str],
+    ) -> list[ParsedPrerequisite]:
+        """Flatten an expression tree into AND-of-OR prerequisite groups."""
+        if expression is None:
+            return []
+
+        try:
+            groups = to_groups(expression)
+        except ExpressionTooComplex as e:
+            # Store a stricter rule so nobody is wrongly shown as eligible
+            warnings.append(f"{relation_type}: {e}; stored a stricter rule, needs review")
+            groups = to_strict_groups(expression)
 
-        # Check for grade requirement that applies to all
-        global_grade = None
-        grade_match = re.search(self.GRADE_PATTERN, text, re.IGNORECASE)
-        if grade_match:
-            global_grade = grade_match.group(1).upper()
-
-        # Tokenize by AND (creates new groups) and OR (same group)
-        # Handle parentheses for grouping
-        tokens = self._tokenize_requirements(text)
-
-        for token_group in tokens:
-            for i, course_code in enumerate(token_group):
+        requirements = []
+        for group_id, group in enumerate(groups):
+            for requirement in group:
                 requirements.append(ParsedPrerequisite(
-                    course_code=course_code,
+                    course_code=requirement.course_code,
                     relation_type=relation_type,
-                    group_id=current_group,
-                    min_grade=global_grade,
+                    group_id=group_id,
+                    min_grade=requirement.min_grade,
+                    concurrent_allowed=requirement.concurrent_allowed,
                 ))
-            current_group += 1
-
         return requirements
 
-    def _tokenize_requirements(self, text: str) -> list[list[str]]:
-        """
-        Tokenize requirements text into groups.
-
-        Returns list of groups, where each group is a list of alternative courses.
-        Groups are ANDed together, courses within a group are ORed.
-        """
-        groups = []
-
-        # Split by AND first (handles "X and Y")
-        and_parts = re.split(r'\s+and\s+|\s*[;&]\s*', text, flags=re.IGNORECASE)
-
-        for part in and_parts:
-            part = part.strip()
-            if not part:
-                continue
-
-            # Within each AND part, split by OR
-            or_parts = re.split(r'\s+or\s+|\s*/\s*', part, flags=re.IGNORECASE)
-
-            group = []
-            for or_part in or_parts:
-                or_part = or_part.strip()
-                # Extract course codes from this part
-                for match in re.finditer(self.COURSE_PATTERN, or_part):
-                    course_code = f"{match.group(1)} {match.group(2)}"
-                    group.append(course_code)
-
-            if group:
-                groups.append(group)
-
-        return groups
-
     def parse_and_save(self, course_code: str, prereq_text: str, coreq_text: str = None, equiv_text: str = None) -> PrerequisiteParseResult:
         """
         Parse prerequisite text and save to database.
@@ -240,11 +265,7 @@ class PrerequisiteParser:
             PrerequisiteParseResult
         """
         # Combine texts for parsing
-        full_text = prereq_text or ""
-        if coreq_text:
-            full_text += f" Corequisite: {coreq_text}"
-        if equiv_text:
-            full_text += f" {equiv_text}"
+        full_text = combine_prerequisite_texts(prereq_text, coreq_text, equiv_text)
 
         result = self.parse(full_text, course_code)
 
@@ -296,43 +317,171 @@ class PrerequisiteParser:
 
         return result
 
-    def process_all_bulletin_courses(self) -> dict:
+    def process_all_bulletin_courses(
+        self,
+        incremental: bool = False,
+        workers: Optional[int] = None,
+    ) -> dict:
         """
         Process all bulletin courses and extract prerequisite relationships.
 
+        Each distinct prerequisite text is parsed once (in a process pool for
+        large runs), then prerequisites, equivalents and the unlock index are
+        written with bulk inserts in a single transaction.
+
+        Args:
+            incremental: Only re-parse courses whose prerequisite text (or the
+                parser version) changed since the last run
+            workers: Process pool size (default: CPU count, 1 = in-process)
+
         Returns:
             Statistics dict
         """
         stats = {
             "courses_processed": 0,
+            "courses_skipped": 0,
+            "unique_texts": 0,
             "prerequisites_created": 0,
             "equivalents_created": 0,
+            "needs_review": [],
             "errors": 0,
         }
 
         with self.session_factory() as session:
-            courses = session.execute(select(BulletinCourse)).scalars().all()
-
-            for course in courses:
-                try:
-                    result = self.parse_and_save(
-                        course.course_code,
-                        course.prerequisites or "",
-                        course.corequisites or "",
-                        course.equivalent_courses or "",
-                    )
-                    stats["courses_processed"] += 1
-                    stats["prerequisites_created"] += len(result.prerequisites) + len(result.corequisites)
-                    stats["equivalents_created"] += len(result.equivalents)
-                except Exception as e:
-                    logger.error(f"Error processing {course.course_code}: {e}")
+            rows = session.execute(
+                select(
+                    BulletinCourse.id,
+                    BulletinCourse.course_code,
+                    BulletinCourse.prerequisites,
+                    BulletinCourse.corequisites,
+                    BulletinCourse.equivalent_courses,
+                    BulletinCourse.prerequisites_hash,
+                ).order_by(BulletinCourse.id)
+            ).all()
+
+            # One source row per course code (the last one wins, as before)
+            latest = {}
+            ids_by_code: dict[str, list[int]] = {}
+            for row in rows:
+                latest[row.course_code] = row
+                ids_by_code.setdefault(row.course_code, []).append(row.id)
+
+            pending = []  # (bulletin ids, course_code, full_text, text_hash)
+            for code, row in latest.items():
+                full_text = combine_prerequisite_texts(
+                    row.prerequisites, row.corequisites, row.equivalent_courses
+                )
+                text_hash = prerequisite_text_hash(full_text)
+                if incremental and row.prerequisites_hash == text_hash:
+                    stats["courses_skipped"] += 1
+                    continue
+                pending.append((ids_by_code[code], code, full_text, text_hash))
+
+            if not pending:
+                return stats
+
+            # Parse each distinct text once
+            unique_texts = list(dict.fromkeys(full_text for _, _, full_text, _ in pending))
+            stats["unique_texts"] = len(unique_texts)
+            parsed = dict(zip(unique_texts, self._parse_many(unique_texts, workers)))
+
+            prereq_rows = []
+            equiv_rows = []
+            hash_updates = []
+            processed_codes = []
+
+            for ids, code, full_text, text_hash in pending:
+                result = parsed[full_text]
+                if result is None:
                     stats["errors"] += 1
+                    continue
+
+                processed_codes.append(code)
+                if result.warnings:
+                    stats["needs_review"].append(code)
+                    logger.warning(f"{code} needs review: {'; '.join(result.warnings)}")
+                for prereq in result.prerequisites:
+                    prereq_rows.append({
+                        "course_code": code,
+                        "prerequisite_code": prereq.course_code,
+                        "group_id": prereq.group_id,
+                        "relation_type": prereq.relation_type,
+                        "min_grade": prereq.min_grade,
+                        "concurrent_allowed": prereq.concurrent_allowed,
+                        "source": "bulletin",
+                    })
+                for coreq in result.corequisites:
+                    prereq_rows.append({
+                        "course_code": code,
+                        "prerequisite_code": coreq.course_code,
+                        "group_id": coreq.group_id,
+                        "relation_type": "corequisite",
+                        "min_grade": None,
+                        "concurrent_allowed": True,
+                        "source": "bulletin",
+                    })
+                equivalents = self._extract_equivalents(full_text, code)
+                for equiv in equivalents:
+                    equiv_rows.append({
+                        "course_code": equiv.course_code,
+                        "equivalent_code": equiv.equivalent_code,
+                        "equivalence_type": equiv.equivalence_type,
+                        "source": "bulletin",
+                    })
+                hash_updates.extend({"id": i, "prerequisites_hash": text_hash} for i in ids)
+
+                stats["courses_processed"] += 1
+                stats["prerequisites_created"] += (
+                    len(result.prerequisites) + len(result.corequisites)
+                )
+                stats["equivalents_created"] += len(equivalents)
+
+            # Replace relationships for processed courses
+            for i in range(0, len(processed_codes), DELETE_BATCH_SIZE):
+                batch = processed_codes[i:i + DELETE_BATCH_SIZE]
+                session.execute(
+                    delete(CoursePrerequisite).where(CoursePrerequisite.course_code.in_(batch))
+                )
+                session.execute(
+                    delete(CourseEquivalent).where(CourseEquivalent.course_code.in_(batch))
+                )
 
-        # Rebuild unlock index
-        self.rebuild_unlock_index()
+            if prereq_rows:
+                session.execute(insert(CoursePrerequisite), prereq_rows)
+            if equiv_rows:
+                session.execute(insert(CourseEquivalent), equiv_rows)
+            if hash_updates:
+                session.execute(update(BulletinCourse), hash_updates)
+
+            # Rebuild unlock index in the same transaction
+            self._rebuild_unlocks(session)
+            session.commit()
+
+        # Recompile the shared in-memory graph from the new index
+        reload_prerequisite_graph(self.session_factory)
 
         return stats
 
+    def _parse_many(
+        self,
+        texts: list[str],
+        workers: Optional[int] = None,
+    ) -> list[Optional[PrerequisiteParseResult]]:
+        """Parse texts, fanning out to a process pool for large batches."""
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(texts) < PARALLEL_PARSE_THRESHOLD:
+            return _parse_texts(texts)
+
+        # A few chunks per worker keeps the pool balanced
+        chunk_size = max(1, -(-len(texts) // (workers * 4)))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(_parse_texts, chunks):
+                results.extend(chunk_results)
+        return results
+
     def rebuild_unlock_index(self):
         """
         Rebuild the CourseUnlock index from prerequisites.
@@ -340,34 +489,47 @@ class PrerequisiteParser:
         This creates the inverse relationship for fast "what does completing X unlock?" queries.
         """
         with self.session_factory() as session:
-            # Clear existing unlocks
-            session.execute(delete(CourseUnlock))
-
-            # Get all prerequisites
-            prereqs = session.execute(select(CoursePrerequisite)).scalars().all()
-
-            # Group by course to count total prereqs
-            course_prereq_counts = {}
-            for prereq in prereqs:
-                if prereq.course_code not in course_prereq_counts:
-                    course_prereq_counts[prereq.course_code] = set()
-                course_prereq_counts[prereq.course_code].add(prereq.group_id)
-
-            # Create unlock entries
-            for prereq in prereqs:
-                total_groups = len(course_prereq_counts.get(prereq.course_code, set()))
-                remaining = total_groups - 1  # This prereq satisfies one group
-
-                unlock = CourseUnlock(
-                    completed_code=prereq.prerequisite_code,
-                    unlocked_code=prereq.course_code,
-                    is_direct=(prereq.group_id == 0),
-                    remaining_prereqs=remaining,
-                )
-                session.add(unlock)
-
+            self._rebuild_unlocks(session)
             session.commit()
 
+        # Recompile the shared in-memory graph from the new index
+        reload_prerequisite_graph(self.session_factory)
+
+    def _rebuild_unlocks(self, session: Session) -> None:
+        """Replace all CourseUnlock rows using a bulk insert (caller commits)."""
+        # Clear existing unlocks
+        session.execute(delete(CourseUnlock))
+
+        # Get all prerequisites
+        prereqs = session.execute(
+            select(
+                CoursePrerequisite.course_code,
+                CoursePrerequisite.prerequisite_code,
+                CoursePrerequisite.group_id,
+            )
+        ).all()
+
+        # Group by course to count total prereqs
+        course_prereq_counts: dict[str, set[int]] = {}
+        for course_code, _, group_id in prereqs:
+            course_prereq_counts.setdefault(course_code, set()).add(group_id)
+
+        # Create unlock entries
+        unlock_rows = []
+        for course_code, prerequisite_code, group_id in prereqs:
+            total_groups = len(course_prereq_counts.get(course_code, set()))
+            remaining = total_groups - 1  # This prereq satisfies one group
+
+            unlock_rows.append({
+                "completed_code": prerequisite_code,
+                "unlocked_code": course_code,
+                "is_direct": group_id == 0,
+                "remaining_prereqs": remaining,
+            })
+
+        if unlock_rows:
+            session.execute(insert(CourseUnlock), unlock_rows)
+
     def get_prerequisites_for(self, course_code: str) -> list[dict]:
         """Get structured prerequisites for a course."""
         with self.session_factory() as session:
@@ -445,6 +607,8 @@ if __name__ == "__main__":
         "(CSCI 1301 or CSCI 1301H) and (MATH 2250 or MATH 1113)",
         "ENGL 1050H or ENGL 1102 or ENGL 1102E",
         "CSCI 1302 with a minimum grade of C",
+        "(CSCI 1301 or CSCI 1302) and (MATH 2250 or MATH 2260 or (STAT 2000 and STAT 2010))",
+        "CSCI 2610 (may be taken concurrently) and CSCI 1302 or 1302H",
         "Not open to students with credit in CSCI 3030E, CSCI 3030H",
     ]
 
@@ -452,7 +616,12 @@ if __name__ == "__main__":
     for text in test_cases:
         print(f"Input: {text}")
         result = parser.parse(text, "TEST 1000")
-        print(f"  Prerequisites: {[(p.course_code, p.group_id) for p in result.prerequisites]}")
+        print(f"  Expression: {result.expression.to_dict() if result.expression else None}")
+        prerequisites = [
+            (p.course_code, p.group_id, p.min_grade, p.concurrent_allowed)
+            for p in result.prerequisites
+        ]
+        print(f"  Prerequisites: {prerequisites}")
         print(f"  Corequisites: {[(c.course_code, c.group_id) for c in result.corequisites]}")
         print(f"  Equivalents: {[(e.course_code, e.equivalent_code) for e in result.equivalents]}")
         print()
@@ -0,0 +1,477 @@
+"""
+Room occupancy index for a schedule.
+
+Built once per imported schedule from every section's building, room, days
+and times, then kept in memory (and pickled next to the other data
+snapshots) so queries never scan the sections table:
+
+- Per room, each day's meetings are merged into sorted disjoint intervals;
+  "is this room free from 2:00 to 4:00 on Wednesday" is one bisect
+- Per building, rooms, section and course counts, weekly utilization,
+  hourly occupancy and peak hours are precomputed
+- Free-room queries combine the index with the campus graph's spatial
+  index to look in and near a building
+- The hourly building occupancy doubles as campus heat-map data
+
+The index for a schedule is written when the schedule is imported
+(refresh_room_occupancy) and loaded on first use by get_room_occupancy().
+"""
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+
+from src.config import settings
+from src.models.campus_graph import CampusGraph, Room, normalize_building_name
+from src.models.database import Course, Section
+from src.models.meeting_time import DAY_LETTERS, day_indexes, format_clock
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = "1"
+
+# Buildings that are not physical rooms
+PLACEHOLDER_BUILDINGS = {"", "TBA", "No Classroom Required", "Online"}
+
+# Teaching week used for utilization: weekdays, 8:00 am to 10:00 pm
+TEACHING_DAYS = 5
+TEACHING_START = 8 * 60
+TEACHING_END = 22 * 60
+
+PEAK_HOURS_REPORTED = 3
+
+# Schedules (one per active term) kept in memory
+OCCUPANCY_CACHE_SIZE = 4
+
+
+@dataclass
+class RoomUsage:
+    """When one room is in use over the week."""
+    building: str
+    room: str
+    sections: int = 0
+    max_class_size: int = 0  # Largest section scheduled here, a capacity proxy
+    starts: list[list[int]] = field(default_factory=lambda: [[] for _ in range(7)])
+    ends: list[list[int]] = field(default_factory=lambda: [[] for _ in range(7)])
+
+    @property
+    def occupied_minutes(self) -> int:
+        """Weekly minutes in use."""
+        return sum(
+            e - s
+            for day_s, day_e in zip(self.starts, self.ends)
+            for s, e in zip(day_s, day_e)
+        )
+
+    def is_free(self, day: int, start: int, end: int) -> bool:
+        """Whether nothing meets here between start and end on day."""
+        i = bisect_left(self.starts[day], end)
+        return i == 0 or self.ends[day][i - 1] <= start
+
+    def free_window(self, day: int, start: int, end: int) -> Optional[tuple[int, int]]:
+        """The free stretch containing [start, end) on day, or None if busy."""
+        starts, ends = self.starts[day], self.ends[day]
+        i = bisect_left(starts, end)
+        if i and ends[i - 1] > start:
+            return None
+        return (ends[i - 1] if i else 0, starts[i] if i < len(starts) else 24 * 60)
+
+
+@dataclass
+class BuildingOccupancy:
+    """Precomputed activity metrics for one building."""
+    building: str
+    rooms: int
+    total_sections: int
+    total_courses: int
+    occupied_minutes: int
+    utilization: float  # Share of teaching-week room time in use
+    hourly: list[list[int]]  # [day][hour] -> room-minutes in use
+    peak_hours: list[str]
+
+    def to_dict(self) -> dict:
+        return {
+            "building": self.building,
+            "rooms": self.rooms,
+            "total_sections": self.total_sections,
+            "total_courses": self.total_courses,
+            "utilization": round(self.utilization, 3),
+            "peak_hours": self.peak_hours,
+        }
+
+
+@dataclass
+class FreeRoom:
+    """A room that is free for a requested window."""
+    building: str
+    room: str
+    free_from: int  # minutes since midnight
+    free_until: int
+    distance_meters: float = 0.0
+    walk_minutes: int = 0
+    max_class_size: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "building": self.building,
+            "room": self.room,
+            "free_from": format_clock(self.free_from),
+            "free_until": format_clock(self.free_until),
+            "distance_meters": round(self.distance_meters),
+            "walk_minutes": self.walk_minutes,
+            "max_class_size": self.max_class_size,
+        }
+
+
+class RoomOccupancy:
+    """Per-room weekly interval index with building statistics."""
+
+    def __init__(self, schedule_id: Optional[int], rows: Iterable):
+        """
+        Build the index from section rows.
+
+        Each row has building, room, day_mask, start_minutes, end_minutes,
+        class_size, course_code and crn. Rows without a room or times are
+        skipped; rows sharing a CRN, room and time count once.
+        """
+        self.schedule_id = schedule_id
+        self.rooms: dict[tuple[str, str], RoomUsage] = {}
+        self.buildings: dict[str, BuildingOccupancy] = {}
+        self._rooms_by_building: dict[str, list[RoomUsage]] = {}
+        self._graph_buildings: dict[int, dict[str, list[str]]] = {}
+
+        meetings: dict[tuple[str, str], list[tuple[int, int, int]]] = {}
+        sections: dict[tuple[str, str], set[str]] = {}
+        courses: dict[str, set[str]] = {}
+        seen = set()
+        for row in rows:
+            building = (row.building or "").strip()
+            room = (row.room or "").strip()
+            if building in PLACEHOLDER_BUILDINGS or not room:
+                continue
+            if row.start_minutes is None or row.end_minutes is None or not row.day_mask:
+                continue
+            key = (building, room)
+            meeting = (row.crn, key, row.day_mask, row.start_minutes, row.end_minutes)
+            if meeting in seen:
+                continue
+            seen.add(meeting)
+
+            usage = self.rooms.get(key)
+            if usage is None:
+                usage = self.rooms[key] = RoomUsage(building, room)
+            usage.max_class_size = max(usage.max_class_size, row.class_size or 0)
+            sections.setdefault(key, set()).add(row.crn)
+            courses.setdefault(building, set()).add(row.course_code)
+            for day in day_indexes(row.day_mask):
+                meetings.setdefault(key, []).append((day, row.start_minutes, row.end_minutes))
+
+        for key, usage in self.rooms.items():
+            usage.sections = len(sections[key])
+            for day, start, end in sorted(meetings.get(key, ())):
+                starts, ends = usage.starts[day], usage.ends[day]
+                if ends and start <= ends[-1]:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+
+        for usage in sorted(self.rooms.values(), key=lambda u: (u.building, u.room)):
+            self._rooms_by_building.setdefault(usage.building, []).append(usage)
+        for building, usages in self._rooms_by_building.items():
+            self.buildings[building] = self._building_stats(
+                building, usages, len(courses.get(building, ()))
+            )
+
+    def __getstate__(self) -> dict:
+        # Graph lookups are keyed by object id, meaningless in another process
+        state = self.__dict__.copy()
+        state["_graph_buildings"] = {}
+        return state
+
+    @staticmethod
+    def _building_stats(
+        building: str,
+        usages: list[RoomUsage],
+        total_courses: int,
+    ) -> BuildingOccupancy:
+        hourly = [[0] * 24 for _ in range(7)]
+        teaching_minutes = 0
+        for usage in usages:
+            for day in range(7):
+                for start, end in zip(usage.starts[day], usage.ends[day]):
+                    for hour in range(start // 60, min(-(-end // 60), 24)):
+                        hourly[day][hour] += min(end, (hour + 1) * 60) - max(start, hour * 60)
+                    if day < TEACHING_DAYS:
+                        teaching = min(end, TEACHING_END) - max(start, TEACHING_START)
+                        teaching_minutes += max(0, teaching)
+
+        by_hour = [sum(hourly[day][hour] for day in range(7)) for hour in range(24)]
+        peaks = sorted((h for h in range(24) if by_hour[h]), key=lambda h: (-by_hour[h], h))
+        capacity = len(usages) * TEACHING_DAYS * (TEACHING_END - TEACHING_START)
+        return BuildingOccupancy(
+            building=building,
+            rooms=len(usages),
+            total_sections=sum(u.sections for u in usages),
+            total_courses=total_courses,
+            occupied_minutes=sum(u.occupied_minutes for u in usages),
+            utilization=teaching_minutes / capacity if capacity else 0.0,
+            hourly=hourly,
+            peak_hours=[format_clock(h * 60) for h in peaks[:PEAK_HOURS_REPORTED]],
+        )
+
+    def rooms_in(self, building: str) -> list[RoomUsage]:
+        """Rooms of a building, by room number."""
+        return self._rooms_by_building.get(building, [])
+
+    def _by_graph_building(self, graph: CampusGraph) -> dict[str, list[str]]:
+        """Schedule building names grouped by the graph building they resolve to."""
+        mapping = self._graph_buildings.get(id(graph))
+        if mapping is None:
+            mapping = {}
+            for name in self.buildings:
+                found = graph.get_building(name)
+                key = found.id if found else normalize_building_name(name)
+                mapping.setdefault(key, []).append(name)
+            self._graph_buildings = {id(graph): mapping}
+        return mapping
+
+    def free_rooms(
+        self,
+        graph: CampusGraph,
+        building: str,
+        day: int,
+        start: int,
+        end: int,
+        radius_meters: float = 0.0,
+        min_capacity: int = 0,
+        limit: int = 50,
+    ) -> list[FreeRoom]:
+        """
+        Rooms free from start to end on day, in or within radius of building.
+
+        Nearest buildings first; within a building, rooms free the longest
+        come first.
+        """
+        by_graph = self._by_graph_building(graph)
+        target = graph.get_building(building)
+
+        nearby: list[tuple[str, float]] = []
+        if target is None:
+            nearby.append((normalize_building_name(building), 0.0))
+        elif target.location and radius_meters > 0:
+            within = graph.buildings_within(target.location, radius_meters)
+            nearby.extend((b.id, d) for b, d in within)
+            if target.id not in {b for b, _ in nearby}:
+                nearby.insert(0, (target.id, 0.0))
+        else:
+            nearby.append((target.id, 0.0))
+
+        free = []
+        for graph_id, distance in nearby:
+            for name in by_graph.get(graph_id, ()):
+                walk = graph.walking_time(building, name) if distance else 0
+                rooms = []
+                for usage in self.rooms_in(name):
+                    if usage.max_class_size < min_capacity:
+                        continue
+                    window = usage.free_window(day, start, end)
+                    if window is None:
+                        continue
+                    rooms.append(FreeRoom(
+                        building=name,
+                        room=usage.room,
+                        free_from=window[0],
+                        free_until=window[1],
+                        distance_meters=distance,
+                        walk_minutes=walk or 0,
+                        max_class_size=usage.max_class_size,
+                    ))
+                rooms.sort(key=lambda r: (-(r.free_until - r.free_from), r.room))
+                free.extend(rooms)
+                if len(free) >= limit:
+                    return free[:limit]
+        return free
+
+    def heat_map(
+        self,
+        graph: Optional[CampusGraph] = None,
+        day: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Hourly rooms in use per building, for map rendering.
+
+        One entry per building and hour with activity; rooms_in_use is the
+        average number of rooms occupied during that hour. Locations are
+        filled in from the graph when given.
+        """
+        days = [day] if day is not None else range(7)
+        points = []
+        for name, stats in self.buildings.items():
+            found = graph.get_building(name) if graph else None
+            location = found.location if found else None
+            for d in days:
+                for hour, minutes in enumerate(stats.hourly[d]):
+                    if not minutes:
+                        continue
+                    points.append({
+                        "building": name,
+                        "latitude": location.latitude if location else None,
+                        "longitude": location.longitude if location else None,
+                        "day": DAY_LETTERS[d],
+                        "hour": hour,
+                        "rooms_in_use": round(minutes / 60, 2),
+                        "utilization": round(minutes / 60 / stats.rooms, 3),
+                    })
+        return points
+
+    def apply_to_graph(self, graph: CampusGraph) -> None:
+        """Fill in Building.rooms, total_sections, total_courses and peak_hours."""
+        applied = 0
+        for graph_id, names in self._by_graph_building(graph).items():
+            target = graph.buildings.get(graph_id)
+            if target is None:
+                continue
+            target.rooms = [
+                Room(number=u.room, building_id=target.id, capacity=u.max_class_size or None)
+                for name in names
+                for u in self.rooms_in(name)
+            ]
+            stats = [self.buildings[name] for name in names]
+            target.total_sections = sum(s.total_sections for s in stats)
+            target.total_courses = sum(s.total_courses for s in stats)
+            target.peak_hours = max(stats, key=lambda s: s.occupied_minutes).peak_hours
+            applied += 1
+        logger.debug(f"Applied room occupancy to {applied} campus graph buildings")
+
+
+# =============================================================================
+# Building and caching
+# =============================================================================
+
+def build_room_occupancy(session_factory, schedule_id: int) -> RoomOccupancy:
+    """Build the occupancy index for a schedule from the database."""
+    with session_factory() as session:
+        rows = session.execute(
+            select(
+                Section.crn,
+                Section.building,
+                Section.room,
+                Section.day_mask,
+                Section.start_minutes,
+                Section.end_minutes,
+                Section.class_size,
+                Course.course_code,
+            )
+            .join(Course)
+            .where(Course.schedule_id == schedule_id, Section.status != "X")
+        ).all()
+    occupancy = RoomOccupancy(schedule_id, rows)
+    logger.info(
+        f"Built room occupancy for schedule {schedule_id}: "
+        f"{len(occupancy.rooms)} rooms in {len(occupancy.buildings)} buildings"
+    )
+    return occupancy
+
+
+def _snapshot_path(schedule_id: int) -> Path:
+    return Path(settings.room_occupancy_dir) / f"schedule_{schedule_id}.snapshot"
+
+
+def _write_snapshot(occupancy: RoomOccupancy) -> None:
+    path = _snapshot_path(occupancy.schedule_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(SNAPSHOT_FORMAT, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(occupancy, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write room occupancy snapshot {path}: {e}")
+
+
+def _read_snapshot(schedule_id: int) -> Optional[RoomOccupancy]:
+    path = _snapshot_path(schedule_id)
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) == SNAPSHOT_FORMAT:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable room occupancy snapshot {path}: {e}")
+    return None
+
+
+_occupancy: OrderedDict[int, RoomOccupancy] = OrderedDict()
+# The index whose metrics each campus graph currently carries
+_applied: "weakref.WeakKeyDictionary[CampusGraph, RoomOccupancy]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()  # queries run in worker threads
+
+
+def _remember(occupancy: RoomOccupancy) -> None:
+    with _lock:
+        _occupancy[occupancy.schedule_id] = occupancy
+        _occupancy.move_to_end(occupancy.schedule_id)
+        if len(_occupancy) > OCCUPANCY_CACHE_SIZE:
+            _occupancy.popitem(last=False)
+
+
+def refresh_room_occupancy(session_factory, schedule_id: int) -> RoomOccupancy:
+    """
+    Rebuild and snapshot the index for a schedule; called on import.
+
+    A graph carrying an older index for the schedule gets the new metrics
+    on its next get_room_occupancy().
+    """
+    occupancy = build_room_occupancy(session_factory, schedule_id)
+    _write_snapshot(occupancy)
+    _remember(occupancy)
+    return occupancy
+
+
+def get_room_occupancy(
+    session_factory,
+    schedule_id: int,
+    graph: Optional[CampusGraph] = None,
+) -> RoomOccupancy:
+    """
+    Get the index for a schedule from memory, its snapshot or the database.
+
+    When graph is given, its building activity metrics are filled in from
+    the index unless they already come from it, so a refreshed index
+    replaces the metrics of the one it supersedes.
+    """
+    with _lock:
+        occupancy = _occupancy.get(schedule_id)
+        if occupancy is not None:
+            _occupancy.move_to_end(schedule_id)
+
+    if occupancy is None:
+        occupancy = _read_snapshot(schedule_id)
+        if occupancy is None:
+            occupancy = build_room_occupancy(session_factory, schedule_id)
+            _write_snapshot(occupancy)
+        _remember(occupancy)
+
+    if graph is not None:
+        with _lock:
+            if _applied.get(graph) is not occupancy:
+                occupancy.apply_to_graph(graph)
+                _applied[graph] = occupancy
+    return occupancy
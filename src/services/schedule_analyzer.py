@@ -7,17 +7,17 @@ Analyzes student schedules for:
 - Campus zone clustering
 - Time gap analysis
 """
-import json
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import groupby
 from typing import Optional
-from pathlib import Path
 
-from src.models.campus_graph import (
-    CampusGraph, Building, GeoLocation,
-    build_campus_graph_from_schedule, ATHENS_BUILDING_COORDS
-)
+from src.models import meeting_time
+from src.models.campus_graph import CampusGraph
+from src.models.meeting_time import parse_clock
+from src.models.schedule_conflicts import meeting_intervals, sweep
+from src.services.campus_graph_store import get_campus_graph
 
 
 @dataclass
@@ -36,19 +36,10 @@ class ScheduleSlot:
 
     def parse_time(self, time_str: str) -> Optional[datetime]:
         """Parse time string to datetime."""
-        if not time_str:
+        minutes = parse_clock(time_str)
+        if minutes is None:
             return None
-        try:
-            # Handle various formats
-            time_str = time_str.strip().lower()
-            for fmt in ["%I:%M %p", "%H:%M", "%I:%M%p"]:
-                try:
-                    return datetime.strptime(time_str, fmt)
-                except ValueError:
-                    continue
-        except Exception:
-            pass
-        return None
+        return datetime(1900, 1, 1) + timedelta(minutes=minutes)
 
     @property
     def start_datetime(self) -> Optional[datetime]:
@@ -58,22 +49,31 @@ class ScheduleSlot:
     def end_datetime(self) -> Optional[datetime]:
         return self.parse_time(self.end_time)
 
+    @property
+    def start_minutes(self) -> Optional[int]:
+        return parse_clock(self.start_time)
+
+    @property
+    def end_minutes(self) -> Optional[int]:
+        return parse_clock(self.end_time)
+
+    @property
+    def day_mask(self) -> int:
+        return meeting_time.day_mask(self.days)
+
     def overlaps_day(self, other: "ScheduleSlot") -> bool:
         """Check if two slots share any day."""
-        days1 = set(self.days) if self.days else set()
-        days2 = set(other.days) if other.days else set()
-        return bool(days1 & days2)
+        return bool(self.day_mask & other.day_mask)
 
     def minutes_between(self, other: "ScheduleSlot") -> Optional[int]:
         """Get minutes between end of this class and start of other."""
-        end = self.end_datetime
-        start = other.start_datetime
+        end = self.end_minutes
+        start = other.start_minutes
 
-        if not end or not start:
+        if end is None or start is None:
             return None
 
-        diff = start - end
-        return int(diff.total_seconds() / 60)
+        return start - end
 
 
 @dataclass
@@ -87,6 +87,7 @@ class WalkingConflict:
     day: str
     severity: str  # "warning", "critical"
     message: str
+    transit: Optional[dict] = None  # Faster walk + bus itinerary, if any
 
 
 @dataclass
@@ -108,30 +109,8 @@ class ScheduleAnalyzer:
     MIN_GAP_DEFAULT = 10
 
     def __init__(self, campus_graph: Optional[CampusGraph] = None):
-        if campus_graph:
-            self.graph = campus_graph
-        else:
-            # Load from saved data or build empty
-            self.graph = self._load_or_build_graph()
-
-    def _load_or_build_graph(self) -> CampusGraph:
-        """Load campus graph from saved data or build new one."""
-        data_path = Path(__file__).parent.parent.parent / "data" / "campus_buildings.json"
-        if data_path.exists():
-            with open(data_path) as f:
-                buildings_data = json.load(f)
-            return build_campus_graph_from_schedule(buildings_data)
-        else:
-            # Return empty graph with known coordinates
-            graph = CampusGraph()
-            for name, (lat, lon) in ATHENS_BUILDING_COORDS.items():
-                building = Building(
-                    id=name.lower().replace(" ", "_"),
-                    name=name,
-                    location=GeoLocation(lat, lon)
-                )
-                graph.add_building(building)
-            return graph
+        # Shared snapshot-backed graph unless one is supplied
+        self.graph = campus_graph or get_campus_graph()
 
     def analyze_schedule(self, slots: list[ScheduleSlot]) -> dict:
         """
@@ -142,66 +121,59 @@ class ScheduleAnalyzer:
         - daily_routes: dict of day -> DailyRoute
         - summary: overall statistics
         """
-        conflicts = []
-        daily_routes = {}
-
-        # Group by day
-        days = ["M", "T", "W", "R", "F"]
-        for day in days:
-            day_classes = [s for s in slots if s.days and day in s.days]
-            if not day_classes:
-                continue
+        # One sorted pass over every (day, start, end) meeting finds both
+        # overlaps and transitions shorter than the walk
+        intervals = sorted(i for slot in slots for i in meeting_intervals(slot, slot))
+        found = sweep(intervals, self.graph.walking_time)
 
-            # Sort by start time
-            day_classes.sort(key=lambda s: s.start_datetime or datetime.min)
+        conflicts = []
+        by_day: dict[int, list[WalkingConflict]] = {}
+        for c in found:
+            curr, next_class = c.first.key, c.second.key
+            walk_time = (
+                c.walk_minutes
+                or self.graph.walking_time(curr.building, next_class.building)
+                or 0
+            )
+            gap = c.gap_minutes
+            conflict = WalkingConflict(
+                from_class=curr,
+                to_class=next_class,
+                gap_minutes=gap,
+                walk_minutes=walk_time,
+                distance_meters=(
+                    self.graph.walking_distance(curr.building, next_class.building) or 0
+                ),
+                day=c.day,
+                severity="critical" if c.kind == "overlap" or gap < walk_time - 5 else "warning",
+                message=self._format_conflict_message(curr, next_class, gap, walk_time)
+            )
+            if c.kind == "travel":
+                trip = self.graph.plan_trip(curr.building, next_class.building, c.first.end, c.day)
+                if trip and trip.mode == "transit" and trip.total_minutes < walk_time:
+                    conflict.transit = trip.to_dict()
+            by_day.setdefault(c.first.day, []).append(conflict)
+            conflicts.append(conflict)
 
-            # Check consecutive pairs
-            day_conflicts = []
+        daily_routes = {}
+        for day, group in groupby(intervals, key=lambda i: i.day):
+            day_intervals = list(group)
             total_walk = 0
             total_dist = 0.0
-
-            for i in range(len(day_classes) - 1):
-                curr = day_classes[i]
-                next_class = day_classes[i + 1]
-
-                gap = curr.minutes_between(next_class)
-                if gap is None:
-                    continue
-
-                # Get walking time
+            for curr, next_class in zip(day_intervals, day_intervals[1:]):
                 walk_time = self.graph.walking_time(curr.building, next_class.building)
-
                 if walk_time:
-                    # Get distance too
-                    b1 = self.graph.get_building(curr.building)
-                    b2 = self.graph.get_building(next_class.building)
-                    dist = b1.location.distance_to(b2.location) if (b1 and b2 and b1.location and b2.location) else 0
-
                     total_walk += walk_time
-                    total_dist += dist
-
-                    # Check if it's a problem
-                    if gap < walk_time:
-                        severity = "critical" if gap < walk_time - 5 else "warning"
-                        conflict = WalkingConflict(
-                            from_class=curr,
-                            to_class=next_class,
-                            gap_minutes=gap,
-                            walk_minutes=walk_time,
-                            distance_meters=dist,
-                            day=day,
-                            severity=severity,
-                            message=self._format_conflict_message(curr, next_class, gap, walk_time)
-                        )
-                        day_conflicts.append(conflict)
-                        conflicts.append(conflict)
+                    distance = self.graph.walking_distance(curr.building, next_class.building)
+                    total_dist += distance or 0
 
-            daily_routes[day] = DailyRoute(
-                day=day,
-                classes=day_classes,
+            letter = day_intervals[0].day_letter
+            daily_routes[letter] = DailyRoute(
+                day=letter,
+                classes=[i.key for i in day_intervals],
                 total_walking_minutes=total_walk,
                 total_distance_meters=total_dist,
-                conflicts=day_conflicts
+                conflicts=by_day.get(day, [])
             )
 
         # Build summary
@@ -284,14 +256,19 @@ class ScheduleAnalyzer:
 
             # Check if this section starts later
             alt_start = section.get("start_time")
-            if alt_start:
-                # Simple comparison - would need proper parsing for accuracy
-                if alt_start > conflict.to_class.start_time:
-                    suggestions.append({
-                        "section": section,
-                        "reason": f"Later start time ({alt_start}) gives more travel time",
-                        "new_gap": "varies"
-                    })
+            alt_minutes = parse_clock(alt_start)
+            current_minutes = conflict.to_class.start_minutes
+            if (
+                alt_minutes is not None
+                and current_minutes is not None
+                and alt_minutes > current_minutes
+            ):
+                # Gap grows by however much later the alternative starts
+                suggestions.append({
+                    "section": section,
+                    "reason": f"Later start time ({alt_start}) gives more travel time",
+                    "new_gap": conflict.gap_minutes + (alt_minutes - current_minutes),
+                })
 
         return suggestions
 
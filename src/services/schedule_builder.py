@@ -0,0 +1,729 @@
+"""
+Conflict-free schedule builder.
+
+Given the courses a student wants, finds the best combinations of one
+section per course that do not overlap.
+
+- Each section's weekly meetings are encoded as a bitmask of 5-minute
+  slots across the week, so an overlap test is a single AND
+- Sections with identical meetings and buildings are merged (the others
+  become alternates), shrinking the search without losing schedules
+- Depth-first search picks the course with the fewest remaining options
+  next and, after every choice, filters the other courses' options
+  (forward checking), backtracking as soon as a course has none left
+- Schedules are ranked by preference cost; branch-and-bound bounds each
+  choice before trying it, tries the cheapest first, and prunes any
+  partial schedule whose bound reaches the current K-th best
+- The search is a generator, so callers can stream each schedule as it
+  enters the top K
+
+Cost (lower is better) combines minutes outside the preferred hours, days
+on campus, total daily span (first start to last end), and walking time
+between consecutive classes. All four only grow as sections are added
+(walking only while every meeting has a known building), which is what
+makes the pruning safe.
+"""
+import heapq
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Generator, Iterable, Optional
+
+from src.models.campus_graph import CampusGraph, StudentScheduleLocation
+from src.models.meeting_time import (
+    DAY_LETTERS, day_indexes, days_from_mask, format_clock
+)
+
+logger = logging.getLogger(__name__)
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# Search budget: partial schedules explored before returning the best so far
+DEFAULT_MAX_NODES = 20_000
+
+
+def week_mask(days: int, start: int, end: int) -> int:
+    """Bitmask of the 5-minute slots a meeting occupies across the week."""
+    first = start // SLOT_MINUTES
+    last = -(-end // SLOT_MINUTES)  # ceil: a 9:50 end frees the 9:50 slot
+    run = ((1 << (last - first)) - 1) << first
+    mask = 0
+    for day in day_indexes(days):
+        mask |= run << (day * SLOTS_PER_DAY)
+    return mask
+
+
+@dataclass(frozen=True)
+class Meeting:
+    """One weekly meeting pattern of a section."""
+    days: int  # day bitmask
+    start: int  # minutes since midnight
+    end: int
+    building: Optional[str] = None
+
+
+@dataclass
+class SectionOption:
+    """A choosable section (plus alternates with identical meetings)."""
+    course_code: str
+    crn: str
+    meetings: tuple[Meeting, ...]
+    mask: int
+    instructor: Optional[str] = None
+    seats_available: int = 0
+    alternates: list[str] = field(default_factory=list)
+
+    @property
+    def days(self) -> int:
+        mask = 0
+        for meeting in self.meetings:
+            mask |= meeting.days
+        return mask
+
+    def to_dict(self) -> dict:
+        return {
+            "course_code": self.course_code,
+            "crn": self.crn,
+            "alternates": self.alternates,
+            "instructor": self.instructor,
+            "seats_available": self.seats_available,
+            "meetings": [
+                {
+                    "days": days_from_mask(m.days),
+                    "start_time": format_clock(m.start),
+                    "end_time": format_clock(m.end),
+                    "building": m.building,
+                }
+                for m in self.meetings
+            ],
+        }
+
+
+@dataclass
+class BuilderPreferences:
+    """Hard constraints and ranking weights for schedule generation."""
+    # Hard constraints
+    open_only: bool = False
+    exclude_crns: frozenset[str] = frozenset()
+    days_off: int = 0  # day bitmask with no classes allowed
+    not_before: Optional[int] = None  # minutes since midnight
+    not_after: Optional[int] = None
+    allow_tight_transitions: bool = False  # walk longer than the gap
+
+    # Soft preferences
+    preferred_start: Optional[int] = 9 * 60  # "no early mornings"
+    preferred_end: Optional[int] = None
+    time_weight: float = 1.0  # per minute outside preferred hours
+    day_weight: float = 60.0  # per day on campus
+    span_weight: float = 0.25  # per minute of daily span
+    walk_weight: float = 1.0  # per minute walking
+    tight_weight: float = 0.0  # per tight transition, when they are allowed
+
+
+@dataclass
+class GeneratedSchedule:
+    """One conflict-free combination of sections."""
+    rank: int
+    score: float
+    sections: list[SectionOption]
+    days_on_campus: int
+    outside_preferred_minutes: int
+    span_minutes: int
+    idle_minutes: int
+    walking_minutes: int
+    tight_transitions: int = 0
+    id: int = 0  # Order in which the search found it
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "rank": self.rank,
+            "score": round(self.score, 2),
+            "days_on_campus": self.days_on_campus,
+            "outside_preferred_minutes": self.outside_preferred_minutes,
+            "span_minutes": self.span_minutes,
+            "idle_minutes": self.idle_minutes,
+            "walking_minutes": self.walking_minutes,
+            "tight_transitions": self.tight_transitions,
+            "sections": [s.to_dict() for s in self.sections],
+        }
+
+
+@dataclass
+class BuildResult:
+    """Ranked schedules plus search statistics."""
+    schedules: list[GeneratedSchedule]
+    nodes_explored: int
+    complete: bool  # False if the search budget ran out
+    unschedulable: list[str] = field(default_factory=list)  # Courses with no usable sections
+
+
+def section_options(course_code: str, sections: Iterable) -> list[SectionOption]:
+    """
+    Build options for a course from section rows.
+
+    Accepts Section models, CourseSection dataclasses or campus graph
+    StudentScheduleLocations (all carry start_minutes, end_minutes and
+    day_mask). Rows sharing a CRN are
+    meetings of one section. Sections without parseable times
+    (TBA, online) get an empty mask and never conflict.
+    """
+    by_crn: dict[str, dict] = {}
+    for section in sections:
+        if getattr(section, "status", "A") == "X":
+            continue
+        entry = by_crn.setdefault(section.crn, {
+            "instructor": getattr(section, "instructor", None),
+            "seats_available": getattr(section, "seats_available", 0),
+            "meetings": [],
+        })
+        start, end, days = section.start_minutes, section.end_minutes, section.day_mask
+        if start is not None and days:
+            entry["meetings"].append(Meeting(days, start, end, section.building or None))
+
+    options = []
+    for crn, entry in by_crn.items():
+        meetings = tuple(sorted(set(entry["meetings"]), key=lambda m: (m.start, m.days)))
+        mask = 0
+        for m in meetings:
+            mask |= week_mask(m.days, m.start, m.end)
+        options.append(SectionOption(
+            course_code=course_code,
+            crn=crn,
+            meetings=meetings,
+            mask=mask,
+            instructor=entry["instructor"],
+            seats_available=entry["seats_available"],
+        ))
+    return options
+
+
+class ScheduleBuilder:
+    """Generates ranked conflict-free schedules."""
+
+    def __init__(self, campus_graph: Optional[CampusGraph] = None):
+        self.graph = campus_graph
+        self._walk_cache: dict[tuple[str, str], int] = {}
+        self._known_cache: dict[str, bool] = {}
+
+    def _walk(self, a: Optional[str], b: Optional[str]) -> int:
+        """Walking minutes between buildings; 0 if the same or unknown."""
+        if not a or not b or a == b or self.graph is None:
+            return 0
+        key = (a, b)
+        minutes = self._walk_cache.get(key)
+        if minutes is None:
+            minutes = self.graph.walking_time(a, b) or 0
+            self._walk_cache[key] = self._walk_cache[(b, a)] = minutes
+        return minutes
+
+    def _known(self, building: Optional[str]) -> bool:
+        """Whether walking times to a building are known (not treated as 0)."""
+        if not building or self.graph is None:
+            return False
+        known = self._known_cache.get(building)
+        if known is None:
+            known = self._known_cache[building] = (
+                self.graph.walking_time(building, building) is not None
+            )
+        return known
+
+    def build(
+        self,
+        options_by_course: dict[str, list[SectionOption]],
+        preferences: Optional[BuilderPreferences] = None,
+        top_k: int = 10,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> BuildResult:
+        """
+        Find the top_k lowest-cost conflict-free schedules.
+
+        Args:
+            options_by_course: course code -> candidate sections
+            preferences: Constraints and weights (defaults if omitted)
+            top_k: Number of schedules to return
+            max_nodes: Search budget; the best schedules found so far are
+                returned with complete=False if it runs out
+        """
+        search = self.iter_build(options_by_course, preferences, top_k, max_nodes)
+        while True:
+            try:
+                next(search)
+            except StopIteration as done:
+                return done.value
+
+    def iter_build(
+        self,
+        options_by_course: dict[str, list[SectionOption]],
+        preferences: Optional[BuilderPreferences] = None,
+        top_k: int = 10,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> Generator[GeneratedSchedule, None, BuildResult]:
+        """
+        Search like build(), yielding each schedule as it enters the top_k.
+
+        Yielded schedules are ranked among those found so far and may be
+        pushed out by later ones; the generator's return value is the final
+        BuildResult.
+        """
+        prefs = preferences or BuilderPreferences()
+        domains, unschedulable = self._prepare_domains(options_by_course, prefs)
+        if unschedulable or not domains:
+            return BuildResult(
+                schedules=[], nodes_explored=0, complete=True, unschedulable=unschedulable
+            )
+
+        # Per-option constants, keyed by id(): meetings expanded to
+        # (day, start, end, building), the same grouped by day as
+        # (day, first start, last end, meetings), day mask, minutes outside
+        # preferred hours, and busy minutes
+        slots, slots_by_day, days_of, time_cost, busy_cost = {}, {}, {}, {}, {}
+        for options in domains.values():
+            for o in options:
+                key = id(o)
+                slots[key] = sorted(
+                    (day, m.start, m.end, m.building)
+                    for m in o.meetings for day in day_indexes(m.days)
+                )
+                grouped: dict[int, list] = {}
+                for day, start, end, building in slots[key]:
+                    grouped.setdefault(day, []).append((start, end, building))
+                slots_by_day[key] = [
+                    (day, meetings[0][0], max(end for _, end, _ in meetings), meetings)
+                    for day, meetings in grouped.items()
+                ]
+                days_of[key] = o.days
+                time_cost[key] = self._time_cost(o, prefs)
+                busy_cost[key] = sum(end - start for _, start, end, _ in slots[key])
+
+        # Walking only grows as meetings are added when every meeting is in
+        # a building with known walking times (a meeting with no building
+        # breaks the walk between its neighbours)
+        walk_grows = all(
+            self._known(m.building)
+            for options in domains.values() for o in options for m in o.meetings
+        )
+
+        walk_between = self._walk
+        tw, dw, sw, ww = prefs.time_weight, prefs.day_weight, prefs.span_weight, prefs.walk_weight
+        kw = prefs.tight_weight
+        allow_tight = prefs.allow_tight_transitions
+
+        # Per-day meetings placed so far, sorted by start: (start, end, building)
+        day_lists: list[list[tuple[int, int, Optional[str]]]] = [[] for _ in DAY_LETTERS]
+        best: list[tuple[float, int, list[SectionOption], tuple]] = []  # max-heap via -cost
+        counter = 0
+        nodes = 0
+        chosen: list[SectionOption] = []
+
+        def place(option: SectionOption) -> Optional[tuple[int, int, int, list]]:
+            """
+            Add an option's meetings.
+
+            Returns (span delta, walk delta, tight delta, undo), or None if a
+            transition is tight and tight transitions are not allowed.
+            """
+            span_delta = walk_delta = tight_delta = 0
+            inserted = []
+            for day, start, end, building in slots[id(option)]:
+                meetings = day_lists[day]
+                entry = (start, end, building)
+                i = bisect_left(meetings, entry)
+                if meetings:
+                    span_delta += max(end - meetings[-1][1], 0) + max(meetings[0][0] - start, 0)
+                    if 0 < i < len(meetings):
+                        prev, nxt = meetings[i - 1], meetings[i]
+                        walk = walk_between(prev[2], nxt[2])
+                        walk_delta -= walk
+                        tight_delta -= walk > nxt[0] - prev[1]
+                    if i > 0:
+                        prev = meetings[i - 1]
+                        walk = walk_between(prev[2], building)
+                        walk_delta += walk
+                        if walk > start - prev[1]:
+                            if not allow_tight:
+                                unplace(inserted)
+                                return None
+                            tight_delta += 1
+                    if i < len(meetings):
+                        nxt = meetings[i]
+                        walk = walk_between(building, nxt[2])
+                        walk_delta += walk
+                        if walk > nxt[0] - end:
+                            if not allow_tight:
+                                unplace(inserted)
+                                return None
+                            tight_delta += 1
+                else:
+                    span_delta += end - start
+                meetings.insert(i, entry)
+                inserted.append((day, i))
+            return span_delta, walk_delta, tight_delta, inserted
+
+        def unplace(inserted: list) -> None:
+            for day, i in reversed(inserted):
+                del day_lists[day][i]
+
+        def extension(option: SectionOption) -> float:
+            """
+            Span and walking cost an option adds to what is placed.
+
+            A day's span covers every meeting on it, and by the triangle
+            inequality the walk through a day's buildings is at least the
+            walk through any subset of them, so the final schedule costs at
+            least this much more however the other courses are filled in.
+            """
+            cost = 0.0
+            for day, first, last, meetings in slots_by_day[id(option)]:
+                placed = day_lists[day]
+                if not placed:
+                    cost += sw * (last - first)
+                    continue
+                start, end = placed[0][0], placed[-1][1]
+                cost += sw * (max(end, last) - min(start, first) - (end - start))
+                if not walk_grows:
+                    continue
+                detour = 0
+                for entry in meetings:
+                    i = bisect_left(placed, entry)
+                    prev = placed[i - 1][2] if i > 0 else None
+                    nxt = placed[i][2] if i < len(placed) else None
+                    detour = max(
+                        detour,
+                        walk_between(prev, entry[2]) + walk_between(entry[2], nxt)
+                        - walk_between(prev, nxt),
+                    )
+                cost += ww * detour
+            return cost
+
+        def course_minimums(opts: list[SectionOption]) -> tuple[int, int, set[int]]:
+            """Fewest minutes outside preferred hours and busy minutes, and day patterns."""
+            least_time = least_busy = None
+            patterns = set()
+            for o in opts:
+                key = id(o)
+                t, b = time_cost[key], busy_cost[key]
+                if least_time is None or t < least_time:
+                    least_time = t
+                if least_busy is None or b < least_busy:
+                    least_busy = b
+                patterns.add(days_of[key])
+            return least_time, least_busy, patterns
+
+        def combine(
+            minimums: Iterable[tuple[int, int, set[int]]],
+            days_used: int,
+        ) -> tuple[int, int, set[int]]:
+            """Sum course minimums; reachable day masks choosing one pattern each."""
+            min_time = min_busy = 0
+            reachable = {days_used}
+            for least_time, least_busy, patterns in minimums:
+                min_time += least_time
+                min_busy += least_busy
+                if len(patterns) == 1:
+                    (pattern,) = patterns
+                    reachable = {r | pattern for r in reachable}
+                else:
+                    reachable = {r | p for r in reachable for p in patterns}
+            return min_time, min_busy, reachable
+
+        def lower_bound(
+            minimums: Iterable[tuple[int, int, set[int]]],
+            days_used: int,
+            outside: int,
+            span: int,
+            busy: int,
+            walk: int,
+            tight: int,
+        ) -> float:
+            """
+            Cost no completion of this partial schedule can beat.
+
+            Time cost and busy minutes add up across courses, daily span is
+            at least the busy time, days on campus are the fewest any choice
+            of remaining day patterns reaches, and walking and tight
+            transitions only grow (splitting a tight pair leaves a tight
+            pair, by the triangle inequality).
+            """
+            min_time, min_busy, reachable = combine(minimums, days_used)
+            min_days = min(bin(r).count("1") for r in reachable)
+            return (
+                tw * (outside + min_time)
+                + dw * min_days
+                + sw * max(span, busy + min_busy)
+                + ((ww * walk + kw * tight) if walk_grows else 0)
+            )
+
+        def make_schedule(entry: tuple, rank: int) -> GeneratedSchedule:
+            neg_cost, found, sections, totals = entry
+            days_used, outside, span, walk, tight = totals
+            busy = sum(busy_cost[id(s)] for s in sections)
+            return GeneratedSchedule(
+                rank=rank,
+                score=-neg_cost,
+                sections=sorted(sections, key=lambda s: s.course_code),
+                days_on_campus=bin(days_used).count("1"),
+                outside_preferred_minutes=outside,
+                span_minutes=span,
+                idle_minutes=span - busy,
+                walking_minutes=walk,
+                tight_transitions=tight,
+                id=found,
+            )
+
+        def search(
+            remaining: dict[str, list[SectionOption]],
+            used: int,
+            days_used: int,
+            outside: int,
+            span: int,
+            busy: int,
+            walk: int,
+            tight: int,
+        ) -> Generator[GeneratedSchedule, None, None]:
+            nonlocal counter, nodes
+            nodes += 1
+            if nodes > max_nodes:
+                return
+
+            if not remaining:
+                cost = (
+                    tw * outside + dw * bin(days_used).count("1")
+                    + sw * span + ww * walk + kw * tight
+                )
+                if len(best) >= top_k and cost >= -best[0][0]:
+                    return
+                counter += 1
+                entry = (-cost, counter, list(chosen), (days_used, outside, span, walk, tight))
+                if len(best) < top_k:
+                    heapq.heappush(best, entry)
+                else:
+                    heapq.heapreplace(best, entry)
+                rank = 1 + sum(1 for other in best if -other[0] < cost)
+                yield make_schedule(entry, rank)
+                return
+
+            minimums = {c: course_minimums(opts) for c, opts in remaining.items()}
+            if len(best) >= top_k:
+                bound = lower_bound(
+                    minimums.values(), days_used, outside, span, busy, walk, tight
+                )
+                if bound >= -best[0][0]:
+                    return
+
+            # Most constrained course next. Each of its options is bounded
+            # as lower_bound would after placing it (with the other courses
+            # not yet filtered) and tried cheapest first, so good schedules
+            # are found early; the first option that cannot beat the K-th
+            # best ends the loop, as the rest are no cheaper
+            course = min(remaining, key=lambda c: len(remaining[c]))
+            rest = [(c, opts) for c, opts in remaining.items() if c != course]
+            rest_time, rest_busy, reachable = combine(
+                (minimums[c] for c, _ in rest), days_used
+            )
+            min_days: dict[int, int] = {}
+            placed_cost = (ww * walk + kw * tight) if walk_grows else 0
+            limit = -best[0][0] if len(best) >= top_k else float("inf")
+
+            bounds = {}
+            for option in remaining[course]:
+                key = id(option)
+                days = days_of[key]
+                if days not in min_days:
+                    min_days[days] = min(bin(r | days).count("1") for r in reachable)
+                base = (
+                    tw * (outside + time_cost[key] + rest_time)
+                    + dw * min_days[days]
+                    + placed_cost
+                )
+                bound = base + sw * max(span, busy + busy_cost[key] + rest_busy)
+                if bound < limit:
+                    bound = max(bound, base + sw * span + extension(option))
+                bounds[key] = bound
+            ordered = sorted(remaining[course], key=lambda o: bounds[id(o)])
+
+            for option in ordered:
+                if nodes > max_nodes:
+                    return
+                if len(best) >= top_k and bounds[id(option)] >= -best[0][0]:
+                    return
+
+                # Forward checking: drop options that now overlap, and skip
+                # this choice if any course is left with none
+                combined = used | option.mask
+                filtered = {}
+                for other, opts in rest:
+                    compatible = [o for o in opts if not o.mask & combined]
+                    if not compatible:
+                        break
+                    filtered[other] = compatible
+                else:
+                    placed = place(option)
+                    if placed is None:
+                        continue
+                    span_delta, walk_delta, tight_delta, inserted = placed
+                    key = id(option)
+                    chosen.append(option)
+                    yield from search(
+                        filtered,
+                        combined,
+                        days_used | days_of[key],
+                        outside + time_cost[key],
+                        span + span_delta,
+                        busy + busy_cost[key],
+                        walk + walk_delta,
+                        tight + tight_delta,
+                    )
+                    chosen.pop()
+                    unplace(inserted)
+
+        yield from search(domains, 0, 0, 0, 0, 0, 0, 0)
+
+        ranked = sorted(best, key=lambda e: (-e[0], e[1]))
+        schedules = [make_schedule(entry, rank) for rank, entry in enumerate(ranked, 1)]
+
+        complete = nodes <= max_nodes
+        logger.info(
+            f"Built {len(schedules)} schedules for {len(domains)} courses "
+            f"({nodes} nodes{'' if complete else ', budget exhausted'})"
+        )
+        return BuildResult(schedules=schedules, nodes_explored=nodes, complete=complete)
+
+    def _prepare_domains(
+        self,
+        options_by_course: dict[str, list[SectionOption]],
+        prefs: BuilderPreferences,
+    ) -> tuple[dict[str, list[SectionOption]], list[str]]:
+        """Apply hard constraints and merge interchangeable sections."""
+        domains: dict[str, list[SectionOption]] = {}
+        unschedulable = []
+        for course, options in options_by_course.items():
+            merged: dict[tuple, SectionOption] = {}
+            for option in options:
+                if option.crn in prefs.exclude_crns:
+                    continue
+                if prefs.open_only and option.seats_available <= 0:
+                    continue
+                if any(
+                    m.days & prefs.days_off
+                    or (prefs.not_before is not None and m.start < prefs.not_before)
+                    or (prefs.not_after is not None and m.end > prefs.not_after)
+                    for m in option.meetings
+                ):
+                    continue
+
+                key = option.meetings
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = SectionOption(
+                        course_code=option.course_code,
+                        crn=option.crn,
+                        meetings=option.meetings,
+                        mask=option.mask,
+                        instructor=option.instructor,
+                        seats_available=option.seats_available,
+                    )
+                else:
+                    existing.alternates.append(option.crn)
+
+            if merged:
+                domains[course] = list(merged.values())
+            else:
+                unschedulable.append(course)
+        return domains, unschedulable
+
+    def _time_cost(self, option: SectionOption, prefs: BuilderPreferences) -> int:
+        """Minutes of meetings outside the preferred hours, summed over days."""
+        minutes = 0
+        for m in option.meetings:
+            outside = 0
+            if prefs.preferred_start is not None and m.start < prefs.preferred_start:
+                outside += min(m.end, prefs.preferred_start) - m.start
+            if prefs.preferred_end is not None and m.end > prefs.preferred_end:
+                outside += m.end - max(m.start, prefs.preferred_end)
+            minutes += outside * len(day_indexes(m.days))
+        return minutes
+
+
+def load_course_options(
+    service,
+    course_codes: list[str],
+    term: Optional[str] = None,
+) -> tuple[dict[str, list[SectionOption]], list[str]]:
+    """
+    Load section options for courses from the current schedule.
+
+    Returns (options by course code, course codes not found).
+    """
+    schedule = service.get_current_schedule(term)
+    schedule_id = schedule.id if schedule else None
+
+    options_by_course: dict[str, list[SectionOption]] = {}
+    missing = []
+    for code in course_codes:
+        course = service.get_course_by_code(code, schedule_id=schedule_id)
+        if course is None:
+            missing.append(code)
+            continue
+        options_by_course[course.course_code] = section_options(course.course_code, course.sections)
+    return options_by_course, missing
+
+
+def optimize_walking(
+    graph: CampusGraph,
+    locations: list[StudentScheduleLocation],
+    tight_penalty: float = 30.0,
+) -> list[StudentScheduleLocation]:
+    """
+    Choose sections that minimize weekly walking.
+
+    locations holds candidate sections for each course (rows sharing a
+    course_code are alternatives; rows sharing a CRN are meetings of one
+    section). Picks one time-compatible section per course minimizing
+    total weekly walking minutes plus tight_penalty per back-to-back
+    transition shorter than the walk. Returns the chosen locations
+    ordered by day and time, or the input unchanged if no combination
+    fits.
+    """
+    by_course: dict[str, list[StudentScheduleLocation]] = {}
+    for loc in locations:
+        by_course.setdefault(loc.course_code, []).append(loc)
+    options = {code: section_options(code, rows) for code, rows in by_course.items()}
+
+    preferences = BuilderPreferences(
+        allow_tight_transitions=True,
+        preferred_start=None,
+        time_weight=0.0,
+        day_weight=0.0,
+        span_weight=0.0,
+        walk_weight=1.0,
+        tight_weight=tight_penalty,
+    )
+    result = ScheduleBuilder(graph).build(options, preferences, top_k=1)
+    if not result.schedules:
+        return locations
+
+    chosen = {(s.course_code, s.crn) for s in result.schedules[0].sections}
+    selected = [loc for loc in locations if (loc.course_code, loc.crn) in chosen]
+    return sorted(selected, key=lambda loc: (
+        _first_day(loc.day_mask),
+        loc.start_minutes if loc.start_minutes is not None else 24 * 60,
+    ))
+
+
+def _first_day(mask: int) -> int:
+    """Index of the earliest day in a day bitmask (7 if none)."""
+    return (mask & -mask).bit_length() - 1 if mask else 7
+
+
+_builder: Optional[ScheduleBuilder] = None
+
+
+def get_schedule_builder() -> ScheduleBuilder:
+    """Get the shared builder, using the shared campus graph."""
+    global _builder
+    if _builder is None:
+        from src.services.campus_graph_store import get_campus_graph
+        _builder = ScheduleBuilder(get_campus_graph())
+    return _builder
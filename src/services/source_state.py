@@ -0,0 +1,125 @@
+"""
+Conditional-request state for polled source files.
+
+Keeps the ETag, Last-Modified and content hash last seen for each URL so
+pollers can send If-None-Match / If-Modified-Since and skip unchanged
+files. State lives in the source_states table and is read from it on every
+check, so worker processes never act on each other's stale validators; if
+the database is unreachable the store keeps working from memory alone.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+
+from src.models.database import SourceState, get_session_factory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceValidators:
+    """What we know about the last version of a source file."""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    content_length: Optional[int] = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that turn a GET into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SourceStateStore:
+    """Per-URL validators, persisted to the database when available."""
+
+    def __init__(self, session_factory=None, persist: bool = True):
+        self._session_factory = session_factory
+        self.persist = persist
+        self._memory: dict[str, SourceValidators] = {}
+
+    def _sessions(self):
+        if self._session_factory is None:
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    def get(self, url: str) -> Optional[SourceValidators]:
+        """Return the validators last recorded for a URL, if any."""
+        if not self.persist:
+            return self._memory.get(url)
+
+        # Another process may have recorded a newer version, so always ask the database
+        try:
+            with self._sessions()() as session:
+                row = session.execute(
+                    select(SourceState).where(SourceState.url == url)
+                ).scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Could not load source state for {url}: {e}")
+            return self._memory.get(url)
+
+        if row is None or not row.content_hash:
+            return None
+        validators = SourceValidators(
+            url=url,
+            etag=row.etag,
+            last_modified=row.last_modified,
+            content_hash=row.content_hash,
+            content_length=row.content_length,
+        )
+        self._memory[url] = validators
+        return validators
+
+    def record(
+        self,
+        validators: SourceValidators,
+        changed: bool,
+        name: Optional[str] = None,
+    ) -> None:
+        """Record a completed check. changed=False for a 304 or an identical body."""
+        self._memory[validators.url] = validators
+        if not self.persist:
+            return
+
+        now = datetime.utcnow()
+        try:
+            with self._sessions()() as session:
+                row = session.execute(
+                    select(SourceState).where(SourceState.url == validators.url)
+                ).scalar_one_or_none()
+                if row is None:
+                    row = SourceState(url=validators.url, check_count=0, change_count=0)
+                    session.add(row)
+
+                row.name = name or row.name
+                row.etag = validators.etag
+                row.last_modified = validators.last_modified
+                row.content_hash = validators.content_hash
+                row.content_length = validators.content_length
+                row.last_checked = now
+                row.check_count += 1
+                if changed:
+                    row.last_changed = now
+                    row.change_count += 1
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Could not save source state for {validators.url}: {e}")
+
+
+_store: Optional[SourceStateStore] = None
+
+
+def get_source_state_store() -> SourceStateStore:
+    """Get the process-wide source state store."""
+    global _store
+    if _store is None:
+        _store = SourceStateStore()
+    return _store
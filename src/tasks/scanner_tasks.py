@@ -73,6 +73,8 @@ def scan_term_task(self, term: str, max_pages: Optional[int] = None) -> dict:
         except Exception as e:
             logger.error(f"Scan failed for {term}: {e}")
             raise
+        finally:
+            await scanner.aclose()
 
     try:
         # Run the async scan in a new event loop
@@ -115,14 +117,15 @@ def update_seat_availability_task(self, term: str) -> dict:
     logger.info(f"Starting seat availability update {task_id} for term: {term}")
 
     async def run_update():
-        scanner = UGAScheduleScanner(headless=True)
-        return await scanner.update_seat_availability(term)
+        async with UGAScheduleScanner(headless=True) as scanner:
+            return await scanner.update_seat_availability(term, if_changed=True)
 
     try:
         availability = asyncio.run(run_update())
         result = {
             "success": True,
             "term": term,
+            "changed": bool(availability),
             "sections_updated": len(availability),
         }
         logger.info(f"Completed availability update {task_id}: {result}")
@@ -139,29 +142,59 @@ def update_seat_availability_task(self, term: str) -> dict:
             }
 
 
-@celery_app.task
+@celery_app.task(
+    soft_time_limit=600,  # 10 min soft limit
+    time_limit=660,  # 11 min hard limit
+)
 def update_all_seat_availability() -> dict:
     """
-    Periodic task to update seat availability for all active terms.
+    Periodic task to update seat availability for active terms that are due.
 
-    Triggered by Celery beat scheduler.
+    Triggered by Celery beat at the minimum polling interval. Active terms
+    are those with a current schedule in the database; the adaptive poll
+    scheduler decides which of them are due, and those are fetched
+    concurrently over one HTTP client and parsed in parallel.
     """
-    # Active terms to update
-    active_terms = [
-        "Spring 2026",
-        "Summer 2026",
-        "Fall 2026",
-    ]
-
-    results = []
-    for term in active_terms:
-        # Chain the tasks to run sequentially
-        result = update_seat_availability_task.delay(term)
-        results.append({"term": term, "task_id": result.id})
+    from src.services.course_service import create_service
+    from src.services.poll_scheduler import create_poll_scheduler
+
+    sources = {
+        term: UGAScheduleScanner.CSV_URLS[term]
+        for term in create_service().get_active_terms()
+        if term in UGAScheduleScanner.CSV_URLS
+    }
+    if not sources:
+        logger.info("No active terms with a CSV source to update")
+        return {"updated": 0, "terms": []}
+
+    scheduler = create_poll_scheduler()
+    due = {d.term: d for d in scheduler.plan(sources) if d.due}
+    if not due:
+        return {"updated": 0, "terms": []}
+
+    async def run_updates():
+        async with UGAScheduleScanner(headless=True) as scanner:
+            return await scanner.scan_terms(list(due), if_changed=True)
+
+    results = asyncio.run(run_updates())
+    terms = []
+    for result in results:
+        decision = scheduler.record(
+            due[result.term], changed=result.changed, failed=result.error is not None
+        )
+        terms.append({
+            "term": result.term,
+            "success": result.error is None,
+            "changed": result.changed,
+            "sections_updated": result.schedule.metadata.total_sections if result.schedule else 0,
+            "next_poll_seconds": decision.interval,
+            **({"error": result.error} if result.error else {}),
+        })
+    logger.info(f"Updated seat availability for {len(terms)} terms: {terms}")
 
     return {
-        "triggered": len(results),
-        "tasks": results,
+        "updated": sum(1 for t in terms if t["changed"]),
+        "terms": terms,
     }
 
 
@@ -181,33 +214,48 @@ def scan_and_process_term(self, term: str) -> dict:
     # Step 1: Scan the term
     self.update_state(state="SCANNING", meta={"term": term, "step": "scanning"})
 
+    # Own validators, so a seat poll seeing the new CSV first does not hide it
+    scanner = UGAScheduleScanner(headless=True, consumer="import")
+
     async def run_pipeline():
-        scanner = UGAScheduleScanner(headless=True)
-        schedule = await scanner.scan_term(term)
-        return schedule
+        async with scanner:
+            return await scanner.stream_term(term, if_changed=True)
 
     try:
-        schedule = asyncio.run(run_pipeline())
+        streamed = asyncio.run(run_pipeline())
+        if streamed is None:
+            return {
+                "success": True,
+                "term": term,
+                "changed": False,
+                "processed": False,
+            }
+        metadata, courses, download = streamed
 
-        # Step 2: Process through RAG pipeline (embeddings, etc.)
-        # This will be connected to the existing CourseService
+        # Step 2: Stream parsed courses into the database in chunks
         self.update_state(
             state="PROCESSING",
             meta={
                 "term": term,
                 "step": "processing",
-                "courses": schedule.metadata.total_courses,
             }
         )
 
-        # TODO: Call CourseService to process and store the schedule
-        # await course_service.process_schedule(schedule)
+        from src.services.course_service import create_service
+        # The hash makes a CSV that another worker already imported a no-op
+        schedule = create_service().import_course_stream(
+            courses, metadata, source_hash=download.content_hash
+        )
+        # Only now is the CSV consumed; a failed import retries against it
+        scanner.commit_download(download)
 
         return {
             "success": True,
             "term": term,
-            "total_courses": schedule.metadata.total_courses,
-            "total_sections": schedule.metadata.total_sections,
+            "changed": True,
+            "schedule_id": schedule.id,
+            "total_courses": schedule.total_courses,
+            "total_sections": schedule.total_sections,
             "processed": True,
         }
 
@@ -0,0 +1,146 @@
+"""Tests for the prerequisite expression grammar."""
+import itertools
+
+import pytest
+
+from src.services.prerequisite_expression import (
+    AllOf,
+    AnyOf,
+    CourseRequirement,
+    ExpressionTooComplex,
+    parse_prerequisite_expression,
+    to_groups,
+    to_strict_groups,
+)
+
+
+def codes(groups):
+    return [sorted(c.course_code for c in group) for group in groups]
+
+
+def course(code, grade=None, concurrent=False):
+    return CourseRequirement(code, min_grade=grade, concurrent_allowed=concurrent)
+
+
+def test_lecture_lab_pair_binds_tighter_than_or():
+    node = parse_prerequisite_expression("CHEM 1211-1211L or CHEM 1311H-1311L")
+
+    assert node == AnyOf((
+        AllOf((course("CHEM 1211"), course("CHEM 1211L"))),
+        AllOf((course("CHEM 1311H"), course("CHEM 1311L"))),
+    ))
+    assert codes(to_groups(node)) == [
+        ["CHEM 1211", "CHEM 1311H"],
+        ["CHEM 1211", "CHEM 1311L"],
+        ["CHEM 1211L", "CHEM 1311H"],
+        ["CHEM 1211L", "CHEM 1311L"],
+    ]
+
+
+def test_lecture_lab_pair_evaluates_as_and():
+    node = parse_prerequisite_expression("CHEM 1211-1211L or CHEM 1311H-1311L")
+
+    assert node.evaluate({"CHEM 1311H", "CHEM 1311L"})
+    assert not node.evaluate({"CHEM 1211", "CHEM 1311L"})
+
+
+def test_nested_parentheses():
+    node = parse_prerequisite_expression(
+        "(CSCI 1301 or CSCI 1301H) and (MATH 2250 or (MATH 2200 and MATH 2210))"
+    )
+
+    assert node == AllOf((
+        AnyOf((course("CSCI 1301"), course("CSCI 1301H"))),
+        AnyOf((course("MATH 2250"), AllOf((course("MATH 2200"), course("MATH 2210"))))),
+    ))
+    assert node.evaluate({"CSCI 1301H", "MATH 2200", "MATH 2210"})
+    assert not node.evaluate({"CSCI 1301", "MATH 2200"})
+
+
+def test_bare_numbers_inherit_subject():
+    node = parse_prerequisite_expression("CSCI 1301 or 1301H")
+
+    assert node == AnyOf((course("CSCI 1301"), course("CSCI 1301H")))
+
+
+@pytest.mark.parametrize("text, kind", [
+    ("CSCI 1302, CSCI 2610, or CSCI 2611", AnyOf),
+    ("CSCI 1302, CSCI 2610, and CSCI 2611", AllOf),
+])
+def test_comma_list_takes_closing_conjunction(text, kind):
+    node = parse_prerequisite_expression(text)
+
+    assert node == kind((course("CSCI 1302"), course("CSCI 2610"), course("CSCI 2611")))
+
+
+def test_grades_apply_per_course():
+    node = parse_prerequisite_expression(
+        "A grade of B in MATH 2250 and CSCI 1302 with a grade of C or better"
+    )
+
+    assert node == AllOf((course("MATH 2250", "B"), course("CSCI 1302", "C")))
+
+
+def test_trailing_grade_applies_to_whole_expression():
+    node = parse_prerequisite_expression(
+        "(CSCI 1301 or CSCI 1301H) and MATH 2250, with a minimum grade of C"
+    )
+
+    assert {c.min_grade for c in node.courses()} == {"C"}
+
+
+def test_noise_phrases_are_dropped():
+    assert parse_prerequisite_expression("Permission of department") is None
+    node = parse_prerequisite_expression("CSCI 1302 or permission of instructor")
+
+    assert node == course("CSCI 1302")
+
+
+def test_cnf_cap():
+    # Four ANDed pairs ORed together distribute to 2**4 groups
+    node = parse_prerequisite_expression(
+        "(BIOL 1001 and BIOL 1002) or (BIOL 1101 and BIOL 1102) "
+        "or (BIOL 1201 and BIOL 1202) or (BIOL 1301 and BIOL 1302)"
+    )
+
+    assert len(to_groups(node)) == 16
+    assert len(to_groups(node, limit=16)) == 16
+    with pytest.raises(ExpressionTooComplex):
+        to_groups(node, limit=15)
+
+
+def test_strict_groups_over_the_limit_never_loosen_the_rule():
+    node = parse_prerequisite_expression(
+        "CSCI 1302 and ((BIOL 1001 and BIOL 1002) or (BIOL 1101 and BIOL 1102) "
+        "or (BIOL 1201 and BIOL 1202) or (BIOL 1301 and BIOL 1302))"
+    )
+    with pytest.raises(ExpressionTooComplex):
+        to_groups(node, limit=8)
+
+    groups = to_strict_groups(node, limit=8)
+
+    # ANDed courses stay separate groups; the OR keeps only its first alternative
+    assert codes(groups) == [["CSCI 1302"], ["BIOL 1001"], ["BIOL 1002"]]
+    everything = {c.course_code for c in node.courses()}
+    for size in range(len(everything) + 1):
+        for completed in map(set, itertools.combinations(sorted(everything), size)):
+            satisfied = all(any(c.course_code in completed for c in g) for g in groups)
+            assert not satisfied or node.evaluate(completed)
+
+
+@pytest.mark.parametrize("first, second, expected", [
+    ("C", "B", "C"),
+    ("B", "C", "C"),
+    ("C-", None, None),
+    (None, "C-", None),
+])
+def test_duplicate_course_in_or_keeps_lower_grade(first, second, expected):
+    node = AnyOf((
+        AllOf((course("CSCI 1301", first), course("MATH 2250"))),
+        AllOf((course("CSCI 1301", second), course("MATH 2260"))),
+    ))
+
+    grades = {
+        c.min_grade for group in to_groups(node) for c in group if c.course_code == "CSCI 1301"
+    }
+    assert grades == {expected}
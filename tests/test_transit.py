@@ -0,0 +1,45 @@
+"""Tests for walk + bus trip planning."""
+from src.models.campus_graph import Building, BusRoute, BusStop, CampusGraph, GeoLocation
+
+METERS_PER_DEGREE = 111_320
+
+
+def at(meters):
+    """A point the given distance north of a fixed origin."""
+    return GeoLocation(33.9 + meters / METERS_PER_DEGREE, -83.37)
+
+
+def route(route_id, stops, frequency, first, last):
+    return BusRoute(
+        id=route_id,
+        name=route_id,
+        short_name=route_id,
+        stops=stops,
+        frequency_minutes=frequency,
+        first_departure=first,
+        last_departure=last,
+    )
+
+
+def test_transfer_from_stop_also_reached_on_foot():
+    # X is closer on foot than by the one R1 bus, but only arriving by
+    # bus allows the transfer walk to Y for the fast R2 to the destination
+    graph = CampusGraph()
+    graph.add_building(Building(id="O", name="Origin", location=at(0)))
+    graph.add_building(Building(id="D", name="Destination", location=at(5000)))
+    for stop_id, meters in [("S1", 50), ("X", 400), ("Y", 650), ("Z", 4950)]:
+        graph.bus_stops[stop_id] = BusStop(id=stop_id, name=stop_id, location=at(meters))
+    graph.bus_routes["R1"] = route("R1", ["S1", "X"], 60, "10:08 am", "10:08 am")
+    graph.bus_routes["R2"] = route("R2", ["Y", "Z"], 1, "7:00 am", "10:00 pm")
+
+    itinerary = graph.plan_trip("Origin", "Destination", depart=10 * 60, day="M")
+
+    assert itinerary.mode == "transit"
+    assert [(leg.mode, leg.to_place) for leg in itinerary.legs] == [
+        ("walk", "S1"),
+        ("bus", "X"),
+        ("walk", "Y"),
+        ("bus", "Z"),
+        ("walk", "Destination"),
+    ]
+    assert itinerary.total_minutes < graph.walking_time("O", "D")